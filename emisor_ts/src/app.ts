@@ -3,6 +3,7 @@ import { createInterface } from "readline/promises";
 import { stdin as input, stdout as output } from "node:process";
 import hammingCode from "./hamming/hamming";
 import fletcher16_emit from "./fletcher16/fletcher16";
+import packFrame from "./utils/wire";
 
 /* =========================
  * Utilidades de presentación
@@ -140,9 +141,12 @@ async function main() {
     console.log(`\nConectando a ${WS_URL} ...`);
     const ws = new WebSocket(WS_URL);
 
+    // WS_BINARY=1: envía la trama empaquetada (ver utils/wire.ts) en lugar de JSON
+    const useBinary = process.env.WS_BINARY === "1";
+
     ws.on("open", () => {
-      console.log("Conexión establecida. Enviando payload...");
-      ws.send(JSON.stringify(payload));
+      console.log(`Conexión establecida. Enviando payload${useBinary ? " (binario)" : ""}...`);
+      ws.send(useBinary ? packFrame(algorithm, finalBits) : JSON.stringify(payload));
     });
 
     ws.on("message", (data: any) => {
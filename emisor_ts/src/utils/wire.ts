@@ -0,0 +1,60 @@
+/**
+ * Formato binario de tramas (debe coincidir con receptor_py/wire/wire.py).
+ *
+ * Cabecera de 8 bytes big-endian seguida de los bits empaquetados MSB primero:
+ *   magic (0xD1) | versión (1) | id de algoritmo | flags | largo en bits (uint32)
+ * Con FLAG_HAS_ID se agrega un id uint32 después de la cabecera.
+ */
+
+const MAGIC = 0xd1;
+const VERSION = 1;
+const FLAG_HAS_ID = 0x01;
+
+const ALGORITHM_IDS: Record<string, number> = {
+  hamming: 1,
+  fletcher16: 2,
+  crc32: 3,
+  crc16: 4,
+  hamming_blocked: 5,
+  hamming_interleaved: 6,
+};
+
+/**
+ * Empaqueta una trama de bits ('0'/'1') en un registro binario.
+ *
+ * @param algorithm - Algoritmo de la trama (hamming | fletcher16 | crc32 | crc16 |
+ *   hamming_blocked | hamming_interleaved)
+ * @param bits - Cadena binaria de la trama
+ * @param frameId - Id opcional que el receptor repite en su respuesta
+ */
+export default function packFrame(algorithm: string, bits: string, frameId?: number): Buffer {
+  const algoId = ALGORITHM_IDS[algorithm];
+  if (algoId === undefined) {
+    throw new Error(`Algoritmo no soportado: ${algorithm}`);
+  }
+
+  const hasId = frameId !== undefined;
+  const headerLen = hasId ? 12 : 8;
+  const payloadLen = Math.ceil(bits.length / 8);
+  const buf = Buffer.alloc(headerLen + payloadLen);
+
+  buf.writeUInt8(MAGIC, 0);
+  buf.writeUInt8(VERSION, 1);
+  buf.writeUInt8(algoId, 2);
+  buf.writeUInt8(hasId ? FLAG_HAS_ID : 0, 3);
+  buf.writeUInt32BE(bits.length, 4);
+  if (hasId) {
+    buf.writeUInt32BE(frameId as number, 8);
+  }
+
+  for (let i = 0; i < bits.length; i++) {
+    const ch = bits[i];
+    if (ch === '1') {
+      buf[headerLen + (i >> 3)] |= 0x80 >> (i & 7);
+    } else if (ch !== '0') {
+      throw new Error(`Carácter inválido para bit: "${ch}"`);
+    }
+  }
+
+  return buf;
+}
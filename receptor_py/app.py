@@ -1,127 +1,406 @@
 import os
 import json
+import time
+import signal
 import asyncio
 import websockets
-from hamming.hamming import hamming
-from fletcher16.fletcher16 import fletcher16_receive
+from http import HTTPStatus
+from functools import partial
+from typing import Callable, List, Optional, Tuple, Union
+from bitframe import bitframe
+from bitframe.bitframe import BitFrame
+from executor.executor import DecodePool
+from metrics.metrics import CONTENT_TYPE, ConnectionStats, Metrics
+from cache.cache import ResponseCache
+from wire.wire import WireFrame, unpack_frames
+from codec.registry import CODECS, Codec, response_encoder
 
+# Diagnósticos por mensaje solo con WS_VERBOSE=1: imprimir en consola
+# bloquea el event loop y domina el tiempo de decodificación
+LOG = print if os.getenv("WS_VERBOSE", "0") == "1" else None
+
+
+# Texto decodificado: WS_TEXT_ENCODING (ascii | latin-1 | utf-8) y
+# WS_TEXT_ERRORS (strict | replace | ignore | backslashreplace). Latin-1
+# equivale a chr() de cada byte, como hacía el receptor originalmente
+TEXT_ERRORS = os.getenv("WS_TEXT_ERRORS", "strict")
+TEXT_ENCODING = bitframe.check_text_encoding(os.getenv("WS_TEXT_ENCODING", "latin-1"), TEXT_ERRORS)
+
+# Serializador de respuestas: WS_JSON_ENCODER=json (por defecto, salida
+# idéntica a json.dumps) | orjson | auto (orjson si está instalado). orjson
+# cambia el formato (JSON compacto en UTF-8), por eso hay que pedirlo
+ENCODE_RESPONSE = response_encoder(os.getenv("WS_JSON_ENCODER", "json"))
 
 # -------- utilidades ----------
-def bits_to_text(bits: str) -> str:
-    if not bits:
-        return ""
-    if any(c not in "01" for c in bits):
-        raise ValueError("Bits inválidos")
-    usable = (len(bits) // 8) * 8
-    bits = bits[:usable]
-    return "".join(chr(int(bits[i:i+8], 2)) for i in range(0, usable, 8))
+def bits_to_text(bits: Union[str, BitFrame]) -> str:
+    return bitframe.bits_to_text(bits, TEXT_ENCODING, TEXT_ERRORS)
+
+# =========================
+# Decodificación de tramas
+# =========================
+
+# Límite de tramas por mensaje batch (protege memoria y latencia)
+MAX_BATCH = int(os.getenv("WS_MAX_BATCH", "10000"))
+
+def _error(reason: str, algorithm: str = None, details: dict = None) -> dict:
+    response = {"status": "error"}
+    if algorithm:
+        response["algorithm"] = algorithm
+    response["reason"] = reason
+    if details:
+        response["details"] = details
+    return response
+
+def decode_with(codec: Codec, bits: BitFrame, input_len: int) -> dict:
+    """Decodifica con un códec del registro y arma la respuesta común."""
+    decoded = codec.decode(bits, log=LOG)
+    if decoded.error:
+        return _error(decoded.error, codec.name, decoded.details)
+    return _ok_response(codec.name, decoded.data, input_len, decoded.details)
+
+def _ok_response(algorithm: str, data_bits: BitFrame, input_len: int, extra: dict) -> dict:
+    try:
+        decoded_text = bits_to_text(data_bits)
+    except Exception as e:
+        return _error(f"Error al convertir a ASCII: {e}", algorithm)
+
+    if LOG:
+        LOG("Texto decodificado:")
+        LOG(decoded_text if decoded_text else "(vacío)")
+
+    details = {
+        "decoded_bits": data_bits.to_bits(),
+        "input_len": input_len,
+        "output_len": len(data_bits)
+    }
+    if extra:
+        details.update(extra)
+    return {
+        "status": "ok",
+        "algorithm": algorithm,
+        "decoded_text": decoded_text,
+        "details": details
+    }
+
+def process_frame(frame) -> dict:
+    """
+    Decodifica una trama {algorithm, message} y devuelve la respuesta como
+    dict (sin serializar). Nunca lanza: los fallos vienen con status=error.
+    """
+    try:
+        if not isinstance(frame, dict):
+            return _error("Payload inválido (no es JSON de objeto)")
+
+        algorithm = (frame.get("algorithm") or "").strip().lower()
+        bitstream = frame.get("message") or ""
+
+        if not algorithm or not bitstream:
+            return _error("Faltan campos: 'algorithm' y/o 'message'")
+
+        if LOG:
+            LOG("\n--- Mensaje recibido ---")
+            LOG(f"Algoritmo: {algorithm}")
+            LOG(f"Bits (len={len(bitstream)}): {bitstream[:80]}{'...' if len(bitstream)>80 else ''}")
+
+        codec = CODECS.get(algorithm)
+        if codec is None:
+            return _error(f"Algoritmo no soportado: {algorithm}")
+
+        # Frontera JSON: a partir de aquí la trama viaja empaquetada
+        return decode_with(codec, BitFrame.from_bits(bitstream), len(bitstream))
+
+    except Exception as e:
+        return _error(f"Excepción en servidor: {str(e)}")
+
+def decode_frames(frames: list, with_ids: bool = True) -> list:
+    """
+    Decodifica una lista de tramas en orden. Es una función de módulo para
+    poder enviarla a un pool de procesos.
+    Si una trama trae "id", se repite en su resultado para correlacionar
+    (salvo con with_ids=False: trama individual).
+    """
+    results = []
+    for frame in frames:
+        result = process_frame(frame)
+        if with_ids and isinstance(frame, dict) and "id" in frame:
+            result = {"id": frame["id"], **result}
+        results.append(result)
+    return results
+
+def batch_response(results: list) -> dict:
+    ok = sum(1 for result in results if result["status"] == "ok")
+    return {
+        "status": "ok",
+        "type": "batch",
+        "count": len(results),
+        "ok": ok,
+        "errors": len(results) - ok,
+        "results": results
+    }
+
+def decode_binary(data: bytes) -> list:
+    """
+    Decodifica un mensaje binario (ver wire/wire.py) con uno o más registros.
+    Los bits llegan empaquetados: no se construyen cadenas '0'/'1' para
+    decodificar. Función de módulo para poder enviarla a un pool de procesos.
+    """
+    try:
+        frames = unpack_frames(data)
+    except ValueError as e:
+        return [_error(f"Mensaje binario inválido: {e}")]
+    return decode_wire_frames(frames)
+
+def decode_wire_frames(frames: List[WireFrame]) -> list:
+    """Decodifica registros binarios ya leídos, en orden (función de módulo para el pool)."""
+    results = []
+    for frame in frames:
+        codec = CODECS.get(frame.algorithm)
+        if codec is None:
+            result = _error(f"Algoritmo no soportado: {frame.algorithm}")
+        else:
+            if LOG:
+                LOG("\n--- Mensaje binario recibido ---")
+                LOG(f"Algoritmo: {frame.algorithm} (len={len(frame.bits)})")
+            try:
+                result = decode_with(codec, frame.bits, len(frame.bits))
+            except Exception as e:
+                result = _error(f"Excepción en servidor: {str(e)}")
+        if frame.frame_id is not None:
+            result = {"id": frame.frame_id, **result}
+        results.append(result)
+    return results
+
+def _frame_bits(frame) -> int:
+    """Tamaño aproximado de la trama (bits) para decidir si se descarga al pool."""
+    if isinstance(frame, dict):
+        message = frame.get("message")
+        if isinstance(message, str):
+            return len(message)
+    return 0
 
 # =========================
 # WebSocket Server
 # =========================
 
-async def handler(ws):
-    async for message in ws:
-        try:
-            frame = json.loads(message)
-            if not isinstance(frame, dict):
-                await ws.send(json.dumps({"status": "error", "reason": "Payload inválido (no es JSON de objeto)"}))
-                continue
+# Backend de ejecución: WS_EXECUTOR=inline|thread|process, WS_WORKERS,
+# WS_OFFLOAD_BITS (umbral para descargar) y WS_MAX_INFLIGHT (contrapresión)
+POOL = DecodePool.from_env()
 
-            algorithm = (frame.get("algorithm") or "").strip().lower()
-            bitstream = frame.get("message") or ""
+# Métricas: GET WS_METRICS_PATH en el mismo puerto devuelve el formato de
+# Prometheus ("" lo desactiva); WS_METRICS_INTERVAL > 0 además imprime un
+# resumen JSON cada tantos segundos
+METRICS = Metrics()
+METRICS.gauge("ws_executor_inflight", lambda: POOL.inflight,
+              "Tareas de decodificación en vuelo en el pool (profundidad de cola)")
+METRICS_PATH = os.getenv("WS_METRICS_PATH", "/metrics")
+METRICS_INTERVAL = float(os.getenv("WS_METRICS_INTERVAL", "0"))
 
-            if not algorithm or not bitstream:
-                await ws.send(json.dumps({
-                    "status": "error",
-                    "reason": "Faltan campos: 'algorithm' y/o 'message'"
-                }))
-                continue
+# Caché de resultados por trama, clave (algoritmo, hash de la trama):
+# WS_CACHE_ENTRIES (0 = sin caché), WS_CACHE_MAX_BYTES y WS_CACHE_TTL
+# (segundos, 0 = sin vencimiento). Una sola caché para todas las conexiones:
+# la memoria queda acotada en total (no por conexión) y un emisor que se
+# reconecta y retransmite también acierta. Solo se usa desde el event loop
+CACHE_ENTRIES = int(os.getenv("WS_CACHE_ENTRIES", "0"))
+CACHE = ResponseCache(
+    max_entries=CACHE_ENTRIES,
+    max_bytes=int(os.getenv("WS_CACHE_MAX_BYTES", str(64 << 20))),
+    ttl=float(os.getenv("WS_CACHE_TTL", "0")),
+) if CACHE_ENTRIES > 0 else None
+
+def _cache_hit_ratio() -> float:
+    hits = METRICS.counters["ws_cache_hits_total"][()]
+    total = hits + METRICS.counters["ws_cache_misses_total"][()]
+    return hits / total if total else 0.0
 
-            print("\n--- Mensaje recibido ---")
-            print(f"Algoritmo: {algorithm}")
-            print(f"Bits (len={len(bitstream)}): {bitstream[:80]}{'...' if len(bitstream)>80 else ''}")
-
-            if algorithm == "hamming":
-                # Tu función hamming() retorna un string con los bits de datos decodificados
-                data_bits = hamming(bitstream)
-                try:
-                    decoded_text = bits_to_text(data_bits)
-                except Exception as e:
-                    await ws.send(json.dumps({
-                        "status": "error",
-                        "algorithm": algorithm,
-                        "reason": f"Error al convertir a ASCII: {e}"
-                    }))
-                    continue
-
-                print("Texto decodificado:")
-                print(decoded_text if decoded_text else "(vacío)")
-
-                await ws.send(json.dumps({
-                    "status": "ok",
-                    "algorithm": algorithm,
-                    "decoded_text": decoded_text,
-                    "details": {
-                        "decoded_bits": data_bits,
-                        "input_len": len(bitstream),
-                        "output_len": len(data_bits)
-                    }
-                }))
-
-            elif algorithm == "fletcher16":
-                # TODO: implementar verificación/decodificación Fletcher-16
-                try:
-                    data_bits = fletcher16_receive(bitstream)
-                    try:
-                        decoded_text = bits_to_text(data_bits)
-                    except Exception as e:
-                        await ws.send(json.dumps({
-                            "status": "error",
-                            "algorithm": algorithm,
-                            "reason": f"Error al convertir a ASCII: {e}"
-                        }))
-                        continue
-
-                    print("Texto decodificado:")
-                    print(decoded_text if decoded_text else "(vacío)")
-
-                    await ws.send(json.dumps({
-                        "status": "ok",
-                        "algorithm": algorithm,
-                        "decoded_text": decoded_text,
-                        "details": {
-                            "decoded_bits": data_bits,
-                            "input_len": len(bitstream),
-                            "output_len": len(data_bits)
-                        }
-                    }))
-
-                except ValueError as e:
-                    await ws.send(json.dumps({
-                        "status": "error",
-                        "algorithm": algorithm,
-                        "reason": str(e)
-                    }))
+if CACHE is not None:
+    # Aciertos, fallos y desalojos se cuentan solo en METRICS (desde 0)
+    for counter in ("ws_cache_hits_total", "ws_cache_misses_total", "ws_cache_evictions_total"):
+        METRICS.inc(counter, 0)
+    METRICS.gauge("ws_cache_entries", lambda: len(CACHE), "Tramas guardadas en la caché")
+    METRICS.gauge("ws_cache_bytes", lambda: CACHE.bytes, "Memoria aproximada de la caché")
+    METRICS.gauge("ws_cache_hit_ratio", _cache_hit_ratio, "Tramas respondidas desde la caché / tramas consultadas")
 
+# El id no es parte de la clave: se quita del resultado guardado y se
+# agrega el de cada trama al responder. _NO_ID = la trama no trae id
+_NO_ID = object()
+
+def _text_key(frame) -> Optional[tuple]:
+    """Clave de una trama JSON; None si no llega a decodificarse (no se guarda)."""
+    if not isinstance(frame, dict):
+        return None
+    algorithm = frame.get("algorithm")
+    message = frame.get("message")
+    if not isinstance(algorithm, str) or not isinstance(message, str) or not message:
+        return None
+    return ResponseCache.key(algorithm.strip().lower(), message)
+
+def _text_id(frame):
+    return frame["id"] if isinstance(frame, dict) and "id" in frame else _NO_ID
+
+def _with_id(result: dict, frame_id) -> dict:
+    return result if frame_id is _NO_ID else {"id": frame_id, **result}
+
+def _without_id(result: dict) -> dict:
+    return {k: v for k, v in result.items() if k != "id"} if "id" in result else result
+
+async def decode_cached(decode: Callable[[list], list], items: list, keys: list, ids: list,
+                        size_of: Callable[[object], int]) -> list:
+    """
+    Resultados de decode(items) en orden, tomando de CACHE las tramas ya
+    vistas. Las que faltan se decodifican (en el pool si corresponde) una
+    sola vez aunque se repitan dentro del mismo mensaje, y se guardan.
+    """
+    results = [None] * len(items)
+    # clave -> índices que esperan el resultado de la misma trama
+    waiting = {}
+    todo = []
+    hits = 0
+    for i, key in enumerate(keys):
+        if key is None:
+            todo.append(i)
+        elif key in waiting:
+            waiting[key].append(i)
+            hits += 1
+        else:
+            cached = CACHE.get(key)
+            if cached is not None:
+                results[i] = _with_id(cached, ids[i])
+                hits += 1
             else:
-                await ws.send(json.dumps({
-                    "status": "error",
-                    "reason": f"Algoritmo no soportado: {algorithm}"
-                }))
+                waiting[key] = [i]
+                todo.append(i)
+    METRICS.inc("ws_cache_hits_total", hits)
+    METRICS.inc("ws_cache_misses_total", len(waiting))
 
-        except Exception as e:
-            await ws.send(json.dumps({
-                "status": "error",
-                "reason": f"Excepción en servidor: {str(e)}"
-            }))
+    if todo:
+        pending = [items[i] for i in todo]
+        size = sum(size_of(item) for item in pending)
+        for i, result in zip(todo, await POOL.map_chunks(decode, pending, size_bits=size)):
+            results[i] = result
+            key = keys[i]
+            if key is None:
+                continue
+            stored = _without_id(result)
+            METRICS.inc("ws_cache_evictions_total", CACHE.put(key, stored))
+            for j in waiting[key][1:]:
+                results[j] = _with_id(stored, ids[j])
+    return results
+
+async def handle_message(message) -> Tuple[dict, list]:
+    """
+    Decodifica un mensaje (texto o binario) y devuelve la respuesta sin
+    serializar junto con los resultados por trama (para las métricas).
+    """
+    if isinstance(message, bytes):
+        start = time.perf_counter()
+        if CACHE is None:
+            # Formato binario: tamaño en bits ≈ 8 * bytes del mensaje
+            results = await POOL.run(decode_binary, message, size_bits=len(message) * 8)
+        else:
+            try:
+                frames = unpack_frames(message)
+            except ValueError as e:
+                results = [_error(f"Mensaje binario inválido: {e}")]
+            else:
+                results = await decode_cached(
+                    decode_wire_frames, frames,
+                    [ResponseCache.key(frame.algorithm, frame.bits) for frame in frames],
+                    [_NO_ID if frame.frame_id is None else frame.frame_id for frame in frames],
+                    lambda frame: len(frame.bits))
+        METRICS.observe("ws_decode_seconds", time.perf_counter() - start, kind="binary")
+        return (results[0] if len(results) == 1 else batch_response(results)), results
+
+    try:
+        payload = json.loads(message)
+    except Exception as e:
+        return _error(f"Excepción en servidor: {str(e)}"), []
+
+    start = time.perf_counter()
+    if isinstance(payload, dict) and payload.get("type") == "batch":
+        frames = payload.get("frames")
+        if not isinstance(frames, list):
+            return _error("Lote inválido: 'frames' debe ser una lista"), []
+        if len(frames) > MAX_BATCH:
+            return _error(f"Lote demasiado grande: {len(frames)} tramas (máximo {MAX_BATCH})"), []
+        if CACHE is None:
+            size = sum(_frame_bits(frame) for frame in frames)
+            results = await POOL.map_chunks(decode_frames, frames, size_bits=size)
+        else:
+            results = await decode_cached(decode_frames, frames, [_text_key(frame) for frame in frames],
+                                          [_text_id(frame) for frame in frames], _frame_bits)
+        METRICS.observe("ws_decode_seconds", time.perf_counter() - start, kind="batch")
+        return batch_response(results), results
+
+    if CACHE is None:
+        response = await POOL.run(process_frame, payload, size_bits=_frame_bits(payload))
+    else:
+        # Trama individual: la respuesta no lleva id
+        response, = await decode_cached(partial(decode_frames, with_ids=False), [payload],
+                                        [_text_key(payload)], [_NO_ID], _frame_bits)
+    METRICS.observe("ws_decode_seconds", time.perf_counter() - start,
+                    kind=response.get("algorithm") or "desconocido")
+    return response, [response]
+
+async def respond(message, conn: ConnectionStats) -> str:
+    """Decodifica el mensaje, cuenta sus tramas en las métricas y serializa la respuesta."""
+    METRICS.record_message(conn, "binary" if isinstance(message, bytes) else "text", len(message))
+    response, results = await handle_message(message)
+    METRICS.record_results(conn, results)
+    return ENCODE_RESPONSE(response)
+
+async def handler(ws):
+    """
+    Protocolo:
+      - Trama individual: {"algorithm": ..., "message": ...}
+      - Lote: {"type": "batch", "frames": [{"algorithm": ..., "message": ...}, ...]}
+        Se responde con un único {"type": "batch", "results": [...]}.
+      - Mensaje binario: uno o más registros de wire/wire.py; con más de un
+        registro se responde como lote.
+    """
+    conn = METRICS.open_connection(getattr(ws, "remote_address", None))
+    try:
+        async for message in ws:
+            start = time.perf_counter()
+            await ws.send(await respond(message, conn))
+            METRICS.observe("ws_message_seconds", time.perf_counter() - start)
+    finally:
+        METRICS.close_connection(conn)
+
+def metrics_request(path, request_headers):
+    """Atiende GET WS_METRICS_PATH como HTTP plano; el resto sigue al handshake WS."""
+    if METRICS_PATH and path.split("?", 1)[0] == METRICS_PATH:
+        body = METRICS.render().encode("utf-8")
+        return HTTPStatus.OK, [("Content-Type", CONTENT_TYPE)], body
+    return None
+
+async def log_metrics(interval: float):
+    """Imprime un resumen JSON de las métricas cada `interval` segundos."""
+    while True:
+        await asyncio.sleep(interval)
+        print(json.dumps({"metrics": METRICS.snapshot()}), flush=True)
 
 async def main():
     host = os.getenv("WS_HOST", "0.0.0.0")
     port = int(os.getenv("WS_PORT", "8765"))
-    async with websockets.serve(handler, host, port):
-        print(f"Receptor WS listo en ws://{host}:{port}")
-        await asyncio.Future()
+    # SIGTERM/SIGINT cierran el servidor y apagan el pool: sin esto los
+    # workers de WS_EXECUTOR=process quedan huérfanos al terminar el proceso
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, lambda: stop.done() or stop.set_result(None))
+        except NotImplementedError:  # Windows: solo Ctrl+C (KeyboardInterrupt)
+            pass
+    try:
+        async with websockets.serve(handler, host, port, process_request=metrics_request):
+            print(f"Receptor WS listo en ws://{host}:{port} (executor={POOL.kind}, workers={POOL.workers})")
+            if METRICS_PATH:
+                print(f"Métricas en http://{host}:{port}{METRICS_PATH}")
+            if METRICS_INTERVAL > 0:
+                asyncio.create_task(log_metrics(METRICS_INTERVAL))
+            await stop
+    finally:
+        POOL.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
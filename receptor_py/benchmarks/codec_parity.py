@@ -0,0 +1,91 @@
+# Paridad entre Codec.decode (trama individual: app.py, main.py) y
+# Codec.decode_batch (lotes: tests.py, simulator.py) para cada códec del
+# registro: mismo motivo de rechazo, mismo "no corregible" y mismos datos
+# sobre tramas codificadas con 0 a 3 bits invertidos, tramas al azar (en
+# Hamming, muchas con síndrome fuera de rango) y tramas muy cortas. Además,
+# que decode(encode(datos)) devuelva exactamente los datos, con su largo
+# (sin el relleno de los códecs por bloques) y su texto.
+# Termina con código 1 ante cualquier diferencia.
+#
+# Uso (desde receptor_py/):
+#   python benchmarks/codec_parity.py [--cases 2000] [--seed 7]
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitframe.bitframe import BitFrame, as_bitframe, bits_to_text
+from codec.registry import CODECS, Codec
+
+
+def make_frames(codec: Codec, rng: random.Random, cases: int):
+    frames = []
+    for _ in range(cases):
+        k = rng.randint(1, 300)
+        code = as_bitframe(codec.encode(BitFrame(rng.getrandbits(k), k)))
+        for _ in range(rng.randint(0, 3)):
+            code = code.flipped(rng.randint(1, len(code)))
+        frames.append(code)
+        n = rng.randint(1, 300)
+        frames.append(BitFrame(rng.getrandbits(n), n))
+    frames += [BitFrame(0, n) for n in range(1, 17)]
+    # Síndrome 7 con paridad global impar en una palabra de 5 bits: fuera de rango
+    frames.append(BitFrame.from_bits("111011"))
+    return frames
+
+
+def _bits(data):
+    return None if data is None else as_bitframe(data).to_bits()
+
+
+def check_codec(codec: Codec, frames) -> int:
+    failures = 0
+    batch = codec.decode_batch(frames)
+    for frame, error, data, uncorrectable in zip(frames, batch.errors, batch.data, batch.uncorrectable):
+        single = codec.decode(frame)
+        got = (error, bool(uncorrectable), None if error else _bits(data))
+        expected = (single.error, single.uncorrectable, None if single.error else _bits(single.data))
+        if got != expected:
+            print(f"{codec.name}: decode {expected} != decode_batch {got} para {frame.to_bits()}")
+            failures += 1
+    return failures
+
+
+def check_roundtrip(codec: Codec, rng: random.Random, cases: int) -> int:
+    failures = 0
+    for k in list(range(1, 40)) + [rng.randint(1, 600) for _ in range(cases)]:
+        data = BitFrame(rng.getrandbits(k), k)
+        decoded = codec.decode(as_bitframe(codec.encode(data)))
+        if decoded.error or decoded.data != data:
+            print(f"{codec.name}: decode(encode({data.to_bits()})) = {decoded}")
+            failures += 1
+    text = "AB"
+    data = BitFrame.from_bytes(text.encode("ascii"), 16)
+    decoded = codec.decode(as_bitframe(codec.encode(data)))
+    if decoded.data is None or bits_to_text(decoded.data) != text:
+        print(f"{codec.name}: el texto {text!r} no vuelve igual: {decoded}")
+        failures += 1
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paridad entre Codec.decode y Codec.decode_batch")
+    parser.add_argument("--cases", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    failures = 0
+    for codec in CODECS.values():
+        failures += check_codec(codec, make_frames(codec, rng, args.cases))
+        failures += check_roundtrip(codec, rng, args.cases)
+    print(f"{'OK' if not failures else 'FALLÓ'}: {failures} diferencias "
+          f"({len(CODECS)} códecs, {args.cases} casos por códec)")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
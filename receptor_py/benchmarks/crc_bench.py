@@ -0,0 +1,170 @@
+# CRC-32 / CRC-16-CCITT frente a Fletcher-16: velocidad y fuerza de detección.
+#
+# 1. Verifica que las rutas slicing-by-8 en Python (crc32_python,
+#    crc16_python) den lo mismo que zlib.crc32 / binascii.crc_hqx.
+# 2. Mide el throughput de cada suma (byte a byte, slicing-by-8, en C y
+#    fletcher16_sums) y de la verificación de una trama completa
+#    (crc_decode, fletcher16_decode y fletcher16_receive).
+# 3. Cuenta tramas con errores que pasan la verificación (no detectadas)
+#    con ruido aleatorio y con ráfagas, por códec del registro.
+#
+# Uso (desde receptor_py/):
+#   python benchmarks/crc_bench.py [--trials 20000] [--bits 256] [--seed 7]
+
+import argparse
+import binascii
+import contextlib
+import io
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitframe.bitframe import BitFrame
+from codec.registry import CODECS
+from crc import crc
+from fletcher16.fletcher16 import fletcher16_decode, fletcher16_receive, fletcher16_sums
+
+DETECTORS = ("fletcher16", "crc16", "crc32")
+
+
+def crc32_bytewise(data: bytes, value: int = 0) -> int:
+    """CRC-32 de a un byte por iteración (una sola tabla), para comparar."""
+    t0 = crc.CRC32_TABLES[0]
+    value ^= 0xFFFFFFFF
+    for b in data:
+        value = (value >> 8) ^ t0[(value ^ b) & 0xFF]
+    return value ^ 0xFFFFFFFF
+
+
+def check_parity(rng: random.Random) -> int:
+    failures = 0
+    for n in list(range(0, 33)) + [255, 256, 4097, 65536]:
+        data = rng.randbytes(n)
+        start32, start16 = rng.getrandbits(32), rng.getrandbits(16)
+        if crc.crc32_python(data, start32) != zlib.crc32(data, start32):
+            print(f"crc32_python distinto ({n} bytes)")
+            failures += 1
+        if crc32_bytewise(data) != zlib.crc32(data):
+            print(f"crc32 byte a byte distinto ({n} bytes)")
+            failures += 1
+        if crc.crc16_python(data, start16) != binascii.crc_hqx(data, start16):
+            print(f"crc16_python distinto ({n} bytes)")
+            failures += 1
+    return failures
+
+
+def best_time(fn, repeat: int = 5) -> float:
+    fn()
+    start = time.perf_counter()
+    fn()
+    loops = max(1, int(0.02 / max(time.perf_counter() - start, 1e-7)))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def _receive_quiet(frame):
+    with contextlib.redirect_stdout(io.StringIO()):
+        fletcher16_receive(frame)
+
+
+def bench_throughput(rng: random.Random):
+    print(f"\n{'suma':>22} {'bytes':>9} {'µs':>12} {'MB/s':>10}")
+    for n in (64, 4096, 1 << 20):
+        data = rng.randbytes(n)
+        rows = [
+            ("crc32 byte a byte", lambda: crc32_bytewise(data)),
+            ("crc32 slicing-by-8", lambda: crc.crc32_python(data)),
+            ("crc32 (zlib)", lambda: crc.crc32(data)),
+            ("crc16 slicing-by-8", lambda: crc.crc16_python(data)),
+            ("crc16 (binascii)", lambda: binascii.crc_hqx(data, crc.CRC16_INIT)),
+            ("crc16 (crc.crc16)", lambda: crc.crc16(data)),
+            ("fletcher16_sums", lambda: fletcher16_sums(data)),
+        ]
+        if n > 4096:  # las rutas en Python tardan segundos con 1 MiB
+            rows = [row for row in rows if "byte a byte" not in row[0]]
+        for name, fn in rows:
+            t = best_time(fn)
+            print(f"{name:>22} {n:>9} {t * 1e6:>12.2f} {n / t / 1e6:>10.1f}")
+
+    print(f"\n{'trama':>22} {'bits':>9} {'µs':>12} {'Mbit/s':>10}")
+    for bits in (512, 131072):
+        data = BitFrame(rng.getrandbits(bits), bits)
+        frames = {name: CODECS[name].encode(data) for name in DETECTORS}
+        fletcher_bits = frames["fletcher16"].to_bits()
+        rows = [
+            ("fletcher16_receive", lambda: _receive_quiet(fletcher_bits)),
+            ("fletcher16_decode", lambda: fletcher16_decode(frames["fletcher16"])),
+            ("crc_decode (16)", lambda: crc.crc_decode(frames["crc16"], 16)),
+            ("crc_decode (32)", lambda: crc.crc_decode(frames["crc32"], 32)),
+        ]
+        for name, fn in rows:
+            t = best_time(fn)
+            print(f"{name:>22} {bits:>9} {t * 1e6:>12.2f} {bits / t / 1e6:>10.1f}")
+
+
+def _random_errors(n: int, rng: random.Random, probability: float) -> int:
+    mask = 0
+    while not mask:  # al menos un error: solo cuentan tramas dañadas
+        for i in range(n):
+            if rng.random() < probability:
+                mask |= 1 << i
+    return mask
+
+
+def _burst(n: int, rng: random.Random, length: int) -> int:
+    # Primer y último bit de la ráfaga invertidos, el resto al azar
+    length = min(length, n)
+    start = rng.randrange(n - length + 1)
+    inner = rng.getrandbits(length) | 1 | (1 << (length - 1))
+    return inner << start
+
+
+def bench_detection(rng: random.Random, trials: int, bits: int):
+    channels = [
+        ("aleatorio p=0.01", lambda n: _random_errors(n, rng, 0.01)),
+        ("aleatorio p=0.05", lambda n: _random_errors(n, rng, 0.05)),
+        ("ráfaga 17 bits", lambda n: _burst(n, rng, 17)),
+        ("ráfaga 33 bits", lambda n: _burst(n, rng, 33)),
+    ]
+    print(f"\nTramas dañadas no detectadas ({trials} por caso, {bits} bits de datos):")
+    print(f"{'canal':>18} " + " ".join(f"{name:>12}" for name in DETECTORS))
+    for label, noise in channels:
+        row = []
+        for name in DETECTORS:
+            codec = CODECS[name]
+            missed = 0
+            for _ in range(trials):
+                code = codec.encode(BitFrame(rng.getrandbits(bits), bits))
+                damaged = BitFrame(code.value ^ noise(len(code)), len(code))
+                if codec.decode(damaged).error is None:
+                    missed += 1
+            row.append(missed)
+        print(f"{label:>18} " + " ".join(f"{m:>12}" for m in row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Velocidad y detección de CRC frente a Fletcher-16")
+    parser.add_argument("--trials", type=int, default=20000, help="Tramas por caso de detección")
+    parser.add_argument("--bits", type=int, default=256, help="Bits de datos por trama de detección")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    failures = check_parity(rng)
+    print(f"{'OK' if not failures else 'FALLÓ'}: slicing-by-8 frente a zlib/binascii ({failures} diferencias)")
+    bench_throughput(rng)
+    bench_detection(rng, args.trials, args.bits)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
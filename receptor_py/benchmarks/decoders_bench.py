@@ -0,0 +1,330 @@
+# Suite de benchmarks reproducible de los decodificadores del receptor:
+# hamming, fletcher16_receive, CRC-32/CRC-16, bits_to_text y el handler WebSocket.
+#
+# Barre tamaño de trama y probabilidad de error (los mismos ejes que
+# emisor_ts/src/test_generator.ts) con tramas generadas por una semilla fija.
+# Mide con perf_counter_ns: calentamiento, varias repeticiones y un número
+# de llamadas por repetición calibrado para que cada una dure al menos
+# --min-time-ms. Las funciones que imprimen se miden con stdout a devnull.
+#
+# El resultado se escribe en JSON (--output). Con --baseline la mediana de
+# cada caso se compara contra una corrida guardada en la misma máquina y se
+# marcan regresiones (código de salida 1 si alguna supera --tolerance). Si
+# el "meta" de la referencia no coincide (CPU, Python, NumPy, núcleos en C,
+# serializador JSON, semilla, tramas) los tiempos no son comparables: no se
+# compara y sale con código 2, salvo con --ignore-meta.
+#
+# Uso (desde receptor_py/):
+#   python benchmarks/decoders_bench.py --output mi_base.json
+#   python benchmarks/decoders_bench.py --baseline mi_base.json [--tolerance 0.15]
+#   python benchmarks/decoders_bench.py --targets hamming_decode --sizes 32 8192
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitframe.bitframe import BitFrame
+from crc.crc import crc_decode, crc_encode
+from fletcher16.fletcher16 import fletcher16_decode, fletcher16_encode, fletcher16_receive
+from hamming.hamming import hamming, hamming_decode, hamming_encode
+from native.loader import load_kernels
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DEFAULT_SIZES = [32, 512, 8192, 131072, 1 << 20]
+DEFAULT_PROBABILITIES = [0.0, 0.01, 0.02, 0.05, 0.1]
+ENCODERS = {"hamming": hamming_encode, "fletcher16": fletcher16_encode,
+            "crc32": lambda bits: crc_encode(bits, 32), "crc16": lambda bits: crc_encode(bits, 16),
+            "raw": lambda bits: bits}
+
+
+class Target(NamedTuple):
+    # Qué tramas recibe: una clave de ENCODERS ("raw" = datos sin codificar)
+    algorithm: str
+    # Convierte la trama ruidosa ('0'/'1') al argumento de `call`
+    prepare: Callable[[str], object]
+    call: Callable[[object], object]
+
+
+# -------- objetivos ----------
+def _quiet(fn: Callable) -> Callable:
+    """Llama fn con stdout descartado; los ValueError (tramas con error) son resultados válidos."""
+    def call(arg):
+        with contextlib.redirect_stdout(_DEVNULL):
+            try:
+                return fn(arg)
+            except ValueError:
+                return None
+    return call
+
+
+class FakeWebSocket:
+    """Conexión mínima para el handler: entrega un mensaje y descarta la respuesta."""
+
+    def __init__(self, message):
+        self.message = message
+
+    def __aiter__(self):
+        return self._messages()
+
+    async def _messages(self):
+        yield self.message
+
+    async def send(self, response):
+        pass
+
+
+def _ws_target(algorithm: str) -> Target:
+    import app  # requiere websockets; solo se importa si se mide el handler
+
+    loop = asyncio.new_event_loop()
+
+    def call(message):
+        loop.run_until_complete(app.handler(FakeWebSocket(message)))
+
+    def prepare(bits):
+        return json.dumps({"algorithm": algorithm, "message": bits})
+
+    return Target(algorithm, prepare, call)
+
+
+def _bits_to_text(bits):
+    import app
+    return app.bits_to_text(bits)
+
+
+_DEVNULL = open(os.devnull, "w")
+
+TARGETS: Dict[str, Callable[[], Target]] = {
+    "hamming": lambda: Target("hamming", str, _quiet(hamming)),
+    "hamming_decode": lambda: Target("hamming", BitFrame.from_bits, hamming_decode),
+    "fletcher16_receive": lambda: Target("fletcher16", str, _quiet(fletcher16_receive)),
+    "fletcher16_decode": lambda: Target("fletcher16", BitFrame.from_bits, fletcher16_decode),
+    "crc32_decode": lambda: Target("crc32", BitFrame.from_bits, lambda bits: crc_decode(bits, 32)),
+    "crc16_decode": lambda: Target("crc16", BitFrame.from_bits, lambda bits: crc_decode(bits, 16)),
+    "bits_to_text": lambda: Target("raw", BitFrame.from_bits, _bits_to_text),
+    "ws_hamming": lambda: _ws_target("hamming"),
+    "ws_fletcher16": lambda: _ws_target("fletcher16"),
+    "ws_crc32": lambda: _ws_target("crc32"),
+}
+
+
+# -------- tramas ----------
+def add_noise(bits: str, probability: float, rng: random.Random) -> str:
+    """Invierte cada bit con probabilidad `probability` (saltos geométricos entre errores)."""
+    if probability <= 0 or not bits:
+        return bits
+    frame = BitFrame.from_bits(bits)
+    n = len(frame)
+    mask = 0
+    log_q = math.log1p(-probability) if probability < 1 else None
+    pos = -1
+    while True:
+        pos += 1 if log_q is None else 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if pos >= n:
+            break
+        mask |= 1 << (n - 1 - pos)
+    return BitFrame(frame.value ^ mask, n).to_bits()
+
+
+def make_frames(algorithm: str, size: int, probability: float, count: int, seed: int) -> List[str]:
+    """`count` tramas reproducibles de `size` bits de datos para un caso."""
+    rng = random.Random(f"{seed}:{algorithm}:{size}:{probability}")
+    frames = []
+    for _ in range(count):
+        data = BitFrame(rng.getrandbits(size), size).to_bits()
+        frames.append(add_noise(ENCODERS[algorithm](data), probability, rng))
+    return frames
+
+
+# -------- medición ----------
+def measure(call: Callable, args: List[object], repeat: int, warmup: int, min_time_ns: int) -> dict:
+    """Nanosegundos por llamada recorriendo `args` en ciclo."""
+    for _ in range(warmup):
+        for arg in args:
+            call(arg)
+
+    start = time.perf_counter_ns()
+    call(args[0])
+    single = max(1, time.perf_counter_ns() - start)
+    loops = max(1, math.ceil(min_time_ns / single))
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for i in range(loops):
+            call(args[i % len(args)])
+        samples.append((time.perf_counter_ns() - start) / loops)
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+def _cpu_model() -> Optional[str]:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or None
+
+
+def metadata(args: argparse.Namespace) -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__ if np is not None else None,
+        # Con los núcleos de native/ compilados los tiempos cambian en órdenes de magnitud
+        "native_kernels": load_kernels() is not None,
+        "json_encoder": os.getenv("WS_JSON_ENCODER", "json"),
+        "seed": args.seed,
+        "frames": args.frames,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+# Campos de "meta" que deben coincidir para que los tiempos sean comparables
+COMPARABLE_META = ("implementation", "python", "numpy", "cpu", "native_kernels", "json_encoder",
+                   "seed", "frames")
+
+
+def meta_mismatches(current: dict, reference: dict) -> List[str]:
+    """Diferencias de "meta" entre la corrida actual y la referencia."""
+    return [f"{field}: referencia {reference.get(field)!r}, actual {current.get(field)!r}"
+            for field in COMPARABLE_META if reference.get(field) != current.get(field)]
+
+
+def case_key(case: dict) -> tuple:
+    return case["target"], case["size_bits"], case["error_probability"]
+
+
+def run(args: argparse.Namespace) -> dict:
+    targets = {name: TARGETS[name]() for name in args.targets}
+    cases = []
+    for size in args.sizes:
+        for probability in args.probabilities:
+            # Las mismas tramas para todos los objetivos de un algoritmo
+            frames = {}
+            for name, target in targets.items():
+                if target.algorithm not in frames:
+                    frames[target.algorithm] = make_frames(target.algorithm, size, probability,
+                                                           args.frames, args.seed)
+                inputs = [target.prepare(bits) for bits in frames[target.algorithm]]
+                stats = measure(target.call, inputs, args.repeat, args.warmup,
+                                args.min_time_ms * 1_000_000)
+                case = {
+                    "target": name,
+                    "size_bits": size,
+                    "error_probability": probability,
+                    "ns_per_call": stats,
+                    "mbit_per_s": size / stats["median"] * 1e3,
+                }
+                cases.append(case)
+                print(f"{name:>20} {size:>9} {probability:>5.2f} "
+                      f"{stats['median'] / 1e3:>12.2f} µs {case['mbit_per_s']:>10.2f} Mbit/s",
+                      flush=True)
+    return {"meta": metadata(args), "results": cases}
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[dict]:
+    """Casos cuya mediana empeoró más de `tolerance` respecto al baseline."""
+    previous = {case_key(case): case for case in baseline.get("results", [])}
+    regressions = []
+    print(f"\n{'objetivo':>20} {'bits':>9} {'p':>5} {'base µs':>12} {'actual µs':>12} {'ratio':>7}")
+    for case in report["results"]:
+        base = previous.get(case_key(case))
+        if base is None:
+            continue
+        ratio = case["ns_per_call"]["median"] / base["ns_per_call"]["median"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  REGRESIÓN"
+            regressions.append({"target": case["target"], "size_bits": case["size_bits"],
+                                "error_probability": case["error_probability"], "ratio": ratio})
+        print(f"{case['target']:>20} {case['size_bits']:>9} {case['error_probability']:>5.2f} "
+              f"{base['ns_per_call']['median'] / 1e3:>12.2f} "
+              f"{case['ns_per_call']['median'] / 1e3:>12.2f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks de los decodificadores del receptor")
+    parser.add_argument("--targets", nargs="+", choices=sorted(TARGETS), default=list(TARGETS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Bits de datos por trama (antes de codificar)")
+    parser.add_argument("--probabilities", type=float, nargs="+", default=DEFAULT_PROBABILITIES,
+                        help="Probabilidad de invertir cada bit")
+    parser.add_argument("--frames", type=int, default=8, help="Tramas distintas por caso")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=2, help="Pasadas de calentamiento sobre las tramas")
+    parser.add_argument("--min-time-ms", type=int, default=50, help="Duración mínima de cada repetición")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--baseline", help="JSON de una corrida anterior (misma máquina) para comparar")
+    parser.add_argument("--ignore-meta", action="store_true",
+                        help="Comparar aunque el meta de --baseline no coincida con esta corrida")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Empeoramiento relativo de la mediana tolerado (0.10 = 10%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    print(f"{'objetivo':>20} {'bits':>9} {'p':>5} {'mediana':>15} {'throughput':>17}")
+    report = run(args)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        mismatches = meta_mismatches(report["meta"], baseline.get("meta", {}))
+        if mismatches:
+            print(f"\n⚠️  {args.baseline} se midió en otras condiciones; los tiempos no son comparables:")
+            for mismatch in mismatches:
+                print(f"   {mismatch}")
+            if not args.ignore_meta:
+                print("No se compara (--ignore-meta para comparar igual)")
+                _save(report, args.output)
+                return 2
+        regressions = compare(report, baseline, args.tolerance)
+        report["regressions"] = regressions
+        print(f"\n{len(regressions)} regresiones (tolerancia {args.tolerance:.0%})")
+
+    _save(report, args.output)
+    return 1 if report.get("regressions") else 0
+
+
+def _save(report: dict, output: Optional[str]):
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados guardados en {output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
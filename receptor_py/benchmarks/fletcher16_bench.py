@@ -0,0 +1,91 @@
+# Benchmark de Fletcher-16: bucle byte a byte original vs núcleo por bloques
+# vs ruta NumPy (y el núcleo en C si está compilado). Verifica que todos den
+# el mismo checksum y reporta MB/s.
+#
+# Uso (desde receptor_py/):
+#   python benchmarks/fletcher16_bench.py [--sizes 64 4096 1048576] [--repeat 5]
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fletcher16.fletcher16 as f16
+
+
+def reference_checksum(data: bytes) -> int:
+    """Implementación original: dos reducciones módulo 255 por byte."""
+    sum1 = 0
+    sum2 = 0
+    for b in data:
+        sum1 = (sum1 + b) % 255
+        sum2 = (sum2 + sum1) % 255
+    return (sum2 << 8) | sum1
+
+
+def blocked_checksum(data: bytes) -> int:
+    """Núcleo por bloques en Python, sin el núcleo en C ni NumPy."""
+    native, np_ = f16.native, f16.np
+    f16.native = f16.np = None
+    try:
+        return f16.fletcher16_checksum(data)
+    finally:
+        f16.native, f16.np = native, np_
+
+
+def numpy_checksum(data: bytes) -> int:
+    sum1, sum2 = f16._fletcher16_sums_numpy(data, 0, 0)
+    return (sum2 << 8) | sum1
+
+
+def native_checksum(data: bytes) -> int:
+    sum1, sum2 = f16.native.fletcher16_sums(data, 0, 0)
+    return (sum2 << 8) | sum1
+
+
+def measure(fn, data: bytes, repeat: int) -> float:
+    """Mejor tiempo (s) de `repeat` ejecuciones tras un calentamiento."""
+    fn(data)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de Fletcher-16")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[64, 4096, 65536, 1 << 20, 16 << 20],
+                        help="Tamaños de payload en bytes")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    impls = [("referencia", reference_checksum), ("bloques", blocked_checksum)]
+    if f16.np is not None:
+        impls.append(("numpy", numpy_checksum))
+    else:
+        print("NumPy no disponible: se omite la ruta vectorizada")
+    if f16.native is not None:
+        impls.append(("c", native_checksum))
+
+    print(f"{'bytes':>10}  " + "  ".join(f"{name:>12}" for name, _ in impls) + "  (MB/s)")
+    for size in args.sizes:
+        data = os.urandom(size)
+        expected = reference_checksum(data)
+        row = []
+        for name, fn in impls:
+            got = fn(data)
+            if got != expected:
+                raise SystemExit(f"{name}: checksum {got:#06x} != {expected:#06x} ({size} bytes)")
+            seconds = measure(fn, data, args.repeat)
+            row.append(size / seconds / 1e6 if seconds else float("inf"))
+        print(f"{size:>10}  " + "  ".join(f"{mbps:>12.1f}" for mbps in row))
+
+
+if __name__ == "__main__":
+    main()
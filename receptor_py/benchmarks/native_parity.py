@@ -0,0 +1,200 @@
+# Paridad entre los núcleos en C (native/_kernels.c) y las rutas en Python:
+# compara síndrome, corrección+extracción, sumas de Fletcher-16 y CRC-16 sobre
+# entradas aleatorias y casos borde, que ambas rutas rechacen con ValueError
+# las posiciones y largos fuera de rango, y luego hamming_decode/fletcher16_decode
+# completos con y sin la extensión. Termina con código 1 ante cualquier
+# diferencia. Con --bench además reporta el tiempo de cada ruta.
+#
+# Uso (desde receptor_py/, después de python native/build.py):
+#   python benchmarks/native_parity.py [--cases 2000] [--seed 7] [--bench]
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import crc.crc as crc
+import fletcher16.fletcher16 as f16
+import hamming.hamming as ham
+from bitframe.bitframe import BitFrame
+
+SIZES = [0, 1, 2, 3, 4, 7, 8, 9, 15, 16, 17, 31, 32, 33, 63, 64, 65, 255, 256, 257, 4095, 4096, 65537]
+
+
+def random_frame(rng: random.Random, n: int) -> BitFrame:
+    return BitFrame(rng.getrandbits(n) if n else 0, n)
+
+
+def python_fletcher_sums(data: bytes, sum1: int, sum2: int):
+    native, np_ = f16.native, f16.np
+    f16.native = f16.np = None
+    try:
+        return f16.fletcher16_sums(data, sum1, sum2)
+    finally:
+        f16.native, f16.np = native, np_
+
+
+def check_kernels(kernels, rng: random.Random, cases: int) -> int:
+    failures = 0
+    sizes = SIZES + [rng.randint(0, 5000) for _ in range(cases)]
+    for n in sizes:
+        frame = random_frame(rng, n)
+        total = n + 1
+        pad = (-total) % 8
+        buf = (frame.value << pad).to_bytes((total + pad) >> 3, "big")
+        if kernels.hamming_syndrome(buf) != ham._syndrome_and_parity_python(buf):
+            print(f"síndrome distinto (n={n})")
+            failures += 1
+
+        layout = ham.hamming_layout(n)
+        for flip in {0, 1, n, rng.randint(0, n)}:
+            if n == 0 and flip:
+                continue
+            expected = ham._extract_frame_python(frame, layout, flip)
+            got = BitFrame.from_bytes(kernels.hamming_extract(frame.to_bytes(), n, flip),
+                                      len(layout.data_index))
+            if got != expected:
+                print(f"extracción distinta (n={n}, flip={flip})")
+                failures += 1
+
+        data = frame.to_bytes()
+        sum1, sum2 = rng.randrange(255), rng.randrange(255)
+        if kernels.fletcher16_sums(data, sum1, sum2) != python_fletcher_sums(data, sum1, sum2):
+            print(f"sumas Fletcher-16 distintas ({len(data)} bytes)")
+            failures += 1
+
+        start = rng.getrandbits(16)
+        if kernels.crc16_ccitt(data, start) != crc.crc16_python(data, start):
+            print(f"CRC-16 distinto ({len(data)} bytes)")
+            failures += 1
+    return failures
+
+
+def _raises_value_error(fn) -> bool:
+    try:
+        fn()
+    except ValueError:
+        return True
+    return False
+
+
+def check_bounds(kernels) -> int:
+    """Entradas fuera de rango: ValueError en C y en Python, sin escribir fuera del buffer."""
+    failures = 0
+    for data, n, flip in [(b"\x00", 3, 10 ** 9), (b"\x00", 3, 4), (b"\x00", 3, -1),
+                          (b"\xff" * 2, 16, 17), (b"", 0, 1)]:
+        if not _raises_value_error(lambda: kernels.hamming_extract(data, n, flip)):
+            print(f"hamming_extract aceptó flip={flip} (n={n})")
+            failures += 1
+        frame = BitFrame.from_bytes(data, n)
+        layout = ham.hamming_layout(n)
+        if not _raises_value_error(lambda: ham._extract_frame_python(frame, layout, flip)):
+            print(f"_extract_frame_python aceptó flip={flip} (n={n})")
+            failures += 1
+    for data, n in [(b"\x00", 9), (b"", 1), (b"\x00", -1), (b"\x00" * 2, 10 ** 9)]:
+        if not _raises_value_error(lambda: kernels.hamming_extract(data, n, 0)):
+            print(f"hamming_extract aceptó nbits={n} con {len(data)} bytes")
+            failures += 1
+    return failures
+
+
+def decode_both(module, fn, frame):
+    kernels = module.native
+    module.native = None
+    try:
+        expected = fn(frame)
+    finally:
+        module.native = kernels
+    return expected, fn(frame)
+
+
+def check_decoders(rng: random.Random, cases: int) -> int:
+    failures = 0
+    for _ in range(cases):
+        n = rng.randint(2, 600)
+        code = ham.hamming_encode(random_frame(rng, n))
+        for _ in range(rng.randint(0, 3)):
+            code = code.flipped(rng.randint(1, len(code)))
+        expected, got = decode_both(ham, ham.hamming_decode, code)
+        if expected != got:
+            print(f"hamming_decode distinto para {code!r}")
+            failures += 1
+
+        frame = f16.fletcher16_encode(random_frame(rng, n))
+        if rng.random() < 0.5:
+            frame = frame.flipped(rng.randint(1, len(frame)))
+        expected, got = decode_both(f16, f16.fletcher16_decode, frame)
+        if expected != got:
+            print(f"fletcher16_decode distinto para {frame!r}")
+            failures += 1
+    return failures
+
+
+def bench(rng: random.Random):
+    print(f"\n{'núcleo':>18} {'bits':>9} {'python µs':>12} {'C µs':>10} {'speedup':>8}")
+    for n in (64, 8192, 1 << 20):
+        frame = random_frame(rng, n)
+        data = frame.to_bytes()
+        layout = ham.hamming_layout(n)
+        buf = b"\x00" + data
+        rows = [
+            ("síndrome", lambda: ham._syndrome_and_parity_python(buf),
+             lambda: ham.native.hamming_syndrome(buf)),
+            ("extracción", lambda: ham._extract_frame_python(frame, layout, 3),
+             lambda: ham.native.hamming_extract(data, n, 3)),
+            ("fletcher16", lambda: python_fletcher_sums(data, 0, 0),
+             lambda: f16.native.fletcher16_sums(data, 0, 0)),
+            ("crc16", lambda: crc.crc16_python(data),
+             lambda: crc.native.crc16_ccitt(data)),
+        ]
+        for name, py_fn, c_fn in rows:
+            t_py, t_c = best_time(py_fn), best_time(c_fn)
+            print(f"{name:>18} {n:>9} {t_py * 1e6:>12.2f} {t_c * 1e6:>10.2f} {t_py / t_c:>7.1f}x")
+
+
+def best_time(fn, repeat: int = 5) -> float:
+    fn()
+    loops = max(1, int(0.02 / max(_once(fn), 1e-7)))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def _once(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paridad de los núcleos en C con las rutas en Python")
+    parser.add_argument("--cases", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--bench", action="store_true", help="Medir también ambas rutas")
+    args = parser.parse_args()
+
+    kernels = ham.native
+    if kernels is None:
+        raise SystemExit("La extensión no está disponible: compile con python native/build.py "
+                         "(y sin RECEPTOR_PURE_PYTHON=1)")
+
+    rng = random.Random(args.seed)
+    failures = check_kernels(kernels, rng, args.cases)
+    failures += check_bounds(kernels)
+    failures += check_decoders(rng, args.cases)
+    print(f"{'OK' if not failures else 'FALLÓ'}: {failures} diferencias "
+          f"({args.cases} casos aleatorios + {len(SIZES)} tamaños borde)")
+    if args.bench:
+        bench(rng)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
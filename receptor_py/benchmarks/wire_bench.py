@@ -0,0 +1,66 @@
+# Compara el formato JSON ('0'/'1' como texto) con el formato binario de
+# wire/wire.py: bytes por mensaje y tiempo de parseo hasta tener la BitFrame.
+#
+# Uso (desde receptor_py/):
+#   python benchmarks/wire_bench.py [--sizes 39 522 8192 1048576] [--repeat 5]
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitframe.bitframe import BitFrame
+from wire.wire import pack_frame, unpack_frames
+
+
+def parse_json(message: str) -> BitFrame:
+    frame = json.loads(message)
+    return BitFrame.from_bits(frame["message"])
+
+
+def parse_binary(message: bytes) -> BitFrame:
+    return unpack_frames(message)[0].bits
+
+
+def measure(fn, arg, repeat: int) -> float:
+    """Mejor tiempo (s) por llamada, con calentamiento y repeticiones."""
+    fn(arg)
+    loops = max(1, 20000 // max(1, len(arg) // 64))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(arg)
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON vs binario para tramas del receptor")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[39, 522, 8192, 1 << 20],
+                        help="Largos de trama en bits")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'bits':>9} {'json B':>10} {'bin B':>10} {'ahorro':>7} "
+          f"{'json µs':>10} {'bin µs':>10} {'speedup':>8}")
+    for size in args.sizes:
+        bits = "".join(random.choice("01") for _ in range(size))
+        as_json = json.dumps({"algorithm": "hamming", "message": bits})
+        as_binary = pack_frame("hamming", bits)
+        assert parse_json(as_json) == parse_binary(as_binary)
+
+        json_bytes = len(as_json.encode("utf-8"))
+        t_json = measure(parse_json, as_json, args.repeat)
+        t_bin = measure(parse_binary, as_binary, args.repeat)
+        print(f"{size:>9} {json_bytes:>10} {len(as_binary):>10} "
+              f"{1 - len(as_binary) / json_bytes:>6.1%} "
+              f"{t_json * 1e6:>10.2f} {t_bin * 1e6:>10.2f} {t_json / t_bin:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+# Generador de carga para el receptor WebSocket (app.py).
+#
+# Abre N conexiones concurrentes y reenvía las tramas ruidosas de
+# emisor_data.csv, a una tasa objetivo (--rate, tramas/s en total) o a
+# máxima velocidad. Cada conexión tiene un emisor y un lector: el receptor
+# responde en orden por conexión, así que cada respuesta se empareja con el
+# envío más antiguo pendiente. Con --rate la latencia se mide desde el
+# instante programado (no desde el envío real), para no esconder la espera
+# cuando el receptor se atrasa.
+#
+# Uso (desde receptor_py/, con el receptor corriendo):
+#   python benchmarks/ws_load.py --connections 16 --duration 10
+#   python benchmarks/ws_load.py --rate 2000 --batch 10 --binary --output load.json
+#   python benchmarks/ws_load.py --spawn          # levanta app.py en --url y lo cierra al final
+
+import argparse
+import asyncio
+import csv
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse
+
+import websockets
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from wire.wire import WireFrame, pack_frames
+
+Frame = Tuple[str, str]
+
+
+class LoadStats:
+    """Latencias y conteos de todas las conexiones."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.messages = 0
+        self.frames = 0
+        self.ok = 0
+        self.errors = 0
+        self.bytes_sent = 0
+
+    def record(self, latency: float, response: dict):
+        self.latencies.append(latency)
+        self.messages += 1
+        results = response.get("results") if response.get("type") == "batch" else [response]
+        for result in results or []:
+            self.frames += 1
+            if result.get("status") == "ok":
+                self.ok += 1
+            else:
+                self.errors += 1
+
+
+def load_frames(path: str, limit: Optional[int] = None) -> List[Frame]:
+    """(algoritmo, bits ruidosos) de cada fila del CSV del emisor."""
+    frames = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            frames.append((row["algorithm"], row["noisyBits"]))
+            if limit and len(frames) >= limit:
+                break
+    if not frames:
+        raise SystemExit(f"No hay tramas en {path}")
+    return frames
+
+
+def build_messages(frames: List[Frame], batch: int, binary: bool) -> List[Tuple[object, int]]:
+    """Mensajes listos para enviar (str o bytes) con la cantidad de tramas de cada uno."""
+    messages = []
+    for start in range(0, len(frames), batch):
+        group = frames[start:start + batch]
+        if binary:
+            message = pack_frames(WireFrame(algorithm, bits) for algorithm, bits in group)
+        elif batch == 1:
+            algorithm, bits = group[0]
+            message = json.dumps({"algorithm": algorithm, "message": bits})
+        else:
+            message = json.dumps({"type": "batch", "frames": [
+                {"algorithm": algorithm, "message": bits} for algorithm, bits in group
+            ]})
+        messages.append((message, len(group)))
+    return messages
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Percentil por rango más cercano sobre valores ya ordenados."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_connection(url: str, messages: list, offset: int, stats: LoadStats,
+                         deadline: float, interval: float, window: int, max_messages: int):
+    """
+    Una conexión: envía mensajes en ciclo (desde `offset`) hasta `deadline`
+    o `max_messages`, con a lo sumo `window` respuestas pendientes.
+    """
+    async with websockets.connect(url, max_size=None) as ws:
+        pending: deque = deque()
+        slots = asyncio.Semaphore(window)
+        done = asyncio.Event()
+
+        async def reader():
+            while not (done.is_set() and not pending):
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+                started = pending.popleft()
+                stats.record(time.perf_counter() - started, json.loads(raw))
+                slots.release()
+
+        reading = asyncio.create_task(reader())
+        next_send = time.perf_counter()
+        sent = 0
+        while sent < max_messages and time.perf_counter() < deadline:
+            if interval:
+                delay = next_send - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await slots.acquire()
+            message, _ = messages[(offset + sent) % len(messages)]
+            # Con tasa objetivo se mide desde el instante programado
+            pending.append(next_send if interval else time.perf_counter())
+            await ws.send(message)
+            stats.bytes_sent += len(message)
+            sent += 1
+            next_send += interval
+        done.set()
+        await reading
+
+
+async def run_load(args: argparse.Namespace, messages: list) -> Tuple[LoadStats, float]:
+    stats = LoadStats()
+    frames_per_message = sum(count for _, count in messages) / len(messages)
+    # Intervalo entre mensajes de cada conexión para llegar a --rate tramas/s
+    interval = args.connections * frames_per_message / args.rate if args.rate else 0.0
+    max_messages = math.ceil(args.messages / args.connections) if args.messages else math.inf
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(
+        run_connection(args.url, messages, i * len(messages) // args.connections, stats,
+                       deadline, interval, args.window, max_messages)
+        for i in range(args.connections)
+    ))
+    return stats, time.perf_counter() - start
+
+
+def report(stats: LoadStats, elapsed: float, args: argparse.Namespace) -> dict:
+    latencies = sorted(stats.latencies)
+    summary = {
+        "url": args.url,
+        "connections": args.connections,
+        "batch": args.batch,
+        "binary": args.binary,
+        "target_rate": args.rate or None,
+        "elapsed_s": elapsed,
+        "messages": stats.messages,
+        "frames": stats.frames,
+        "ok": stats.ok,
+        "errors": stats.errors,
+        "bytes_sent": stats.bytes_sent,
+        "frames_per_s": stats.frames / elapsed if elapsed else 0.0,
+        "messages_per_s": stats.messages / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 0.50) * 1e3,
+            "p99": percentile(latencies, 0.99) * 1e3,
+            "p999": percentile(latencies, 0.999) * 1e3,
+            "max": (latencies[-1] if latencies else 0.0) * 1e3,
+            "mean": (sum(latencies) / len(latencies) if latencies else 0.0) * 1e3,
+        },
+    }
+    lat = summary["latency_ms"]
+    print(f"\n📊 {stats.messages} mensajes / {stats.frames} tramas en {elapsed:.2f}s "
+          f"({args.connections} conexiones)")
+    print(f"   ⚡ {summary['frames_per_s']:.0f} tramas/s, {summary['messages_per_s']:.0f} mensajes/s")
+    print(f"   ⏱️  latencia ms: p50={lat['p50']:.3f} p99={lat['p99']:.3f} "
+          f"p999={lat['p999']:.3f} max={lat['max']:.3f}")
+    print(f"   ✅ ok: {stats.ok}  ❌ error: {stats.errors}")
+    return summary
+
+
+def spawn_receptor(url: str, timeout: float = 15.0) -> subprocess.Popen:
+    """Levanta app.py en el host/puerto de `url` y espera a que acepte conexiones."""
+    parsed = urlparse(url)
+    env = dict(os.environ, WS_HOST=parsed.hostname or "127.0.0.1", WS_PORT=str(parsed.port or 8765))
+    process = subprocess.Popen([sys.executable, "app.py"], cwd=ROOT, env=env,
+                               stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"El receptor terminó al arrancar (código {process.returncode})")
+        try:
+            asyncio.run(_probe(url))
+            return process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise SystemExit(f"El receptor no respondió en {url} tras {timeout:.0f}s")
+
+
+async def _probe(url: str):
+    async with websockets.connect(url):
+        pass
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generador de carga para el receptor WebSocket")
+    parser.add_argument("--url", default="ws://127.0.0.1:8765")
+    parser.add_argument("--csv", default=str(ROOT / "tests" / "emisor_data.csv"),
+                        help="CSV del emisor con las columnas algorithm y noisyBits")
+    parser.add_argument("--limit", type=int, help="Usar solo las primeras N filas del CSV")
+    parser.add_argument("--connections", "-c", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=0,
+                        help="Tramas por segundo en total (0 = a máxima velocidad)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Segundos de envío")
+    parser.add_argument("--messages", type=int, default=0,
+                        help="Tope de mensajes en total (0 = solo --duration)")
+    parser.add_argument("--batch", type=int, default=1, help="Tramas por mensaje")
+    parser.add_argument("--binary", action="store_true", help="Formato binario de wire/wire.py")
+    parser.add_argument("--window", type=int, default=None,
+                        help="Mensajes pendientes por conexión (por defecto 1 a máxima "
+                             "velocidad y 1024 con --rate)")
+    parser.add_argument("--spawn", action="store_true", help="Levantar app.py durante la prueba")
+    parser.add_argument("--output", help="Archivo JSON donde guardar el resumen")
+    args = parser.parse_args(argv)
+    if args.window is None:
+        args.window = 1024 if args.rate else 1
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    messages = build_messages(load_frames(args.csv, args.limit), max(1, args.batch), args.binary)
+    receptor = spawn_receptor(args.url) if args.spawn else None
+    try:
+        print(f"🚀 {args.connections} conexiones a {args.url}, "
+              f"{'%.0f tramas/s' % args.rate if args.rate else 'máxima velocidad'}, "
+              f"{args.duration:.0f}s, lotes de {args.batch}{' (binario)' if args.binary else ''}")
+        stats, elapsed = asyncio.run(run_load(args, messages))
+    finally:
+        if receptor is not None:
+            receptor.terminate()
+            receptor.wait()
+
+    summary = report(stats, elapsed, args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"💾 Resumen guardado en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
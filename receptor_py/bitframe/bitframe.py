@@ -0,0 +1,211 @@
+# Representación compacta de tramas de bits para el receptor.
+# Las cadenas '0'/'1' solo se usan en la frontera (JSON, CSV, archivos);
+# dentro del receptor la trama viaja como un entero + su longitud en bits.
+
+import codecs
+from typing import List, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # bits_matrix solo se usa en las rutas con NumPy
+    np = None
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Codificaciones de texto soportadas al convertir bits <-> texto
+TEXT_ENCODINGS = ("ascii", "latin-1", "utf-8")
+TEXT_ERRORS = ("strict", "replace", "ignore", "backslashreplace")
+
+INVALID_BITS = "Bits inválidos"
+
+
+def validate_bits(bits: str):
+    """
+    Verifica que la cadena tenga solo '0' y '1': pasada a bytes y
+    bytes.translate borrando '0'/'1' (todo en C); si queda algo, es inválida.
+    int(bits, 2) por sí solo aceptaría también '_', espacios, signo o '0b'.
+    """
+    if not bits.isascii() or bits.encode("ascii").translate(None, b"01"):
+        raise ValueError(INVALID_BITS)
+
+
+def bits_matrix(frames: List[str], length: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Matriz uint8 (tramas x `length`) con los bits de cadenas '0'/'1' del
+    mismo largo, para los decode_batch con NumPy, y la máscara de filas con
+    caracteres que no son bits (mismo criterio que validate_bits). Los
+    caracteres no ASCII pasan a '?' para no cambiar el largo de la fila.
+    """
+    text = "".join(frames).encode("ascii", "replace")
+    matrix = np.frombuffer(text, dtype=np.uint8).reshape(len(frames), length) - ord("0")
+    # uint8: lo que está por debajo de '0' da la vuelta y también queda > 1
+    return matrix, (matrix > 1).any(axis=1)
+
+
+class BitFrame:
+    """
+    Trama de bits respaldada por un `int` de Python.
+
+    El primer bit de la trama (posición 1 en Hamming) es el bit más
+    significativo de `value`, igual que en la cadena binaria equivalente.
+    `length` guarda la longitud real para no perder los ceros a la izquierda.
+    """
+
+    __slots__ = ("value", "length")
+
+    def __init__(self, value: int = 0, length: int = 0):
+        if length < 0:
+            raise ValueError("Longitud negativa")
+        if value < 0 or value >> length:
+            raise ValueError(f"El valor no cabe en {length} bits")
+        self.value = value
+        self.length = length
+
+    # -------- conversión en las fronteras ----------
+    @classmethod
+    def from_bits(cls, bits: str) -> "BitFrame":
+        """
+        Construye la trama a partir de una cadena binaria ('0'/'1').
+
+        Raises:
+            ValueError: Si la cadena tiene otros caracteres
+        """
+        if not bits:
+            return cls(0, 0)
+        validate_bits(bits)
+        return cls(int(bits, 2), len(bits))
+
+    @classmethod
+    def from_bytes(cls, data: BytesLike, length: int = None) -> "BitFrame":
+        """
+        Construye la trama a partir de bytes empaquetados (MSB primero).
+        Si `length` es menor que 8*len(data) se descartan los bits de relleno
+        del final.
+        """
+        total = len(data) * 8
+        if length is None:
+            length = total
+        if length > total:
+            raise ValueError(f"{len(data)} bytes no contienen {length} bits")
+        value = int.from_bytes(data, "big") >> (total - length)
+        return cls(value, length)
+
+    def to_bits(self) -> str:
+        """Cadena binaria equivalente (solo para JSON/CSV/consola)."""
+        if not self.length:
+            return ""
+        return format(self.value, f"0{self.length}b")
+
+    def to_bytes(self) -> bytes:
+        """Bytes empaquetados MSB primero, rellenando con ceros al final."""
+        pad = (-self.length) % 8
+        return (self.value << pad).to_bytes((self.length + pad) >> 3, "big")
+
+    # -------- operaciones sobre la trama ----------
+    def head(self, n: int) -> "BitFrame":
+        """Primeros `n` bits de la trama."""
+        n = max(0, min(n, self.length))
+        return BitFrame(self.value >> (self.length - n), n)
+
+    def tail(self, n: int) -> "BitFrame":
+        """Últimos `n` bits de la trama."""
+        n = max(0, min(n, self.length))
+        return BitFrame(self.value & ((1 << n) - 1), n)
+
+    def bit(self, pos: int) -> int:
+        """Bit en la posición 1-indexada `pos` (1 = primer bit)."""
+        if not 1 <= pos <= self.length:
+            raise IndexError(f"Posición {pos} fuera de rango (1..{self.length})")
+        return (self.value >> (self.length - pos)) & 1
+
+    def flipped(self, pos: int) -> "BitFrame":
+        """Copia de la trama con el bit de la posición 1-indexada `pos` invertido."""
+        if not 1 <= pos <= self.length:
+            raise IndexError(f"Posición {pos} fuera de rango (1..{self.length})")
+        return BitFrame(self.value ^ (1 << (self.length - pos)), self.length)
+
+    def popcount(self) -> int:
+        """Cantidad de bits en 1."""
+        return bin(self.value).count("1")
+
+    # -------- protocolo de Python ----------
+    def __len__(self) -> int:
+        return self.length
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BitFrame):
+            return self.value == other.value and self.length == other.length
+        if isinstance(other, str):
+            return self.to_bits() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.value, self.length))
+
+    def __str__(self) -> str:
+        return self.to_bits()
+
+    def __repr__(self) -> str:
+        bits = self.to_bits()
+        shown = bits if len(bits) <= 64 else bits[:64] + "..."
+        return f"BitFrame(len={self.length}, bits={shown})"
+
+
+def as_bitframe(frame: Union[str, BitFrame]) -> BitFrame:
+    """Acepta una cadena binaria o una BitFrame y devuelve siempre una BitFrame."""
+    if isinstance(frame, BitFrame):
+        return frame
+    return BitFrame.from_bits(frame)
+
+
+# -------- capa bits <-> bytes <-> texto ----------
+def bits_to_bytes(bits: Union[str, BitFrame]) -> bytes:
+    """Bytes empaquetados MSB primero (rellena con ceros a múltiplo de 8)."""
+    return as_bitframe(bits).to_bytes()
+
+
+def bytes_to_bits(data: BytesLike, length: int = None) -> str:
+    """Cadena binaria de `data`; con `length` se descartan los bits de relleno."""
+    return BitFrame.from_bytes(data, length).to_bits()
+
+
+def check_text_encoding(encoding: str, errors: str = "strict") -> str:
+    """
+    Normaliza y valida la codificación y la política de errores.
+    Devuelve el nombre canónico (p. ej. "utf-8" para "UTF8").
+
+    Raises:
+        ValueError: Si no es una de TEXT_ENCODINGS / TEXT_ERRORS
+    """
+    try:
+        name = codecs.lookup(encoding).name.replace("iso8859-1", "latin-1")
+    except LookupError:
+        name = encoding
+    if name not in TEXT_ENCODINGS:
+        raise ValueError(f"Codificación no soportada: {encoding} (use {', '.join(TEXT_ENCODINGS)})")
+    if errors not in TEXT_ERRORS:
+        raise ValueError(f"Política de errores no soportada: {errors} (use {', '.join(TEXT_ERRORS)})")
+    return name
+
+
+def bits_to_text(bits: Union[str, BitFrame], encoding: str = "latin-1", errors: str = "strict") -> str:
+    """
+    Convierte los bytes completos de la trama a texto (los bits sobrantes
+    del último byte incompleto se ignoran). La cadena se valida y convierte
+    de una vez: int(bits, 2) -> int.to_bytes -> bytes.decode.
+
+    Raises:
+        ValueError: Si hay caracteres que no son bits o, con errors="strict",
+            bytes inválidos para la codificación (UnicodeDecodeError)
+    """
+    if not bits:
+        return ""
+    frame = as_bitframe(bits)
+    usable = (len(frame) // 8) * 8
+    return frame.head(usable).to_bytes().decode(encoding, errors)
+
+
+def text_to_bits(text: str, encoding: str = "latin-1", errors: str = "strict") -> str:
+    """Inverso de bits_to_text: 8 bits por byte de la codificación."""
+    data = text.encode(encoding, errors)
+    return bytes_to_bits(data)
@@ -0,0 +1,110 @@
+# Caché de resultados del receptor WebSocket para tramas repetidas
+# (retransmisiones, keepalives). El resultado de una trama depende solo del
+# algoritmo y de sus bits, así que la clave es (algoritmo, hash de la trama):
+# una trama repetida acierta aunque llegue con otro id, en otro lote, con
+# las claves del JSON en otro orden o dentro del mismo lote. Se guarda el
+# resultado decodificado (el dict de la respuesta, sin id) y una trama
+# repetida cuesta un hash y una búsqueda en el dict.
+#
+# LRU acotado por cantidad de entradas y por bytes; opcionalmente cada
+# entrada vence tras `ttl` segundos. No es thread-safe: app.py la usa solo
+# desde el event loop. No lleva contadores propios: aciertos, fallos y
+# desalojos (put devuelve cuántos hubo) se cuentan en las métricas de app.py.
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional, Tuple, Union
+
+from bitframe.bitframe import BitFrame
+
+# Costo fijo aproximado por entrada (clave, tupla, dicts del resultado)
+ENTRY_OVERHEAD = 400
+
+
+class CachedResult(NamedTuple):
+    # Resultado de la trama sin "id" (no se modifica: se comparte entre aciertos)
+    result: dict
+    size: int
+    expires: float
+
+
+def result_size(result: dict) -> int:
+    """Memoria aproximada de un resultado: dominan los bits y el texto decodificados."""
+    size = ENTRY_OVERHEAD
+    for value in result.values():
+        if isinstance(value, str):
+            size += len(value)
+        elif isinstance(value, dict):
+            size += sum(len(v) for v in value.values() if isinstance(v, str))
+    return size
+
+
+class ResponseCache:
+    """
+    LRU de resultados por trama.
+
+    Args:
+        max_entries: entradas máximas
+        max_bytes: memoria aproximada máxima (ver result_size)
+        ttl: segundos de vida de cada entrada (0 = sin vencimiento)
+        max_entry_bytes: resultados más grandes no se guardan
+            (por defecto, 1/16 de max_bytes)
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 << 20,
+                 ttl: float = 0.0, max_entry_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_entry_bytes = max_entry_bytes or max(1, max_bytes // 16)
+        self.bytes = 0
+        self._entries: "OrderedDict[Hashable, CachedResult]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(algorithm: str, bits: Union[str, BitFrame]) -> Tuple[str, bytes]:
+        """
+        (algoritmo, BLAKE2b de 128 bits de la trama). Las cadenas '0'/'1'
+        se hashean tal cual y las tramas empaquetadas como largo + bytes;
+        `person` separa ambos dominios para que no choquen entre sí.
+        """
+        if isinstance(bits, BitFrame):
+            digest = hashlib.blake2b(bits.length.to_bytes(8, "big"), digest_size=16, person=b"packed")
+            digest.update(bits.to_bytes())
+        else:
+            digest = hashlib.blake2b(bits.encode("utf-8", "surrogatepass"), digest_size=16, person=b"text")
+        return algorithm, digest.digest()
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl and entry.expires < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def put(self, key: Hashable, result: dict) -> int:
+        """Guarda un resultado; devuelve cuántas entradas se desalojaron para hacerle lugar."""
+        size = result_size(result)
+        if size > self.max_entry_bytes:
+            return 0
+        if key in self._entries:
+            self._remove(key)
+        expires = time.monotonic() + self.ttl if self.ttl else 0.0
+        self._entries[key] = CachedResult(result, size, expires)
+        self.bytes += size
+        evicted = 0
+        while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            evicted += 1
+        return evicted
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
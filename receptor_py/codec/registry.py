@@ -0,0 +1,361 @@
+# Registro de códecs del receptor. Cada algoritmo (Hamming, Fletcher-16, ...)
+# expone la misma interfaz: decodificar una trama, decodificar un lote
+# (tests.py, simulator.py), overhead y capacidades (detecta / corrige). app.py y tests.py
+# despachan con una búsqueda en CODECS en lugar de cadenas if/elif, así un
+# códec nuevo se agrega con register() (y, si viaja en binario, su id en
+# wire.ALGORITHM_IDS).
+
+import json
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+from bitframe.bitframe import BitFrame, as_bitframe
+from crc import crc
+from fletcher16 import fletcher16
+from hamming import blocked, hamming
+from interleave import interleaver
+from wire import wire
+
+try:
+    import orjson
+except ImportError:  # sin orjson se usa un JSONEncoder reutilizable
+    orjson = None
+
+LogFn = Optional[Callable[[str], None]]
+
+# Bits de datos por palabra de hamming_blocked / hamming_interleaved:
+# palabras SECDED (16,11), así una trama de 256 bits tiene 24 palabras y el
+# entrelazado corrige ráfagas de hasta 24 bits
+BLOCKED_DATA_BITS = 11
+BLOCKED_PADDING_ERROR = "Relleno de bloques inválido (falta el bit de fin de datos)"
+
+
+class Decoded(NamedTuple):
+    """Resultado común de Codec.decode."""
+    # Bits de datos recuperados (None si la trama se rechaza)
+    data: Optional[BitFrame]
+    # Motivo del rechazo (None si se decodificó)
+    error: Optional[str] = None
+    # Campos propios del algoritmo para "details" de la respuesta
+    details: Optional[dict] = None
+    # Se detectaron errores que no se pudieron corregir aunque la trama no se
+    # rechace (p. ej. error doble en Hamming: los datos pueden estar mal)
+    uncorrectable: bool = False
+
+
+class BatchDecoded(NamedTuple):
+    """Resultado común de Codec.decode_batch, alineado con el orden de entrada."""
+    # Motivo del rechazo por trama (None = aceptada)
+    errors: List[Optional[str]]
+    # Bits de datos por trama ('0'/'1' o BitFrame; sin valor si se rechazó)
+    data: Sequence[Union[str, BitFrame, None]]
+    # Como Decoded.uncorrectable
+    uncorrectable: Sequence[bool]
+
+
+class Outcome(NamedTuple):
+    """Qué le pasó a una trama, para métricas y resúmenes (Codec.classify)."""
+    corrected: bool = False
+    uncorrectable: bool = False
+    # El códec encontró errores del canal (corregidos o no)
+    detected: bool = False
+
+
+class Codec(ABC):
+    """
+    Interfaz de un códec. Las subclases definen los atributos de clase y
+    decode/decode_batch/encode/overhead; una subclase a la que le falte
+    alguno no se puede instanciar (ni registrar).
+    """
+    name = ""
+    # Nombre para los mensajes de tests.py ("Hamming: ...")
+    label = ""
+    detects = True
+    corrects = False
+    # Mensaje de tests.py cuando la trama se acepta
+    ok_message = ""
+
+    @property
+    def wire_id(self) -> Optional[int]:
+        """Id en el formato binario (wire.ALGORITHM_IDS); None si no viaja en binario."""
+        return wire.ALGORITHM_IDS.get(self.name)
+
+    @abstractmethod
+    def decode(self, bits: BitFrame, log: LogFn = None) -> Decoded:
+        ...
+
+    @abstractmethod
+    def decode_batch(self, frames: Iterable[Union[str, BitFrame]]) -> BatchDecoded:
+        """Decodifica un lote de tramas de una vez (sin "details")."""
+
+    @abstractmethod
+    def encode(self, data: Union[str, BitFrame]) -> Union[str, BitFrame]:
+        ...
+
+    @abstractmethod
+    def overhead(self, data_bits: int) -> int:
+        """Bits redundantes que agrega el códec a `data_bits` bits de datos."""
+
+    def classify(self, ok: bool, details: Optional[dict]) -> Outcome:
+        """
+        Resultado de una trama a partir de su status (ok) y sus "details"
+        (los de Decoded, o los de la respuesta de app.py, que los incluyen).
+        Por defecto, para los códecs que solo detectan: hay error detectado
+        si la trama se verificó (trae details) y no coincidió; una trama
+        inválida o muy corta no cuenta.
+        """
+        return Outcome(detected=not ok and bool(details))
+
+    def latency(self, data_bits: int) -> int:
+        """Bits que hay que recibir antes de entregar el primer dato (por defecto, toda la trama)."""
+        return data_bits + self.overhead(data_bits)
+
+    def __repr__(self) -> str:
+        return f"<Codec {self.name}>"
+
+
+class HammingCodec(Codec):
+    name = "hamming"
+    label = "Hamming"
+    corrects = True
+    ok_message = "Decodificación exitosa"
+
+    def decode(self, bits: BitFrame, log: LogFn = None) -> Decoded:
+        result = hamming.hamming_decode(bits, log=log)
+        if result.error:
+            # Síndrome fuera de rango: no corregible, igual que en decode_batch
+            return Decoded(None, result.error, uncorrectable=result.uncorrectable)
+        return Decoded(result.data, details={
+            "syndrome": result.syndrome,
+            "corrected_positions": result.corrected_positions,
+            "uncorrectable": result.uncorrectable,
+            "double_error": result.double_error
+        }, uncorrectable=result.uncorrectable)
+
+    def decode_batch(self, frames):
+        batch = hamming.decode_batch(frames)
+        return BatchDecoded(batch.errors, batch.data, batch.uncorrectable)
+
+    def classify(self, ok: bool, details: Optional[dict]) -> Outcome:
+        details = details or {}
+        corrected = bool(details.get("corrected_positions"))
+        # Rechazada (síndrome fuera de rango) o error doble
+        uncorrectable = not ok or bool(details.get("uncorrectable"))
+        return Outcome(corrected, uncorrectable, corrected or uncorrectable)
+
+    def encode(self, data):
+        return hamming.hamming_encode(data)
+
+    def overhead(self, data_bits: int) -> int:
+        # Mismo cálculo que el emisor (calculateOverhead) más el bit de
+        # paridad global si SECDED está activo: el largo de hamming_encode
+        r = 0
+        while (1 << r) < data_bits + r + 1:
+            r += 1
+        return r + 1 if hamming.USE_SECDED else r
+
+
+class Fletcher16Codec(Codec):
+    name = "fletcher16"
+    label = "Fletcher-16"
+    ok_message = "Verificación exitosa"
+
+    def decode(self, bits: BitFrame, log: LogFn = None) -> Decoded:
+        try:
+            result = fletcher16.fletcher16_decode(bits, log=log)
+        except ValueError as e:
+            return Decoded(None, str(e))
+        checksums = {
+            "received_checksum": result.received_checksum,
+            "calculated_checksum": result.calculated_checksum
+        }
+        if not result.ok:
+            return Decoded(None, fletcher16.CHECKSUM_MISMATCH, checksums)
+        return Decoded(result.data, details=checksums)
+
+    def decode_batch(self, frames):
+        batch = fletcher16.decode_batch(frames)
+        errors = [None if ok else (error or fletcher16.CHECKSUM_MISMATCH)
+                  for ok, error in zip(batch.ok, batch.errors)]
+        return BatchDecoded(errors, batch.data, [False] * len(errors))
+
+    def encode(self, data):
+        return fletcher16.fletcher16_encode(data)
+
+    def overhead(self, data_bits: int) -> int:
+        return 16
+
+
+class CrcCodec(Codec):
+    """CRC-32 (IEEE) o CRC-16-CCITT según `width`; solo detecta."""
+
+    def __init__(self, width: int):
+        self.width = width
+        self.name = f"crc{width}"
+        self.label = crc.CRC_WIDTHS[width]
+        self.ok_message = "Verificación exitosa"
+
+    def decode(self, bits: BitFrame, log: LogFn = None) -> Decoded:
+        try:
+            result = crc.crc_decode(bits, self.width, log=log)
+        except ValueError as e:
+            return Decoded(None, str(e))
+        crcs = {
+            "received_crc": result.received_crc,
+            "calculated_crc": result.calculated_crc
+        }
+        if not result.ok:
+            return Decoded(None, crc.CRC_MISMATCH, crcs)
+        return Decoded(result.data, details=crcs)
+
+    def decode_batch(self, frames):
+        batch = crc.decode_batch(frames, self.width)
+        errors = [None if ok else (error or crc.CRC_MISMATCH)
+                  for ok, error in zip(batch.ok, batch.errors)]
+        return BatchDecoded(errors, batch.data, [False] * len(errors))
+
+    def encode(self, data):
+        return crc.crc_encode(data, self.width)
+
+    def overhead(self, data_bits: int) -> int:
+        return self.width
+
+
+class HammingBlockedCodec(Codec):
+    """
+    Hamming SECDED por bloques de `k` bits de datos (hamming/blocked.py),
+    opcionalmente entrelazado en bloques de `depth` palabras (None = toda la
+    trama). La trama no lleva el largo de los datos: se codifican los datos
+    seguidos de un bit en 1 y el último bloque se rellena con ceros; al
+    decodificar se quita todo desde el último 1, así los datos vuelven con
+    su largo exacto (sin NUL en decoded_text).
+    """
+    corrects = True
+    ok_message = "Decodificación exitosa"
+
+    def __init__(self, k: int = blocked.DEFAULT_BLOCK, interleaved: bool = False,
+                 depth: Optional[int] = None):
+        self.layout = blocked.block_layout(k)
+        self.interleaved = interleaved
+        self.depth = depth
+        self.name = "hamming_interleaved" if interleaved else "hamming_blocked"
+        self.label = "Hamming entrelazado" if interleaved else "Hamming por bloques"
+
+    def decode(self, bits: BitFrame, log: LogFn = None) -> Decoded:
+        try:
+            if self.interleaved:
+                bits = interleaver.deinterleave(bits, self.layout.n, self.depth)
+            result = blocked.hamming_blocked(bits, self.layout.k)
+        except ValueError as e:
+            return Decoded(None, str(e))
+        if log:
+            log(f"Bloques: {result.blocks}, corregidos: {result.corrected_blocks}, "
+                f"no corregibles: {result.uncorrectable_blocks}")
+        details = {
+            "blocks": result.blocks,
+            "corrected_blocks": result.corrected_blocks,
+            "uncorrectable_blocks": result.uncorrectable_blocks
+        }
+        data = as_bitframe(result.data)
+        if not data.value:
+            return Decoded(None, BLOCKED_PADDING_ERROR, details, uncorrectable=True)
+        # Ceros de relleno más el bit de fin de datos
+        tail = (data.value & -data.value).bit_length()
+        return Decoded(BitFrame(data.value >> tail, len(data) - tail), details=details,
+                       uncorrectable=not result.ok)
+
+    def decode_batch(self, frames):
+        batch = BatchDecoded([], [], [])
+        for frame in frames:
+            try:
+                decoded = self.decode(as_bitframe(frame))
+            except ValueError as e:
+                decoded = Decoded(None, str(e))
+            batch.errors.append(decoded.error)
+            batch.data.append(decoded.data)
+            batch.uncorrectable.append(decoded.uncorrectable)
+        return batch
+
+    def classify(self, ok: bool, details: Optional[dict]) -> Outcome:
+        details = details or {}
+        corrected = bool(details.get("corrected_blocks"))
+        uncorrectable = bool(details.get("uncorrectable_blocks"))
+        return Outcome(corrected, uncorrectable, corrected or uncorrectable)
+
+    def encode(self, data):
+        bits = as_bitframe(data)
+        code = blocked.hamming_blocked_encode(BitFrame(bits.value << 1 | 1, len(bits) + 1), self.layout.k)
+        if self.interleaved:
+            code = interleaver.interleave(code, self.layout.n, self.depth)
+        return code if isinstance(data, BitFrame) else code.to_bits()
+
+    def _encoded_bits(self, data_bits: int) -> int:
+        # Datos + bit de fin de datos, en bloques completos
+        return -(-(data_bits + 1) // self.layout.k) * self.layout.n
+
+    def overhead(self, data_bits: int) -> int:
+        return self._encoded_bits(data_bits) - data_bits
+
+    def latency(self, data_bits: int) -> int:
+        encoded = self._encoded_bits(data_bits)
+        if self.interleaved:
+            return interleaver.interleave_latency(encoded, self.layout.n, self.depth)
+        return min(self.layout.n, encoded)
+
+
+# -------- registro ----------
+# Tabla de despacho nombre -> códec (la ruta caliente es un dict.get)
+CODECS: Dict[str, Codec] = {}
+
+
+def register(codec: Codec) -> Codec:
+    """Registra un códec; su id binario, si tiene, está en wire.ALGORITHM_IDS."""
+    if not isinstance(codec, Codec):
+        raise TypeError(f"No es un Codec: {codec!r}")
+    if not codec.name:
+        raise ValueError(f"Códec sin nombre: {codec!r}")
+    if codec.name in CODECS:
+        raise ValueError(f"Códec ya registrado: {codec.name}")
+    CODECS[codec.name] = codec
+    return codec
+
+
+def get_codec(name: str) -> Optional[Codec]:
+    return CODECS.get(name)
+
+
+register(HammingCodec())
+register(Fletcher16Codec())
+register(CrcCodec(32))
+register(CrcCodec(16))
+register(HammingBlockedCodec(BLOCKED_DATA_BITS))
+register(HammingBlockedCodec(BLOCKED_DATA_BITS, interleaved=True))
+
+
+# -------- serialización de respuestas ----------
+# Un JSONEncoder construido una vez (json.dumps crea uno por llamada si se
+# le pasan opciones) y orjson si se pide explícitamente
+_JSON = json.JSONEncoder()
+
+
+def _orjson_encode(obj) -> str:
+    try:
+        return orjson.dumps(obj).decode("utf-8")
+    except TypeError:  # p. ej. enteros de más de 64 bits
+        return _JSON.encode(obj)
+
+
+def response_encoder(name: str = "json") -> Callable[[object], str]:
+    """
+    Serializador de respuestas: "json" (por defecto: exactamente la salida
+    de json.dumps), "orjson" o "auto" (orjson si está instalado). orjson
+    produce JSON compacto y sin escapes \\uXXXX, así que cambia los bytes que
+    reciben los clientes.
+    """
+    if name not in ("auto", "orjson", "json"):
+        raise ValueError(f"Serializador no soportado: {name} (use auto, orjson o json)")
+    if name == "orjson" and orjson is None:
+        raise ValueError("orjson no está instalado")
+    if name != "json" and orjson is not None:
+        return _orjson_encode
+    return _JSON.encode
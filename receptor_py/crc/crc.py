@@ -0,0 +1,242 @@
+# CRC-32 (IEEE 802.3, el de zlib/Ethernet) y CRC-16-CCITT (poly 0x1021,
+# init 0xFFFF, sin reflejar: "CCITT-FALSE") para el receptor.
+#
+# La trama es datos + CRC de 32 o 16 bits al final, como en Fletcher-16. El
+# CRC se calcula sobre los datos empaquetados MSB primero (rellenando con
+# ceros a múltiplo de 8).
+#
+# Las tablas se precalculan al importar. crc32_python/crc16_python usan
+# slicing-by-8 (8 tablas, 8 bytes por iteración) y son la referencia. La
+# ruta rápida de CRC-32 es zlib.crc32 (C, mismo CRC); la de CRC-16 es el
+# núcleo slicing-by-8 de native/_kernels.c si está compilado y, si no,
+# binascii.crc_hqx (C, de a un byte).
+
+import binascii
+import struct
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from bitframe.bitframe import BitFrame, BytesLike, as_bitframe, bits_to_bytes
+from native.loader import load_kernels
+
+try:
+    import zlib
+except ImportError:  # Python sin zlib: slicing-by-8 en Python
+    zlib = None
+
+native = load_kernels()
+
+LogFn = Optional[Callable[[str], None]]
+
+# Polinomio de CRC-32 reflejado (0x04C11DB7 invertido bit a bit)
+CRC32_POLY = 0xEDB88320
+CRC16_POLY = 0x1021
+CRC16_INIT = 0xFFFF
+
+# Ancho en bits -> nombre del algoritmo
+CRC_WIDTHS = {32: "CRC-32", 16: "CRC-16"}
+CRC_MISMATCH = "✗ Error CRC detectado - CRC no coincide"
+
+_WORDS = struct.Struct("<II")
+_BLOCKS16 = struct.Struct(">Q")
+
+Tables = Tuple[Tuple[int, ...], ...]
+
+
+@dataclass
+class CrcResult:
+    """Resultado de crc_decode."""
+    data: Union[str, BitFrame]
+    width: int
+    received_crc: int
+    calculated_crc: int
+
+    @property
+    def ok(self) -> bool:
+        return self.received_crc == self.calculated_crc
+
+    @property
+    def detected(self) -> bool:
+        return not self.ok
+
+
+@dataclass
+class CrcBatchResult:
+    """Resultado de decode_batch, alineado con el orden de entrada."""
+    # Bits de datos (sin el CRC); None si la trama no se pudo verificar
+    data: List[Optional[BitFrame]]
+    received_crcs: List[int]
+    calculated_crcs: List[int]
+    ok: List[bool]
+    # Motivo por trama si no se pudo verificar (p. ej. trama muy corta)
+    errors: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.ok)
+
+
+# -------- tablas ----------
+def _crc32_tables() -> Tables:
+    """T[0] es la tabla clásica; T[k][b] = CRC de b seguido de k bytes en cero."""
+    base = []
+    for b in range(256):
+        crc = b
+        for _ in range(8):
+            crc = (crc >> 1) ^ (CRC32_POLY if crc & 1 else 0)
+        base.append(crc)
+    tables = [base]
+    for _ in range(7):
+        prev = tables[-1]
+        tables.append([(prev[b] >> 8) ^ base[prev[b] & 0xFF] for b in range(256)])
+    return tuple(tuple(t) for t in tables)
+
+
+def _crc16_tables() -> Tables:
+    """Igual que _crc32_tables pero MSB primero (CRC sin reflejar)."""
+    base = []
+    for b in range(256):
+        crc = b << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ (CRC16_POLY if crc & 0x8000 else 0)) & 0xFFFF
+        base.append(crc)
+    tables = [base]
+    for _ in range(7):
+        prev = tables[-1]
+        tables.append([((prev[b] << 8) & 0xFFFF) ^ base[prev[b] >> 8] for b in range(256)])
+    return tuple(tuple(t) for t in tables)
+
+
+CRC32_TABLES = _crc32_tables()
+CRC16_TABLES = _crc16_tables()
+
+
+# -------- cálculo ----------
+def crc32_python(data: BytesLike, crc: int = 0) -> int:
+    """
+    CRC-32 con slicing-by-8; `crc` continúa un cálculo anterior (misma
+    convención que zlib.crc32).
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = CRC32_TABLES
+    data = memoryview(data).cast("B")
+    crc ^= 0xFFFFFFFF
+    bulk = len(data) & ~7
+    for lo, hi in _WORDS.iter_unpack(data[:bulk]):
+        lo ^= crc
+        crc = (t7[lo & 0xFF] ^ t6[(lo >> 8) & 0xFF] ^ t5[(lo >> 16) & 0xFF] ^ t4[lo >> 24]
+               ^ t3[hi & 0xFF] ^ t2[(hi >> 8) & 0xFF] ^ t1[(hi >> 16) & 0xFF] ^ t0[hi >> 24])
+    for b in data[bulk:]:
+        crc = (crc >> 8) ^ t0[(crc ^ b) & 0xFF]
+    return crc ^ 0xFFFFFFFF
+
+
+def crc16_python(data: BytesLike, crc: int = CRC16_INIT) -> int:
+    """CRC-16-CCITT con slicing-by-8; `crc` continúa un cálculo anterior."""
+    t0, t1, t2, t3, t4, t5, t6, t7 = CRC16_TABLES
+    data = memoryview(data).cast("B")
+    bulk = len(data) & ~7
+    for (block,) in _BLOCKS16.iter_unpack(data[:bulk]):
+        # El CRC (16 bits) se combina con los 2 primeros bytes del bloque
+        block ^= crc << 48
+        crc = (t7[block >> 56] ^ t6[(block >> 48) & 0xFF] ^ t5[(block >> 40) & 0xFF]
+               ^ t4[(block >> 32) & 0xFF] ^ t3[(block >> 24) & 0xFF] ^ t2[(block >> 16) & 0xFF]
+               ^ t1[(block >> 8) & 0xFF] ^ t0[block & 0xFF])
+    for b in data[bulk:]:
+        crc = ((crc << 8) & 0xFFFF) ^ t0[(crc >> 8) ^ b]
+    return crc
+
+
+def crc32(data: BytesLike, crc: int = 0) -> int:
+    if zlib is not None:
+        return zlib.crc32(data, crc)
+    return crc32_python(data, crc)
+
+
+def crc16(data: BytesLike, crc: int = CRC16_INIT) -> int:
+    if native is not None:
+        return native.crc16_ccitt(data, crc)
+    return binascii.crc_hqx(data, crc)
+
+
+CRC_FUNCTIONS = {32: crc32, 16: crc16}
+
+
+def crc_checksum(data: BytesLike, width: int = 32) -> int:
+    """CRC de `width` bits (32 o 16) de `data`."""
+    try:
+        return CRC_FUNCTIONS[width](data)
+    except KeyError:
+        raise ValueError(f"Ancho de CRC no soportado: {width} (use 32 o 16)") from None
+
+
+# -------- tramas ----------
+def crc_encode(data_bits: Union[str, BitFrame], width: int = 32) -> Union[str, BitFrame]:
+    """Datos + CRC de `width` bits (mismo tipo que la entrada)."""
+    bits = as_bitframe(data_bits)
+    crc = crc_checksum(bits_to_bytes(bits), width)
+    frame = BitFrame((bits.value << width) | crc, len(bits) + width)
+    return frame if isinstance(data_bits, BitFrame) else frame.to_bits()
+
+
+def crc_decode(frame: Union[str, BitFrame], width: int = 32, log: LogFn = None) -> CrcResult:
+    """
+    Verifica una trama datos + CRC sin imprimir ni lanzar excepción por CRC
+    incorrecto: el resultado indica si coincide (`ok`).
+
+    Raises:
+        ValueError: Si la trama es más corta que el CRC o el ancho no es 32/16
+    """
+    if width not in CRC_FUNCTIONS:
+        raise ValueError(f"Ancho de CRC no soportado: {width} (use 32 o 16)")
+    bits = as_bitframe(frame)
+    if len(bits) < width:
+        raise ValueError(f"Trama muy corta para {CRC_WIDTHS[width]}")
+
+    data_bits = bits.head(len(bits) - width)
+    received = bits.value & ((1 << width) - 1)
+    calculated = CRC_FUNCTIONS[width](data_bits.to_bytes())
+
+    if log:
+        digits = width // 4
+        log(f"Datos recibidos: {data_bits}")
+        log(f"CRC recibido: {received:0{digits}X}")
+        log(f"CRC calculado: {calculated:0{digits}X}")
+        log(f"✓ Verificación {CRC_WIDTHS[width]} exitosa" if received == calculated else CRC_MISMATCH)
+
+    return CrcResult(
+        data=data_bits if isinstance(frame, BitFrame) else data_bits.to_bits(),
+        width=width,
+        received_crc=received,
+        calculated_crc=calculated,
+    )
+
+
+def decode_batch(frames: Iterable[Union[str, BitFrame]], width: int = 32) -> CrcBatchResult:
+    """
+    Verifica una columna de tramas (lista, pandas.Series, ...). Cada CRC ya
+    corre en C, así que basta un recorrido sin construir CrcResult.
+    """
+    if width not in CRC_FUNCTIONS:
+        raise ValueError(f"Ancho de CRC no soportado: {width} (use 32 o 16)")
+    checksum = CRC_FUNCTIONS[width]
+    mask = (1 << width) - 1
+    short = f"Trama muy corta para {CRC_WIDTHS[width]}"
+    batch = CrcBatchResult([], [], [], [], [])
+    for frame in frames:
+        try:
+            bits = as_bitframe(frame)
+        except (TypeError, ValueError) as e:
+            data, received, calculated, error = None, 0, 0, str(e)
+        else:
+            if len(bits) < width:
+                data, received, calculated, error = None, 0, 0, short
+            else:
+                data = bits.head(len(bits) - width)
+                received = bits.value & mask
+                calculated = checksum(data.to_bytes())
+                error = None
+        batch.data.append(data)
+        batch.received_crcs.append(received)
+        batch.calculated_crcs.append(calculated)
+        batch.ok.append(error is None and received == calculated)
+        batch.errors.append(error)
+    return batch
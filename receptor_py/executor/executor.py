@@ -0,0 +1,91 @@
+# Ejecución de la decodificación fuera del event loop de asyncio.
+# Decodificar es trabajo de CPU: hacerlo dentro de la corrutina frena a todas
+# las conexiones. DecodePool decide, según el tamaño de la trama, si corre
+# en línea o en un pool de hilos/procesos, y limita cuántas tareas hay en
+# vuelo para aplicar contrapresión a los emisores.
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+KINDS = ("inline", "thread", "process")
+
+
+class DecodePool:
+    """
+    Backend de ejecución configurable.
+
+    Args:
+        kind: "inline" (en la corrutina), "thread" o "process"
+        workers: hilos/procesos del pool (por defecto, núcleos disponibles)
+        offload_bits: tamaño mínimo (en bits) para mandar el trabajo al pool;
+            las tramas pequeñas cuestan menos en línea que el viaje al pool
+        max_inflight: tareas simultáneas en el pool; al llenarse, los
+            handlers esperan y dejan de leer de su socket
+    """
+
+    def __init__(self, kind: str = "inline", workers: Optional[int] = None,
+                 offload_bits: int = 4096, max_inflight: int = 64):
+        if kind not in KINDS:
+            raise ValueError(f"Executor no soportado: {kind} (use {', '.join(KINDS)})")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.offload_bits = offload_bits
+        self.max_inflight = max_inflight
+        self.inflight = 0
+        self._slots = asyncio.Semaphore(max_inflight)
+        self._executor: Optional[Executor] = None
+
+    @classmethod
+    def from_env(cls) -> "DecodePool":
+        """Configura el pool con WS_EXECUTOR, WS_WORKERS, WS_OFFLOAD_BITS y WS_MAX_INFLIGHT."""
+        return cls(
+            kind=os.getenv("WS_EXECUTOR", "inline").strip().lower(),
+            workers=int(os.getenv("WS_WORKERS", "0")) or None,
+            offload_bits=int(os.getenv("WS_OFFLOAD_BITS", "4096")),
+            max_inflight=int(os.getenv("WS_MAX_INFLIGHT", "64")),
+        )
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        """Crea el pool al primer uso (los procesos no se lanzan si nunca hacen falta)."""
+        if self._executor is None and self.kind != "inline":
+            if self.kind == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def should_offload(self, size_bits: int) -> bool:
+        return self.kind != "inline" and size_bits >= self.offload_bits
+
+    async def run(self, fn: Callable, *args, size_bits: int = 0):
+        """Ejecuta fn(*args) en línea o en el pool según el tamaño."""
+        if not self.should_offload(size_bits):
+            return fn(*args)
+        async with self._slots:
+            self.inflight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, fn, *args)
+            finally:
+                self.inflight -= 1
+
+    async def map_chunks(self, fn: Callable[[list], list], items: list,
+                         size_bits: int = 0) -> List:
+        """
+        Aplica fn (que recibe y devuelve una lista) repartiendo `items` en
+        trozos contiguos, uno por worker, y concatena los resultados en orden.
+        """
+        if not self.should_offload(size_bits) or len(items) < 2:
+            return fn(items)
+        step = -(-len(items) // self.workers)
+        chunks = [items[i:i + step] for i in range(0, len(items), step)]
+        parts = await asyncio.gather(*(self.run(fn, chunk, size_bits=size_bits) for chunk in chunks))
+        return [result for part in parts for result in part]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
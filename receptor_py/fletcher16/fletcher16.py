@@ -1,71 +1,368 @@
 # Entrada: cadena binaria = datos + 16 bits de checksum
 # Salida: imprime según enunciado y devuelve el mensaje "limpio" (sin checksum) si procede
 
-def _bin_to_bytes(bits: str):
-    pad = (8 - (len(bits) % 8)) % 8
-    padded = bits + ("0" * pad)
-    return [int(padded[i:i+8], 2) for i in range(0, len(padded), 8)]
-
-def bin_to_bytes(bits: str) -> list[int]:
-    """Convierte cadena binaria a lista de bytes"""
-    # Pad a múltiplos de 8
-    pad = (8 - (len(bits) % 8)) % 8
-    padded = bits + "0" * pad
-    bytes_list = []
-    for i in range(0, len(padded), 8):
-        bytes_list.append(int(padded[i:i+8], 2))
-    return bytes_list
-
-def _fletcher16_compute(data_bits: str) -> int:
-    bytes_ = _bin_to_bytes(data_bits)
-    sum1 = 0
-    sum2 = 0
-    for b in bytes_:
-        sum1 = (sum1 + b) % 255
-        sum2 = (sum2 + sum1) % 255
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+from bitframe.bitframe import INVALID_BITS, BitFrame, BytesLike, as_bitframe, bits_matrix, bits_to_bytes
+from native.loader import load_kernels
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy se usa solo el núcleo por bloques
+    np = None
+
+# Núcleos en C si están compilados (python native/build.py); si no, None
+native = load_kernels()
+
+# Bytes que se pueden acumular antes de reducir módulo 255 sin que sum2
+# desborde 32 bits (cota clásica de Fletcher); mantiene los enteros pequeños
+FLETCHER16_BLOCK = 5802
+# A partir de este tamaño conviene la ruta vectorizada con NumPy
+NUMPY_THRESHOLD = 1 << 12
+# Bloque de la ruta NumPy: la suma de prefijos cabe holgada en int64
+_NUMPY_BLOCK = 1 << 20
+
+# Callback opcional para diagnósticos (p. ej. print); None = sin salida
+LogFn = Optional[Callable[[str], None]]
+
+CHECKSUM_MISMATCH = "✗ Error Fletcher-16 detectado - Checksum no coincide"
+
+@dataclass
+class Fletcher16Result:
+    """Resultado estructurado de verificar una trama Fletcher-16."""
+    # None en la verificación incremental (Fletcher16Verifier no guarda los datos)
+    data: Optional[Union[str, BitFrame]]
+    received_checksum: int
+    calculated_checksum: int
+
+    @property
+    def ok(self) -> bool:
+        return self.received_checksum == self.calculated_checksum
+
+    @property
+    def detected(self) -> bool:
+        return not self.ok
+
+@dataclass
+class Fletcher16BatchResult:
+    """
+    Resultado de decode_batch, alineado con el orden de entrada.
+    Los arreglos son de NumPy (listas si NumPy no está disponible).
+    """
+    data: List[str]
+    received_checksums: object
+    calculated_checksums: object
+    ok: object
+    # Motivo por trama si no se pudo verificar (p. ej. trama muy corta)
+    errors: List[Optional[str]]
+
+    @property
+    def detected(self):
+        if np is not None and isinstance(self.ok, np.ndarray):
+            return ~self.ok
+        return [not ok for ok in self.ok]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+def bin_to_bytes(bits: Union[str, BitFrame]) -> list[int]:
+    """Convierte cadena binaria a lista de bytes (rellena con ceros a múltiplo de 8)"""
+    return list(bits_to_bytes(bits))
+
+def fletcher16_sums(data: BytesLike, sum1: int = 0, sum2: int = 0) -> Tuple[int, int]:
+    """
+    Núcleo de Fletcher-16: devuelve (sum1, sum2) ya reducidos módulo 255.
+
+    En lugar de reducir en cada byte se acumula por bloques de hasta
+    FLETCHER16_BLOCK bytes: sum1 crece con la suma del bloque y sum2 con la
+    suma de los prefijos, y solo entonces se aplica el módulo. El resultado
+    es idéntico al bucle byte a byte.
+    """
+    if native is not None:
+        return native.fletcher16_sums(data, sum1, sum2)
+    if np is not None and len(data) >= NUMPY_THRESHOLD:
+        return _fletcher16_sums_numpy(data, sum1, sum2)
+    view = memoryview(data).cast("B")
+    for start in range(0, len(view), FLETCHER16_BLOCK):
+        block = view[start:start + FLETCHER16_BLOCK]
+        sum2 = (sum2 + sum1 * len(block) + sum(accumulate(block))) % 255
+        sum1 = (sum1 + sum(block)) % 255
+    return sum1, sum2
+
+def _fletcher16_sums_numpy(data: BytesLike, sum1: int, sum2: int) -> Tuple[int, int]:
+    """Variante vectorizada: sumas acumuladas de NumPy por bloques grandes."""
+    arr = np.frombuffer(data, dtype=np.uint8)
+    for start in range(0, arr.size, _NUMPY_BLOCK):
+        block = arr[start:start + _NUMPY_BLOCK]
+        prefix = np.cumsum(block, dtype=np.int64)
+        sum2 = (sum2 + sum1 * block.size + int(prefix.sum())) % 255
+        sum1 = (sum1 + int(prefix[-1])) % 255
+    return sum1, sum2
+
+def fletcher16_checksum(data: BytesLike) -> int:
+    """Checksum Fletcher-16 de una secuencia de bytes."""
+    sum1, sum2 = fletcher16_sums(data)
     return (sum2 << 8) | sum1  # 16-bit checksum
 
-def fletcher16_receive(frame: str) -> str:
+class Fletcher16Verifier:
     """
-    Verifica y decodifica una trama Fletcher-16.
-    
-    Args:
-        frame: Cadena binaria con datos + checksum de 16 bits
-        
-    Returns:
-        str: Datos originales si la verificación es correcta
-        
+    Fletcher-16 incremental: los datos llegan por partes (fragmentos de
+    WebSocket, bloques de un archivo) y nunca se guardan completos.
+
+        verifier = Fletcher16Verifier()
+        for chunk in chunks:
+            verifier.update(chunk)          # bytes; update_bits() para '0'/'1'
+        result = verifier.finalize(trailer) # checksum recibido (16 bits)
+
+    Los bits que no completan un byte quedan pendientes y, al final, se
+    rellenan con ceros igual que en fletcher16_decode. Dos verificadores de
+    segmentos consecutivos se unen con combine(), así que partes de un
+    payload grande se pueden procesar en núcleos distintos.
+    """
+
+    __slots__ = ("sum1", "sum2", "nbytes", "_pending", "_pending_len")
+
+    def __init__(self):
+        self.sum1 = 0
+        self.sum2 = 0
+        # Bytes completos acumulados (sin contar los bits pendientes)
+        self.nbytes = 0
+        self._pending = 0
+        self._pending_len = 0
+
+    def update(self, chunk: BytesLike) -> "Fletcher16Verifier":
+        """Agrega bytes de datos."""
+        if self._pending_len:
+            return self.update_bits(BitFrame.from_bytes(chunk))
+        view = memoryview(chunk).cast("B")
+        self.sum1, self.sum2 = fletcher16_sums(view, self.sum1, self.sum2)
+        self.nbytes += len(view)
+        return self
+
+    def update_bits(self, bits: Union[str, BitFrame]) -> "Fletcher16Verifier":
+        """Agrega bits de datos; no tienen que venir alineados a byte."""
+        frame = as_bitframe(bits)
+        total = self._pending_len + len(frame)
+        value = (self._pending << len(frame)) | frame.value
+        rest = total % 8
+        self._pending = value & ((1 << rest) - 1)
+        self._pending_len = rest
+        if total >= 8:
+            whole = BitFrame(value >> rest, total - rest).to_bytes()
+            self.sum1, self.sum2 = fletcher16_sums(whole, self.sum1, self.sum2)
+            self.nbytes += len(whole)
+        return self
+
+    @property
+    def checksum(self) -> int:
+        """Checksum de lo recibido hasta ahora (con el byte pendiente relleno)."""
+        sum1, sum2 = self.sum1, self.sum2
+        if self._pending_len:
+            last = self._pending << (8 - self._pending_len)
+            sum1 = (sum1 + last) % 255
+            sum2 = (sum2 + sum1) % 255
+        return (sum2 << 8) | sum1
+
+    def finalize(self, trailer: Union[int, BytesLike, str, BitFrame]) -> Fletcher16Result:
+        """
+        Compara con el checksum recibido: entero, 2 bytes o 16 bits.
+
+        Raises:
+            ValueError: Si el trailer no tiene 16 bits
+        """
+        if isinstance(trailer, int):
+            received = trailer
+        elif isinstance(trailer, (str, BitFrame)):
+            trailer = as_bitframe(trailer)
+            if len(trailer) != 16:
+                raise ValueError("El checksum Fletcher-16 debe tener 16 bits")
+            received = trailer.value
+        else:
+            if len(trailer) != 2:
+                raise ValueError("El checksum Fletcher-16 debe tener 2 bytes")
+            received = int.from_bytes(trailer, "big")
+        if not 0 <= received <= 0xFFFF:
+            raise ValueError("El checksum Fletcher-16 debe tener 16 bits")
+        return Fletcher16Result(data=None, received_checksum=received,
+                                calculated_checksum=self.checksum)
+
+    def combine(self, other: "Fletcher16Verifier") -> "Fletcher16Verifier":
+        """
+        Verificador equivalente a procesar los datos de `self` y luego los
+        de `other` (cada uno empezado desde cero):
+        sum1 = a1 + b1, sum2 = a2 + len(b) * a1 + b2 (módulo 255).
+
+        Raises:
+            ValueError: Si `self` tiene bits pendientes (el corte no cae en un byte)
+        """
+        if self._pending_len:
+            raise ValueError("Solo se pueden combinar segmentos alineados a byte")
+        combined = Fletcher16Verifier()
+        combined.sum1 = (self.sum1 + other.sum1) % 255
+        combined.sum2 = (self.sum2 + other.nbytes * self.sum1 + other.sum2) % 255
+        combined.nbytes = self.nbytes + other.nbytes
+        combined._pending = other._pending
+        # Los bits pendientes de `other` siguen quedando al final
+        combined._pending_len = other._pending_len
+        return combined
+
+def _segment_verifier(segment: bytes) -> Fletcher16Verifier:
+    return Fletcher16Verifier().update(segment)
+
+def fletcher16_checksum_parallel(data: BytesLike, executor: Executor, parts: int) -> int:
+    """
+    Checksum de un payload grande repartido en `parts` segmentos que el
+    executor (hilos o procesos) procesa por separado y luego se combinan.
+    """
+    view = memoryview(data).cast("B")
+    step = max(1, -(-len(view) // max(1, parts)))
+    segments = [bytes(view[start:start + step]) for start in range(0, len(view), step)]
+    total = Fletcher16Verifier()
+    for verifier in executor.map(_segment_verifier, segments):
+        total = total.combine(verifier)
+    return total.checksum
+
+def _fletcher16_compute(data_bits: Union[str, BitFrame]) -> int:
+    return fletcher16_checksum(bits_to_bytes(data_bits))
+
+def fletcher16_encode(data_bits: Union[str, BitFrame]) -> Union[str, BitFrame]:
+    """Datos + checksum de 16 bits, igual que el emisor (mismo tipo que la entrada)."""
+    bits = as_bitframe(data_bits)
+    checksum = _fletcher16_compute(bits)
+    frame = BitFrame((bits.value << 16) | checksum, len(bits) + 16)
+    return frame if isinstance(data_bits, BitFrame) else frame.to_bits()
+
+def fletcher16_decode(frame: Union[str, BitFrame], log: LogFn = None) -> Fletcher16Result:
+    """
+    Verifica una trama Fletcher-16 sin imprimir nada ni lanzar excepción
+    por checksum incorrecto: el resultado indica si coincide (`ok`).
+    Los diagnósticos solo se formatean si se pasa `log`.
+
     Raises:
-        ValueError: Si hay error en el checksum
+        ValueError: Si la trama es más corta que el checksum
     """
-    if len(frame) < 16:
+    bits = as_bitframe(frame)
+    if len(bits) < 16:
         raise ValueError("Trama muy corta para Fletcher-16")
     
     # Separar datos y checksum
-    data_bits = frame[:-16]
-    received_checksum = int(frame[-16:], 2)
+    data_bits = bits.head(len(bits) - 16)
+    received_checksum = bits.value & 0xFFFF
     
-    print(f"Datos recibidos: {data_bits}")
-    print(f"Checksum recibido: {received_checksum:016b} ({received_checksum})")
+    if log:
+        log(f"Datos recibidos: {data_bits}")
+        log(f"Checksum recibido: {received_checksum:016b} ({received_checksum})")
     
     # Calcular checksum de los datos recibidos
-    bytes_data = bin_to_bytes(data_bits)
-    sum1 = 0
-    sum2 = 0
-    
-    for b in bytes_data:
-        sum1 = (sum1 + b) % 255
-        sum2 = (sum2 + sum1) % 255
+    calculated_checksum = _fletcher16_compute(data_bits)
     
-    calculated_checksum = (sum2 << 8) | sum1
+    if log:
+        log(f"Checksum calculado: {calculated_checksum:016b} ({calculated_checksum})")
+        if received_checksum == calculated_checksum:
+            log("✓ Verificación Fletcher-16 exitosa - No hay errores detectados")
+        else:
+            log(CHECKSUM_MISMATCH)
     
-    print(f"Checksum calculado: {calculated_checksum:016b} ({calculated_checksum})")
+    return Fletcher16Result(
+        data=data_bits if isinstance(frame, BitFrame) else data_bits.to_bits(),
+        received_checksum=received_checksum,
+        calculated_checksum=calculated_checksum,
+    )
+
+def fletcher16_receive(frame: Union[str, BitFrame]) -> Union[str, BitFrame]:
+    """
+    Verifica y decodifica una trama Fletcher-16.
     
-    # Verificar integridad
-    if received_checksum == calculated_checksum:
-        print("✓ Verificación Fletcher-16 exitosa - No hay errores detectados")
-        return data_bits
-    else:
-        error_msg = f"✗ Error Fletcher-16 detectado - Checksum no coincide"
-        print(error_msg)
-        raise ValueError(error_msg)
\ No newline at end of file
+    Args:
+        frame: Cadena binaria o BitFrame con datos + checksum de 16 bits
+        
+    Returns:
+        Datos originales si la verificación es correcta, con el mismo
+        tipo que la entrada (str o BitFrame)
+        
+    Raises:
+        ValueError: Si hay error en el checksum
+    """
+    result = fletcher16_decode(frame, log=print)
+    if not result.ok:
+        raise ValueError(CHECKSUM_MISMATCH)
+    return result.data
+
+def decode_batch(frames: Iterable[Union[str, BitFrame]]) -> Fletcher16BatchResult:
+    """
+    Verifica una columna de tramas (lista, pandas.Series, ...) de una vez.
+
+    Las tramas se agrupan por largo; cada grupo se empaqueta en una matriz
+    de bytes (tramas x bytes) y sum1/sum2 se calculan para todas las filas
+    con una suma y un producto contra los pesos (nbytes - j). Las tramas
+    más cortas que el checksum quedan con ok=False y su motivo en `errors`.
+    """
+    bits = [f.to_bits() if isinstance(f, BitFrame) else f for f in frames]
+    if np is None:
+        return _decode_batch_python(bits)
+
+    count = len(bits)
+    data = [""] * count
+    errors: List[Optional[str]] = [None] * count
+    received = np.full(count, -1, dtype=np.int64)
+    calculated = np.full(count, -1, dtype=np.int64)
+
+    groups = {}
+    for idx, frame in enumerate(bits):
+        groups.setdefault(len(frame), []).append(idx)
+
+    for n_all, rows in groups.items():
+        # Como fletcher16_decode: primero los caracteres, después el largo
+        matrix, invalid = bits_matrix([bits[idx] for idx in rows], n_all)
+        if invalid.any():
+            for j in np.nonzero(invalid)[0]:
+                errors[rows[j]] = INVALID_BITS
+            matrix = matrix[~invalid]
+            rows = [idx for idx, bad in zip(rows, invalid) if not bad]
+            if not rows:
+                continue
+        if n_all < 16:
+            for idx in rows:
+                errors[idx] = "Trama muy corta para Fletcher-16"
+            continue
+
+        n_data = n_all - 16
+        # packbits rellena con ceros a la derecha, igual que to_bytes()
+        data_bytes = np.packbits(matrix[:, :n_data], axis=1).astype(np.int64)
+        trailer = np.packbits(matrix[:, n_data:], axis=1).astype(np.int64)
+
+        nbytes = data_bytes.shape[1]
+        weights = np.arange(nbytes, 0, -1, dtype=np.int64)
+        sum1 = data_bytes.sum(axis=1) % 255
+        sum2 = (data_bytes @ weights) % 255
+
+        idx_arr = np.array(rows, dtype=np.intp)
+        received[idx_arr] = (trailer[:, 0] << 8) | trailer[:, 1]
+        calculated[idx_arr] = (sum2 << 8) | sum1
+        for idx in rows:
+            data[idx] = bits[idx][:n_data]
+
+    ok = (received == calculated) & (received >= 0)
+    return Fletcher16BatchResult(data, received, calculated, ok, errors)
+
+def _decode_batch_python(bits: List[str]) -> Fletcher16BatchResult:
+    data, received, calculated, ok, errors = [], [], [], [], []
+    for frame in bits:
+        try:
+            result = fletcher16_decode(frame)
+        except ValueError as e:
+            data.append("")
+            received.append(-1)
+            calculated.append(-1)
+            ok.append(False)
+            errors.append(str(e))
+            continue
+        data.append(result.data)
+        received.append(result.received_checksum)
+        calculated.append(result.calculated_checksum)
+        ok.append(result.ok)
+        errors.append(None)
+    return Fletcher16BatchResult(data, received, calculated, ok, errors)
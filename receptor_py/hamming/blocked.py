@@ -0,0 +1,206 @@
+# Hamming por bloques (SECDED) con tamaños de palabra fijos.
+# La trama se parte en palabras de n bits con la misma disposición que
+# hamming(): paridades en 1, 2, 4, ... y paridad global al final de cada bloque.
+# Así cada bloque puede corregir 1 error y detectar 2, sin importar el largo
+# total del mensaje.
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
+
+from bitframe.bitframe import INVALID_BITS, BitFrame, as_bitframe, bits_matrix
+from hamming.hamming import get_parity_positions, syndrome_and_parity
+
+try:
+    import numpy as np
+except ImportError:  # el modo por bloques funciona igual sin NumPy, solo más lento
+    np = None
+
+# Bits de datos por bloque -> largo de la palabra SECDED
+# (7,4)+1, (15,11)+1, (31,26)+1, (63,57)+1 y (71,64)+1 = (72,64)
+BLOCK_SIZES = {4: 8, 11: 16, 26: 32, 57: 64, 64: 72}
+DEFAULT_BLOCK = 64
+
+
+@dataclass(frozen=True)
+class BlockLayout:
+    """Disposición precalculada de una palabra SECDED de `n` bits con `k` datos."""
+    k: int
+    n: int
+    parity_positions: Tuple[int, ...]
+    data_positions: Tuple[int, ...]
+    # Filas de la matriz de verificación como máscaras (bit i-1 = posición i);
+    # la última fila es la paridad global y cubre toda la palabra
+    check_rows: Tuple[int, ...]
+    check_matrix: object = field(default=None, compare=False, repr=False)
+
+
+@dataclass
+class BlockedResult:
+    """Resultado de decodificar una trama por bloques."""
+    data: Union[str, BitFrame]
+    blocks: int
+    syndromes: List[int]
+    corrected_blocks: List[int]
+    uncorrectable_blocks: List[int]
+
+    @property
+    def ok(self) -> bool:
+        return not self.uncorrectable_blocks
+
+
+@lru_cache(maxsize=None)
+def block_layout(k: int = DEFAULT_BLOCK) -> BlockLayout:
+    """Devuelve (y cachea) la disposición y la matriz H para `k` bits de datos."""
+    if k not in BLOCK_SIZES:
+        raise ValueError(f"Tamaño de bloque no soportado: k={k} (use {sorted(BLOCK_SIZES)})")
+    n = BLOCK_SIZES[k]
+    parity_positions = tuple(get_parity_positions(n - 1))
+    data_positions = tuple(i for i in range(1, n) if i & (i - 1))
+    rows = []
+    for p in parity_positions:
+        mask = 0
+        for i in range(1, n):
+            if i & p:
+                mask |= 1 << (i - 1)
+        rows.append(mask)
+    rows.append((1 << n) - 1)
+
+    matrix = None
+    if np is not None:
+        matrix = np.zeros((len(rows), n), dtype=np.uint8)
+        for r, mask in enumerate(rows):
+            for i in range(n):
+                if mask >> i & 1:
+                    matrix[r, i] = 1
+    return BlockLayout(k, n, parity_positions, data_positions, tuple(rows), matrix)
+
+
+# -------- codificación ----------
+def hamming_blocked_encode(data: Union[str, BitFrame], k: int = DEFAULT_BLOCK) -> Union[str, BitFrame]:
+    """
+    Codifica `data` en palabras SECDED de k bits de datos.
+    El último bloque se rellena con ceros hasta completar k bits.
+    """
+    layout = block_layout(k)
+    bits = as_bitframe(data)
+    blocks = -(-len(bits) // k)
+    pad = blocks * k - len(bits)
+    value = bits.value << pad
+
+    out = 0
+    for b in range(blocks):
+        chunk = (value >> ((blocks - 1 - b) * k)) & ((1 << k) - 1)
+        word = _encode_block(chunk, layout)
+        out = (out << layout.n) | word
+    encoded = BitFrame(out, blocks * layout.n)
+    if isinstance(data, BitFrame):
+        return encoded
+    return encoded.to_bits()
+
+
+def _encode_block(chunk: int, layout: BlockLayout) -> int:
+    """Codifica un bloque de k bits (MSB = primer dato) en una palabra de n bits."""
+    n, k = layout.n, layout.k
+    word = 0
+    for idx, pos in enumerate(layout.data_positions):
+        if chunk >> (k - 1 - idx) & 1:
+            word |= 1 << (n - pos)
+    # Con las paridades en 0, el síndrome indica qué paridades encender
+    syndrome, _ = syndrome_and_parity(BitFrame(word, n))
+    for p in layout.parity_positions:
+        if syndrome & p:
+            word |= 1 << (n - p)
+    if bin(word).count("1") & 1:
+        word |= 1
+    return word
+
+
+# -------- decodificación ----------
+def hamming_blocked(frame: Union[str, BitFrame], k: int = DEFAULT_BLOCK,
+                    data_len: Optional[int] = None) -> BlockedResult:
+    """
+    Decodifica una trama formada por palabras SECDED consecutivas.
+
+    Con NumPy todos los bloques se verifican a la vez como un producto
+    matricial módulo 2 contra la matriz H precalculada; sin NumPy se usa el
+    motor de síndrome de hamming.py bloque por bloque.
+    `data_len` recorta el relleno del último bloque.
+    """
+    layout = block_layout(k)
+    if len(frame) % layout.n:
+        raise ValueError(f"Largo {len(frame)} no es múltiplo del bloque de {layout.n} bits")
+
+    if np is not None:
+        data_bits, syndromes, corrected, uncorrectable = _decode_numpy(frame, layout)
+    else:
+        data_bits, syndromes, corrected, uncorrectable = _decode_python(as_bitframe(frame), layout)
+
+    if data_len is not None:
+        data_bits = data_bits.head(data_len)
+    return BlockedResult(
+        data=data_bits if isinstance(frame, BitFrame) else data_bits.to_bits(),
+        blocks=len(syndromes),
+        syndromes=syndromes,
+        corrected_blocks=corrected,
+        uncorrectable_blocks=uncorrectable,
+    )
+
+
+def _decode_python(frame: BitFrame, layout: BlockLayout):
+    n, k = layout.n, layout.k
+    blocks = len(frame) // n
+    syndromes, corrected, uncorrectable = [], [], []
+    out = 0
+    for b in range(blocks):
+        word = (frame.value >> ((blocks - 1 - b) * n)) & ((1 << n) - 1)
+        syndrome, gpar = syndrome_and_parity(BitFrame(word, n))
+        if word & 1:
+            syndrome ^= n  # la paridad global no forma parte del síndrome
+        syndromes.append(syndrome)
+        if gpar:
+            if syndrome == 0:
+                corrected.append(b)
+            elif syndrome < n:
+                word ^= 1 << (n - syndrome)
+                corrected.append(b)
+            else:
+                uncorrectable.append(b)
+        elif syndrome:
+            uncorrectable.append(b)
+
+        chunk = 0
+        for pos in layout.data_positions:
+            chunk = (chunk << 1) | (word >> (n - pos) & 1)
+        out = (out << k) | chunk
+    return BitFrame(out, blocks * k), syndromes, corrected, uncorrectable
+
+
+def _decode_numpy(frame: Union[str, BitFrame], layout: BlockLayout):
+    n, k = layout.n, layout.k
+    if isinstance(frame, BitFrame):
+        raw = np.frombuffer(frame.to_bytes(), dtype=np.uint8)
+        bits = np.unpackbits(raw)[:len(frame)]
+    else:
+        bits, invalid = bits_matrix([frame], len(frame))
+        if invalid[0]:
+            raise ValueError(INVALID_BITS)
+    words = bits.reshape(-1, n).copy()
+
+    # Producto módulo 2: cada fila suma a lo sumo n ≤ 72 unos, cabe en uint8
+    checks = (words @ layout.check_matrix.T) & 1
+    weights = np.array(layout.parity_positions, dtype=np.int64)
+    syndromes = checks[:, :-1].astype(np.int64) @ weights
+    gpar = checks[:, -1].astype(bool)
+
+    fixable = gpar & (syndromes > 0) & (syndromes < n)
+    rows = np.nonzero(fixable)[0]
+    words[rows, syndromes[rows] - 1] ^= 1
+    corrected = np.nonzero(gpar & (syndromes < n))[0]
+    uncorrectable = np.nonzero((gpar & (syndromes >= n)) | (~gpar & (syndromes > 0)))[0]
+
+    data_cols = np.array(layout.data_positions, dtype=np.intp) - 1
+    data = words[:, data_cols].reshape(-1)
+    packed = np.packbits(data).tobytes()
+    return (BitFrame.from_bytes(packed, data.size), syndromes.tolist(),
+            corrected.tolist(), uncorrectable.tolist())
@@ -1,7 +1,72 @@
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from bitframe.bitframe import INVALID_BITS, BitFrame, as_bitframe, bits_matrix
+from native.loader import load_kernels
+
+try:
+    import numpy as np
+except ImportError:  # decode_batch decodifica trama por trama sin NumPy
+    np = None
+
+# Núcleos en C si están compilados (python native/build.py); si no, None
+native = load_kernels()
 
 USE_SECDED = True
 
+# Layouts distintos que se mantienen en caché (las tramas vienen en pocos largos fijos)
+LAYOUT_CACHE_SIZE = 64
+
+# Callback opcional para diagnósticos (p. ej. print); None = sin salida
+LogFn = Optional[Callable[[str], None]]
+
+@dataclass
+class HammingResult:
+    """Resultado estructurado de decodificar una trama Hamming."""
+    data: Union[str, BitFrame]
+    syndrome: int
+    global_parity: int
+    # Posiciones (1-indexadas) que se invirtieron; n_all = bit de paridad global
+    corrected_positions: List[int] = field(default_factory=list)
+    # Parejas (bit, posición) reportadas como posibles errores
+    errors: List[Tuple[int, int]] = field(default_factory=list)
+    detected: bool = False
+    uncorrectable: bool = False
+    # Veredicto rápido: síndrome != 0 con paridad par -> error doble (no corregible)
+    double_error: bool = False
+    # Motivo si la trama no se pudo decodificar (síndrome fuera de rango)
+    error: Optional[str] = None
+    # Largo de la palabra de código sin la paridad global (para los candidatos)
+    code_length: int = 0
+
+    @property
+    def corrected(self) -> bool:
+        return bool(self.corrected_positions)
+
+    def iter_candidates(self) -> Iterator[Tuple[int, int]]:
+        """Parejas (i, j) candidatas a error doble, generadas bajo demanda."""
+        if not self.double_error:
+            return iter(())
+        return iter_double_error_candidates(self.syndrome, self.code_length)
+
+@dataclass
+class HammingBatchResult:
+    """
+    Resultado de decode_batch, alineado con el orden de entrada.
+    Los arreglos son de NumPy (listas si NumPy no está disponible).
+    """
+    data: List[str]
+    syndromes: object
+    detected: object
+    corrected: object
+    uncorrectable: object
+    # Motivo por trama si no se pudo decodificar (None si se decodificó)
+    errors: List[Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
 def get_parity_positions(n: int) -> List[int]:
     """
     Devuelve las posiciones (1-indexadas) de los bits de paridad
@@ -14,32 +79,113 @@ def get_parity_positions(n: int) -> List[int]:
         p <<= 1
     return positions
 
+@dataclass
+class HammingLayout:
+    """
+    Disposición precalculada de una palabra de código de `n` bits (sin el
+    bit de paridad global): posiciones de paridad, tramos e índices de los
+    bits de datos y matriz de verificación.
+    """
+    n: int
+    parity_positions: Tuple[int, ...]
+    # Tramos [inicio, fin) 0-indexados de datos consecutivos entre paridades
+    data_runs: Tuple[Tuple[int, int], ...]
+    # Índices 0-indexados de los bits de datos, en orden
+    data_index: Tuple[int, ...]
+
+    @cached_property
+    def data_index_array(self):
+        """data_index como arreglo de NumPy para extraer con un solo gather."""
+        return np.array(self.data_index, dtype=np.intp)
+
+    @cached_property
+    def check_matrix(self):
+        """Matriz H (paridades x n) en uint8: H[r, i] = 1 si la paridad r cubre la posición i+1."""
+        positions = np.arange(1, self.n + 1, dtype=np.int64)
+        parities = np.array(self.parity_positions, dtype=np.int64)
+        return ((positions[None, :] & parities[:, None]) != 0).astype(np.uint8)
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def hamming_layout(n: int) -> HammingLayout:
+    """Layout para palabras de `n` bits, cacheado (LRU) por largo."""
+    parity_positions = tuple(get_parity_positions(n))
+    runs = []
+    for p in parity_positions:
+        # Entre la paridad p y la 2p solo hay datos: posiciones p+1 .. 2p-1
+        end = min(2 * p - 1, n)
+        if p < end:
+            runs.append((p, end))
+    data_index = tuple(i for start, end in runs for i in range(start, end))
+    return HammingLayout(n, parity_positions, tuple(runs), data_index)
+
+def _build_byte_tables() -> Tuple[List[int], List[int]]:
+    """
+    Tablas precalculadas por valor de byte (0..255):
+    - XOR de los índices (0..7, MSB primero) de los bits en 1
+    - paridad del byte (1 si tiene un número impar de unos)
+    """
+    syndromes = [0] * 256
+    parities = [0] * 256
+    for b in range(256):
+        s = 0
+        for j in range(8):
+            if b & (0x80 >> j):
+                s ^= j
+        syndromes[b] = s
+        parities[b] = bin(b).count("1") & 1
+    return syndromes, parities
+
+_BYTE_SYNDROME, _BYTE_PARITY = _build_byte_tables()
+
+def syndrome_and_parity(data: Union[str, BitFrame]) -> Tuple[int, int]:
+    """
+    Motor de síndrome en una sola pasada sobre la trama.
+
+    El síndrome de Hamming es el XOR de las posiciones (1-indexadas) de todos
+    los bits en 1. Se antepone un bit 0 ficticio para que el índice 0-indexado
+    coincida con la posición y se recorre byte a byte con las tablas: el byte k
+    aporta su entrada de tabla y, si tiene paridad impar, además k*8.
+    Retorna (síndrome, paridad global).
+    """
+    frame = as_bitframe(data)
+    n = len(frame)
+    if n == 0:
+        return 0, 0
+    total = n + 1
+    pad = (-total) % 8
+    buf = (frame.value << pad).to_bytes((total + pad) >> 3, "big")
+    if native is not None:
+        return native.hamming_syndrome(buf)
+    return _syndrome_and_parity_python(buf)
+
+def _syndrome_and_parity_python(buf: bytes) -> Tuple[int, int]:
+    """Recorrido por tablas de syndrome_and_parity (ruta sin la extensión en C)."""
+    syndrome = 0
+    parity = 0
+    for k, b in enumerate(buf):
+        if b:
+            syndrome ^= _BYTE_SYNDROME[b]
+            if _BYTE_PARITY[b]:
+                syndrome ^= k << 3
+                parity ^= 1
+    return syndrome, parity
+
 def compute_erros(bits: List[int], parity_positions: List[int]) -> int:
     """
     Recalcula cada bit de paridad y construye el error (síndrome).
-    El error es la suma de las posiciones de paridad que dieron paridad = 1.
+    El error es la suma de las posiciones de paridad que dieron paridad = 1,
+    que equivale al XOR de las posiciones de todos los bits en 1.
     """
-    n = len(bits)
-    error = 0
-    for p in parity_positions:
-        parity = 0
-        for i in range(p - 1, n, 2 * p):
-            parity ^= sum(bits[i : i + p]) % 2
-        if parity != 0:
-            error += p
-    return error
+    syndrome = 0
+    for i, b in enumerate(bits, 1):
+        if b:
+            syndrome ^= i
+    return syndrome
 
 def _failing_parities(bits: List[int], parity_positions: List[int]) -> List[int]:
     """Lista de posiciones de paridad que fallan (para reportar)."""
-    n = len(bits)
-    fails = []
-    for p in parity_positions:
-        parity = 0
-        for i in range(p - 1, n, 2 * p):
-            parity ^= sum(bits[i : i + p]) % 2
-        if parity != 0:
-            fails.append(p)
-    return fails
+    syndrome = compute_erros(bits, parity_positions)
+    return [p for p in parity_positions if syndrome & p]
 
 def correct_error(bits: List[int], error: int) -> Tuple[int, int]:
     """
@@ -56,90 +202,322 @@ def extract_data(bits: List[int], parity_positions: List[int]) -> List[int]:
     """
     Extrae solo los bits de datos (omitiendo las posiciones de paridad)
     """
-    return [bits[i] for i in range(len(bits)) if (i + 1) not in parity_positions]
+    return [bits[i] for i in hamming_layout(len(bits)).data_index]
+
+def _extract_frame(code: BitFrame, layout: HammingLayout, flip: int = 0) -> BitFrame:
+    """
+    Invierte la posición `flip` (0 = ninguna) y extrae los bits de datos.
+    """
+    if native is not None:
+        data = native.hamming_extract(code.to_bytes(), len(code), flip)
+        return BitFrame.from_bytes(data, len(layout.data_index))
+    return _extract_frame_python(code, layout, flip)
+
+def _extract_frame_python(code: BitFrame, layout: HammingLayout, flip: int = 0) -> BitFrame:
+    """
+    Ruta sin la extensión en C: copia tramos completos entre posiciones de
+    paridad (O(log n) operaciones sobre el entero).
+
+    Raises:
+        ValueError: Si `flip` está fuera de 0..len(code) (igual que el núcleo en C)
+    """
+    if not 0 <= flip <= len(code):
+        raise ValueError(f"Posición {flip} fuera de rango (0..{len(code)})")
+    if flip:
+        code = code.flipped(flip)
+    n = len(code)
+    value = code.value
+    out = 0
+    for start, end in layout.data_runs:
+        width = end - start
+        out = (out << width) | ((value >> (n - end)) & ((1 << width) - 1))
+    return BitFrame(out, len(layout.data_index))
 
 def _overall_parity(bits: List[int]) -> int:
     """XOR de todos los bits (0=par, 1=impar)."""
     return sum(bits) & 1
 
-def _candidate_pairs_for_double_error(syndrome: int, n_code: int) -> List[Tuple[int, int]]:
+def iter_double_error_candidates(syndrome: int, n_code: int) -> Iterator[Tuple[int, int]]:
     """
-    Todas las parejas (i,j) con i<j y i ^ j == síndrome, 1 ≤ i,j ≤ n_code.
-    Estas son las posibles posiciones si asumimos EXACTAMENTE 2 errores en code_bits.
+    Genera las parejas (i,j) con i<j y i ^ j == síndrome, 1 ≤ i,j ≤ n_code,
+    sin armar la lista completa. Son las posibles posiciones si asumimos
+    EXACTAMENTE 2 errores en code_bits.
     """
-    pairs = []
+    if syndrome <= 0:
+        return
+    # i < j  <=>  i tiene en 0 el bit más alto del síndrome
+    top = 1 << (syndrome.bit_length() - 1)
     for i in range(1, n_code + 1):
+        if i & top:
+            continue
         j = i ^ syndrome
-        if 1 <= j <= n_code and i < j:
-            pairs.append((i, j))
-    return pairs
+        if j <= n_code:
+            yield i, j
+
+def _candidate_pairs_for_double_error(syndrome: int, n_code: int) -> List[Tuple[int, int]]:
+    """Todas las parejas candidatas a error doble (ver iter_double_error_candidates)."""
+    return list(iter_double_error_candidates(syndrome, n_code))
+
+def _candidate_errors(code: BitFrame, syndrome: int) -> List[Tuple[int, int]]:
+    """Parejas (bit, posición) de todos los candidatos a error doble en `code`."""
+    # Un solo paso a cadena: code.bit() desplaza el entero completo en cada llamada
+    bits = code.to_bits()
+    errores = []
+    for i, j in iter_double_error_candidates(syndrome, len(code)):
+        errores.append((int(bits[i - 1]), i))
+        errores.append((int(bits[j - 1]), j))
+    return errores
+
+def hamming_encode(data: Union[str, BitFrame]) -> Union[str, BitFrame]:
+    """
+    Codifica los bits de datos igual que el emisor (emisor_ts/src/hamming):
+    paridades en las potencias de 2 y, con USE_SECDED, el bit de paridad
+    global al final. Devuelve el mismo tipo que la entrada.
+    """
+    frame = as_bitframe(data)
+    k = len(frame)
+    r = 0
+    while (1 << r) < k + r + 1:
+        r += 1
+    n = k + r
+    layout = hamming_layout(n)
 
-def hamming(data: str) -> str:
-    print(f"Procesando mensaje Hamming (receptor): {data}")
-    bits_all = [int(ch) for ch in data]
-    n_all = len(bits_all)
+    # Reparte los datos por tramos entre las posiciones de paridad
+    value = 0
+    consumed = 0
+    for start, end in layout.data_runs:
+        width = end - start
+        chunk = (frame.value >> (k - consumed - width)) & ((1 << width) - 1)
+        value |= chunk << (n - end)
+        consumed += width
 
+    # Con paridades en 0 el síndrome dice exactamente cuáles encender
+    syndrome, parity = syndrome_and_parity(BitFrame(value, n))
+    for p in layout.parity_positions:
+        if syndrome & p:
+            value |= 1 << (n - p)
+            parity ^= 1
+    code = BitFrame(value, n)
     if USE_SECDED:
-        code_bits = bits_all[:-1]
-        global_pos = n_all
-        parity_positions = get_parity_positions(len(code_bits))
-        print('posiciones de los bits de paridad:', parity_positions, '(con paridad global al final)')
+        code = BitFrame((value << 1) | parity, n + 1)
+    return code if isinstance(data, BitFrame) else code.to_bits()
 
-        syndrome = compute_erros(code_bits, parity_positions)
-        gpar = _overall_parity(bits_all)
+def hamming_decode(data: Union[str, BitFrame], log: LogFn = None,
+                   enumerate_candidates: bool = False) -> HammingResult:
+    """
+    Decodifica una trama Hamming (SECDED si USE_SECDED) sin imprimir nada.
+    Acepta una cadena binaria o una BitFrame; `data` del resultado tiene el
+    mismo tipo que la entrada. Los diagnósticos solo se formatean si se
+    pasa `log`.
 
-        errores = []
+    Un error doble solo se marca (`double_error`, `uncorrectable`), con el
+    mismo costo que una trama limpia. Con `enumerate_candidates` además se
+    listan en `errors` todas las parejas candidatas (O(n)); si no, quedan
+    disponibles bajo demanda con `result.iter_candidates()`.
+    """
+    if log:
+        log(f"Procesando mensaje Hamming (receptor): {data}")
+    frame = as_bitframe(data)
+    n_all = len(frame)
+    errores = []
+    corrected = []
+    uncorrectable = False
+    double_error = False
+    error = None
+    # Posición a invertir al extraer los datos (0 = ninguna)
+    flip = 0
+
+    if USE_SECDED:
+        code = frame.head(n_all - 1)
+        n_code = len(code)
+        global_pos = n_all
+        layout = hamming_layout(n_code)
+        if log:
+            log(f"posiciones de los bits de paridad: {list(layout.parity_positions)} (con paridad global al final)")
+
+        # Una sola pasada: el bit global no forma parte del síndrome
+        syndrome, gpar = syndrome_and_parity(frame)
+        gbit = frame.value & 1 if n_all else 0
+        if gbit:
+            syndrome ^= global_pos
+        detected = syndrome != 0 or gpar != 0
 
         if syndrome == 0 and gpar == 0:
-            print("No se detectaron errores.")
+            if log:
+                log("No se detectaron errores.")
         elif syndrome == 0 and gpar == 1:
-            errores.append((bits_all[-1], global_pos))
+            errores.append((gbit, global_pos))
+            corrected.append(global_pos)
         elif syndrome != 0 and gpar == 1:
-            original, _ = correct_error(code_bits, syndrome)
-            errores.append((original, syndrome))
+            if syndrome <= n_code:
+                errores.append((code.bit(syndrome), syndrome))
+                flip = syndrome
+                corrected.append(syndrome)
+            else:
+                uncorrectable = True
+                error = f"Síndrome {syndrome} fuera de rango (1..{n_code})"
         else:  # múltiples errores
-            pairs = _candidate_pairs_for_double_error(syndrome, len(code_bits))
-            for i, j in pairs:
-                errores.append((code_bits[i-1], i))
-                errores.append((code_bits[j-1], j))
-            if 1 <= syndrome <= len(code_bits):
-                errores.append((code_bits[syndrome-1], syndrome))
-                errores.append((bits_all[-1], global_pos))
-
-        if errores:
-            print(f"errores: {len(errores)}")
-            for bit, pos in errores:
-                print(f"{bit},{pos}")
-
-        data_bits = extract_data(code_bits, parity_positions)
-        print('Mensaje original: ', ''.join(str(b) for b in data_bits))
-        return ''.join(str(b) for b in data_bits)
+            uncorrectable = True
+            double_error = True
+            if enumerate_candidates:
+                errores.extend(_candidate_errors(code, syndrome))
+                if 1 <= syndrome <= n_code:
+                    errores.append((code.bit(syndrome), syndrome))
+                    errores.append((gbit, global_pos))
 
     else:
-        parity_positions = get_parity_positions(n_all)
-        print('posiciones de los bits de paridad:', parity_positions, '(sin paridad global)')
+        code = frame
+        n_code = n_all
+        layout = hamming_layout(n_all)
+        if log:
+            log(f"posiciones de los bits de paridad: {list(layout.parity_positions)} (sin paridad global)")
 
-        fails = _failing_parities(bits_all, parity_positions)
-        syndrome = sum(fails)
-        errores = []
+        syndrome, gpar = syndrome_and_parity(frame)
+        fails = [p for p in layout.parity_positions if syndrome & p]
+        detected = syndrome != 0
 
         if syndrome == 0:
-            print("No se detectaron errores.")
+            if log:
+                log("No se detectaron errores.")
         else:
             if len(fails) >= 2:
-                pairs = _candidate_pairs_for_double_error(syndrome, n_all)
-                for i, j in pairs:
-                    errores.append((bits_all[i-1], i))
-                    errores.append((bits_all[j-1], j))
+                uncorrectable = True
+                double_error = True
+                if enumerate_candidates:
+                    errores.extend(_candidate_errors(code, syndrome))
             else:
-                original, _ = correct_error(bits_all, syndrome)
-                errores.append((original, syndrome))
+                errores.append((code.bit(syndrome), syndrome))
+                flip = syndrome
+                corrected.append(syndrome)
+
+    if log and errores:
+        log(f"errores: {len(errores)}")
+        for bit, pos in errores:
+            log(f"{bit},{pos}")
+    if log and error:
+        log(error)
+
+    data_frame = _extract_frame(code, layout, flip)
+    if log:
+        log(f"Mensaje original:  {data_frame}")
+    return HammingResult(
+        data=data_frame if isinstance(data, BitFrame) else data_frame.to_bits(),
+        syndrome=syndrome,
+        global_parity=gpar,
+        corrected_positions=corrected,
+        errors=errores,
+        detected=detected,
+        uncorrectable=uncorrectable,
+        double_error=double_error,
+        error=error,
+        code_length=n_code,
+    )
+
+def hamming(data: Union[str, BitFrame]) -> Union[str, BitFrame]:
+    """
+    Decodifica una trama Hamming imprimiendo los diagnósticos en consola
+    (uso interactivo). Devuelve los bits de datos con el mismo tipo que
+    la entrada.
+
+    Raises:
+        ValueError: Si el síndrome apunta fuera de la palabra de código
+    """
+    result = hamming_decode(data, log=print, enumerate_candidates=True)
+    if result.error:
+        raise ValueError(result.error)
+    return result.data
+
+def decode_batch(frames: Iterable[Union[str, BitFrame]]) -> HammingBatchResult:
+    """
+    Decodifica una columna de tramas (lista, pandas.Series, ...) de una vez.
+
+    Las tramas se agrupan por largo y cada grupo se procesa como una matriz
+    uint8 (tramas x bits): síndrome, paridad global, corrección y extracción
+    de datos son operaciones de NumPy sobre todo el grupo. Mismo criterio
+    que hamming_decode(). Sin NumPy (o sin SECDED) decodifica una por una.
+    """
+    bits = [f.to_bits() if isinstance(f, BitFrame) else f for f in frames]
+    if np is None or not USE_SECDED:
+        return _decode_batch_python(bits)
+
+    count = len(bits)
+    data: List[Optional[str]] = [None] * count
+    errors: List[Optional[str]] = [None] * count
+    syndromes = np.zeros(count, dtype=np.int64)
+    detected = np.zeros(count, dtype=bool)
+    corrected = np.zeros(count, dtype=bool)
+    uncorrectable = np.zeros(count, dtype=bool)
+
+    groups = {}
+    for idx, frame in enumerate(bits):
+        groups.setdefault(len(frame), []).append(idx)
+
+    for n_all, rows in groups.items():
+        if n_all < 2:
+            for idx in rows:
+                try:
+                    result = hamming_decode(bits[idx])
+                except ValueError as e:
+                    errors[idx] = str(e)
+                    continue
+                data[idx] = result.data
+                syndromes[idx] = result.syndrome
+                detected[idx] = result.detected
+                corrected[idx] = result.corrected
+                uncorrectable[idx] = result.uncorrectable
+                errors[idx] = result.error
+            continue
+
+        n_code = n_all - 1
+        matrix, invalid = bits_matrix([bits[idx] for idx in rows], n_all)
+        if invalid.any():
+            # Mismo resultado que hamming_decode: la trama se rechaza entera
+            for j in np.nonzero(invalid)[0]:
+                errors[rows[j]] = INVALID_BITS
+            matrix = matrix[~invalid]
+            rows = [idx for idx, bad in zip(rows, invalid) if not bad]
+            if not rows:
+                continue
+        code = matrix[:, :n_code]
+
+        # Síndrome = XOR de las posiciones de los bits en 1
+        positions = np.arange(1, n_code + 1, dtype=np.int64)
+        syn = np.bitwise_xor.reduce(code * positions, axis=1)
+        gpar = (matrix.sum(axis=1) & 1).astype(bool)
+
+        single = gpar & (syn != 0)
+        fixable = single & (syn <= n_code)
+        out_of_range = single & (syn > n_code)
+        fix_rows = np.nonzero(fixable)[0]
+        code[fix_rows, syn[fix_rows] - 1] ^= 1
+
+        data_cols = hamming_layout(n_code).data_index_array
+        decoded = (code[:, data_cols] + ord("0")).tobytes().decode("ascii")
+        width = len(data_cols)
+
+        idx_arr = np.array(rows, dtype=np.intp)
+        syndromes[idx_arr] = syn
+        detected[idx_arr] = gpar | (syn != 0)
+        corrected[idx_arr] = gpar & (syn <= n_code)
+        uncorrectable[idx_arr] = out_of_range | (~gpar & (syn != 0))
+        for j, idx in enumerate(rows):
+            data[idx] = decoded[j * width:(j + 1) * width]
+        for j in np.nonzero(out_of_range)[0]:
+            errors[rows[j]] = f"Síndrome {syn[j]} fuera de rango (1..{n_code})"
 
-        if errores:
-            print(f"errores: {len(errores)}")
-            for bit, pos in errores:
-                print(f"{bit},{pos}")
+    return HammingBatchResult(data, syndromes, detected, corrected, uncorrectable, errors)
 
-        data_bits = extract_data(bits_all, parity_positions)
-        print('Mensaje original: ', ''.join(str(b) for b in data_bits))
-        return ''.join(str(b) for b in data_bits)
+def _decode_batch_python(bits: List[str]) -> HammingBatchResult:
+    batch = HammingBatchResult([], [], [], [], [], [])
+    for frame in bits:
+        try:
+            r = hamming_decode(frame)
+        except ValueError as e:
+            r = HammingResult(data=None, syndrome=0, global_parity=0, error=str(e))
+        batch.data.append(r.data)
+        batch.syndromes.append(r.syndrome)
+        batch.detected.append(r.detected)
+        batch.corrected.append(r.corrected)
+        batch.uncorrectable.append(r.uncorrectable)
+        batch.errors.append(r.error)
+    return batch
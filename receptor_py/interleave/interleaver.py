@@ -0,0 +1,122 @@
+# Entrelazador por bloques para tramas de palabras de largo fijo (p. ej. las
+# palabras SECDED de hamming/blocked.py).
+#
+# Las `depth` palabras de cada bloque se escriben como filas de una matriz
+# (palabras x bits) y se transmiten por columnas: el bit j de cada palabra
+# sale junto al bit j de las demás. Una ráfaga de hasta `depth` bits en el
+# canal queda repartida en a lo sumo un bit por palabra, que SECDED corrige.
+# A cambio, el receptor debe tener el bloque completo (depth x bits) antes
+# de decodificar la primera palabra.
+#
+# Las permutaciones se precalculan por (palabras, bits) y se cachean; con
+# NumPy entrelazar o desentrelazar todos los bloques completos de una trama
+# es un solo gather (bits[:, perm]).
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+from bitframe.bitframe import BitFrame, as_bitframe
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy se permutan cadenas '0'/'1'
+    np = None
+
+# Disposiciones distintas que se conservan (bloques completos y el del final)
+LAYOUT_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class InterleaveLayout:
+    """Permutaciones de un bloque de `rows` palabras de `cols` bits."""
+    rows: int
+    cols: int
+    # salida[i] = entrada[forward[i]] al entrelazar
+    forward: object
+    # entrada[i] = salida[inverse[i]] al desentrelazar
+    inverse: object
+
+    @property
+    def size(self) -> int:
+        return self.rows * self.cols
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def interleave_layout(rows: int, cols: int) -> InterleaveLayout:
+    """Devuelve (y cachea) los índices de permutación para rows x cols."""
+    if np is not None:
+        index = np.arange(rows * cols, dtype=np.intp)
+        forward = index.reshape(rows, cols).T.reshape(-1)
+        inverse = index.reshape(cols, rows).T.reshape(-1)
+    else:
+        forward = tuple(i * cols + j for j in range(cols) for i in range(rows))
+        inverse = tuple(j * rows + i for i in range(rows) for j in range(cols))
+    return InterleaveLayout(rows, cols, forward, inverse)
+
+
+def _segments(length: int, word_bits: int, depth: Optional[int]) -> Tuple[int, int, int]:
+    """(bloques completos, palabras por bloque, palabras del bloque final)."""
+    if word_bits <= 0:
+        raise ValueError("El largo de palabra debe ser positivo")
+    if length % word_bits:
+        raise ValueError(f"Largo {length} no es múltiplo de la palabra de {word_bits} bits")
+    words = length // word_bits
+    depth = depth or words or 1
+    if depth < 1:
+        raise ValueError(f"Profundidad inválida: {depth}")
+    return words // depth, depth, words % depth
+
+
+def _permute(frame: Union[str, BitFrame], word_bits: int, depth: Optional[int],
+             inverse: bool) -> Union[str, BitFrame]:
+    bits = as_bitframe(frame)
+    length = len(bits)
+    full, depth, tail = _segments(length, word_bits, depth)
+    block = interleave_layout(depth, word_bits)
+    last = interleave_layout(tail, word_bits) if tail else None
+    split = full * block.size
+
+    if np is not None:
+        raw = np.frombuffer(bits.to_bytes(), dtype=np.uint8)
+        array = np.unpackbits(raw, count=length)
+        out = np.empty_like(array)
+        if full:
+            perm = block.inverse if inverse else block.forward
+            out[:split] = array[:split].reshape(full, block.size)[:, perm].reshape(-1)
+        if last:
+            out[split:] = array[split:][last.inverse if inverse else last.forward]
+        result = BitFrame.from_bytes(np.packbits(out).tobytes(), length)
+    else:
+        text = bits.to_bits()
+        parts = []
+        for start in range(0, split, block.size):
+            segment = text[start:start + block.size]
+            parts.append("".join([segment[i] for i in (block.inverse if inverse else block.forward)]))
+        if last:
+            segment = text[split:]
+            parts.append("".join([segment[i] for i in (last.inverse if inverse else last.forward)]))
+        result = BitFrame.from_bits("".join(parts))
+    return result if isinstance(frame, BitFrame) else result.to_bits()
+
+
+def interleave(frame: Union[str, BitFrame], word_bits: int, depth: Optional[int] = None) -> Union[str, BitFrame]:
+    """
+    Entrelaza una trama de palabras de `word_bits` bits en bloques de `depth`
+    palabras (None = toda la trama en un bloque). Mismo tipo que la entrada.
+
+    Raises:
+        ValueError: Si el largo no es múltiplo de `word_bits`
+    """
+    return _permute(frame, word_bits, depth, inverse=False)
+
+
+def deinterleave(frame: Union[str, BitFrame], word_bits: int, depth: Optional[int] = None) -> Union[str, BitFrame]:
+    """Inverso de interleave() con los mismos parámetros."""
+    return _permute(frame, word_bits, depth, inverse=True)
+
+
+def interleave_latency(length: int, word_bits: int, depth: Optional[int] = None) -> int:
+    """Bits que hay que recibir antes de poder decodificar la primera palabra."""
+    full, depth, tail = _segments(length, word_bits, depth)
+    return (depth if full else tail) * word_bits
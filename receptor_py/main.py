@@ -1,6 +1,18 @@
+import argparse
+import json
+import mmap
+import sys
+import time
+from bitframe.bitframe import BitFrame, bits_to_text, check_text_encoding, TEXT_ERRORS
+from codec.registry import CODECS
 from hamming.hamming import hamming
 from fletcher16.fletcher16 import fletcher16_receive
+from wire.wire import iter_frames
 from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+# lines: una trama '0'/'1' por línea; wire: registros binarios de wire/wire.py
+FORMATS = ("lines", "wire")
 
 def main():
     print("=== RECEPTOR ===\n")
@@ -27,14 +39,15 @@ def main():
 
     message = read_message(message_path)
     print(f"Mensaje recibido: {message}")
+    frame = BitFrame.from_bits(message)
 
     # Procesar según el algoritmo seleccionado
     if algorithm == 1:
         print("\n=== Algoritmo Hamming seleccionado ===")
-        hamming(message)
+        hamming(frame)
     elif algorithm == 2:
         print("\n=== Algoritmo Fletcher-16 seleccionado ===")
-        fletcher16_receive(message)
+        fletcher16_receive(frame)
 
 
 def read_message(file_path: Path) -> str:
@@ -49,4 +62,161 @@ def read_message(file_path: Path) -> str:
         return file.read().strip()
 
 
-main()
\ No newline at end of file
+# =========================
+# Modo por lotes (sin prompt)
+# =========================
+
+def iter_line_frames(data) -> Iterator[Tuple[int, Optional[BitFrame], Optional[str]]]:
+    """
+    Recorre un archivo mapeado con una trama por línea y entrega
+    (número de línea, trama, error). Solo se copia una línea a la vez.
+    """
+    size = len(data)
+    pos = 0
+    lineno = 0
+    while pos < size:
+        end = data.find(b"\n", pos)
+        if end == -1:
+            end = size
+        line = data[pos:end].strip()
+        pos = end + 1
+        lineno += 1
+        if not line:
+            continue
+        if line.translate(None, b"01"):
+            yield lineno, None, "Bits inválidos"
+            continue
+        yield lineno, BitFrame(int(line, 2), len(line)), None
+
+def decode_record(algorithm: str, bits: BitFrame, with_data: bool = True,
+                  encoding: Optional[str] = None, errors: str = "strict") -> dict:
+    """
+    Decodifica una trama sin imprimir con el códec del registro y arma su
+    registro de salida (mismas claves que el receptor WS, con los "details"
+    del códec al primer nivel).
+    """
+    codec = CODECS.get(algorithm)
+    if codec is None:
+        return {"status": "error", "reason": f"Algoritmo no soportado: {algorithm}"}
+    decoded = codec.decode(bits)
+    record = {"status": "error" if decoded.error else "ok"}
+    if decoded.details:
+        record.update(decoded.details)
+    if decoded.error:
+        record["reason"] = decoded.error
+    if decoded.data is None:
+        return record
+
+    if with_data:
+        record["decoded_bits"] = decoded.data.to_bits()
+    if encoding:
+        try:
+            record["decoded_text"] = bits_to_text(decoded.data, encoding, errors)
+        except ValueError as e:
+            record["text_error"] = str(e)
+    return record
+
+def iter_records(data, args: argparse.Namespace) -> Iterator[dict]:
+    """Registros de salida de todo el archivo, en orden, de a uno."""
+    options = (not args.no_data, args.text_encoding, args.text_errors)
+    if args.format == "wire":
+        for index, frame in enumerate(iter_frames(data), 1):
+            record = {"frame": index, "algorithm": frame.algorithm, "input_len": len(frame.bits)}
+            if frame.frame_id is not None:
+                record["id"] = frame.frame_id
+            record.update(decode_record(frame.algorithm, frame.bits, *options))
+            yield record
+        return
+
+    for lineno, bits, error in iter_line_frames(data):
+        record = {"line": lineno, "algorithm": args.algorithm}
+        if bits is None:
+            record.update(status="error", reason=error)
+        else:
+            record["input_len"] = len(bits)
+            record.update(decode_record(args.algorithm, bits, *options))
+        yield record
+
+def write_record(out, record: dict, totals: dict):
+    """Escribe un registro JSON Lines y lo suma al resumen."""
+    ok = record["status"] == "ok"
+    totals["frames"] += 1
+    totals["ok" if ok else "error"] += 1
+    codec = CODECS.get(record.get("algorithm"))
+    if codec is not None and codec.classify(ok, record).corrected:
+        totals["corrected"] += 1
+    out.write(json.dumps(record, ensure_ascii=False))
+    out.write("\n")
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Decodifica todo el archivo de entrada como flujo sobre un mmap y escribe
+    un JSON por línea en la salida. El archivo nunca se carga completo.
+    Si un volcado binario está truncado o corrupto, escribe un registro de
+    error para ese punto, el resumen, y devuelve 1.
+    """
+    input_path = Path(args.input)
+    if not input_path.exists():
+        raise FileNotFoundError(f"No se encontró el archivo {input_path}")
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    # Con la salida en stdout, el resumen va a stderr para no mezclarse
+    report = sys.stderr if out is sys.stdout else sys.stdout
+    totals = {"frames": 0, "ok": 0, "error": 0, "corrected": 0}
+    status = 0
+    start = time.perf_counter()
+    size = input_path.stat().st_size
+    try:
+        with input_path.open("rb") as f:
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    if hasattr(data, "madvise"):
+                        data.madvise(mmap.MADV_SEQUENTIAL)
+                    try:
+                        for record in iter_records(data, args):
+                            write_record(out, record, totals)
+                    except ValueError as e:
+                        # iter_frames no puede seguir después de un registro inválido
+                        write_record(out, {"frame": totals["frames"] + 1, "status": "error",
+                                           "reason": f"Volcado binario inválido: {e}"}, totals)
+                        status = 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Tramas: {totals['frames']} (ok: {totals['ok']}, error: {totals['error']}, "
+          f"corregidas: {totals['corrected']}) en {elapsed:.2f}s "
+          f"({size / max(elapsed, 1e-9) / 1e6:.1f} MB/s)", file=report)
+    if status:
+        print("Error: el volcado binario está truncado o corrupto", file=report)
+    return status
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Receptor por lotes: decodifica un archivo de tramas sin el menú interactivo")
+    parser.add_argument("--input", "-i", required=True, help="Archivo de entrada")
+    parser.add_argument("--output", "-o", default="-", help="Salida JSON Lines ('-' = stdout)")
+    parser.add_argument("--algorithm", "-a", choices=sorted(CODECS),
+                        help="Algoritmo de las tramas (obligatorio con --format lines)")
+    parser.add_argument("--format", "-f", choices=FORMATS, default="lines",
+                        help="lines: una trama '0'/'1' por línea; wire: volcado binario de wire/wire.py")
+    parser.add_argument("--no-data", action="store_true", help="No incluir decoded_bits en la salida")
+    parser.add_argument("--text-encoding", help="Agregar decoded_text con esta codificación (ascii, latin-1, utf-8)")
+    parser.add_argument("--text-errors", default="strict", choices=TEXT_ERRORS)
+    args = parser.parse_args(argv)
+    if args.format == "lines" and not args.algorithm:
+        parser.error("--algorithm es obligatorio con --format lines")
+    if args.text_encoding:
+        try:
+            args.text_encoding = check_text_encoding(args.text_encoding, args.text_errors)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+if __name__ == "__main__":
+    # Sin argumentos: modo interactivo original (tests/mensaje.txt)
+    if len(sys.argv) > 1:
+        sys.exit(run_batch(parse_args()))
+    main()
\ No newline at end of file
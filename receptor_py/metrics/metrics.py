@@ -0,0 +1,259 @@
+# Métricas del receptor WebSocket: contadores, histogramas de latencia y
+# gauges, expuestos en formato de texto de Prometheus (render) o como un
+# dict para logs estructurados (snapshot).
+#
+# Todo se actualiza en el proceso del event loop a partir de las respuestas,
+# así que funciona igual con cualquier backend de DecodePool. El costo por
+# mensaje es un puñado de sumas en dicts y un bisect. Qué cuenta como trama
+# corregida / no corregible / detectada lo decide cada códec del registro
+# (Codec.classify).
+
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from codec.registry import CODECS
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Límites superiores (segundos) de los buckets de latencia: 10 µs .. 10 s
+LATENCY_BUCKETS = (
+    1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Histograma acumulativo con buckets fijos (estilo Prometheus)."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # Un contador por bucket más el de +Inf
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Cuantil aproximado: límite superior del bucket que lo contiene."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class ConnectionStats:
+    """Tráfico de una conexión abierta, para calcular sus tasas."""
+
+    __slots__ = ("peer", "opened", "messages", "frames", "bytes_in")
+
+    def __init__(self, peer: str):
+        self.peer = peer
+        self.opened = time.monotonic()
+        self.messages = 0
+        self.frames = 0
+        self.bytes_in = 0
+
+    def rates(self, now: float) -> Tuple[float, float]:
+        """(tramas/s, bytes/s) desde que se abrió la conexión."""
+        elapsed = max(now - self.opened, 1e-9)
+        return self.frames / elapsed, self.bytes_in / elapsed
+
+
+def _labels(**labels: str) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in items) + "}"
+
+
+def summarize_results(results: List[dict]) -> tuple:
+    """(algoritmo, status, corregida, no corregible, detectada) por cada respuesta."""
+    outcomes = []
+    for result in results:
+        algorithm = result.get("algorithm") or "desconocido"
+        status = result.get("status", "error")
+        codec = CODECS.get(algorithm)
+        if codec is None:
+            corrected = uncorrectable = detected = False
+        else:
+            corrected, uncorrectable, detected = codec.classify(status == "ok", result.get("details"))
+        outcomes.append((algorithm, status, corrected, uncorrectable, detected))
+    return tuple(outcomes)
+
+
+class Metrics:
+    """
+    Registro de métricas del receptor.
+
+    Los contadores se guardan por nombre y etiquetas; los gauges se leen
+    al renderizar (funciones registradas con `gauge`).
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.counters: Dict[str, Dict[Labels, float]] = defaultdict(lambda: defaultdict(float))
+        self.histograms: Dict[str, Dict[Labels, Histogram]] = defaultdict(dict)
+        self.gauges: Dict[str, Callable[[], float]] = {}
+        self.connections: Dict[int, ConnectionStats] = {}
+        self.help: Dict[str, str] = {
+            "ws_messages_total": "Mensajes WebSocket recibidos por tipo",
+            "ws_bytes_received_total": "Bytes recibidos en mensajes WebSocket",
+            "ws_frames_total": "Tramas decodificadas por algoritmo y status",
+            "ws_frames_detected_total": "Tramas con error detectado",
+            "ws_frames_corrected_total": "Tramas corregidas (códecs que corrigen)",
+            "ws_frames_uncorrectable_total": "Tramas con errores que no se pudieron corregir",
+            "ws_decode_seconds": "Latencia de decodificación (incluye la espera en el pool)",
+            "ws_message_seconds": "Latencia total por mensaje, de la recepción al envío",
+            "ws_connections": "Conexiones abiertas",
+            "ws_connection_frames_per_second": "Tramas por segundo de cada conexión abierta",
+            "ws_connection_bytes_per_second": "Bytes por segundo de cada conexión abierta",
+            "ws_uptime_seconds": "Segundos desde que arrancó el receptor",
+            "ws_cache_hits_total": "Tramas respondidas desde la caché",
+            "ws_cache_misses_total": "Tramas que no estaban en la caché",
+            "ws_cache_evictions_total": "Entradas desalojadas de la caché por cantidad o memoria",
+        }
+
+    # -------- registro ----------
+    def inc(self, name: str, value: float = 1, **labels: str):
+        self.counters[name][_labels(**labels)] += value
+
+    def observe(self, name: str, value: float, **labels: str):
+        key = _labels(**labels)
+        series = self.histograms[name]
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(value)
+
+    def gauge(self, name: str, fn: Callable[[], float], help_text: str = ""):
+        self.gauges[name] = fn
+        if help_text:
+            self.help[name] = help_text
+
+    # -------- conexiones ----------
+    def open_connection(self, peer) -> ConnectionStats:
+        if isinstance(peer, tuple):
+            peer = ":".join(str(part) for part in peer[:2])
+        conn = ConnectionStats(str(peer or "desconocido"))
+        self.connections[id(conn)] = conn
+        return conn
+
+    def close_connection(self, conn: ConnectionStats):
+        self.connections.pop(id(conn), None)
+
+    def record_message(self, conn: ConnectionStats, kind: str, size: int):
+        conn.messages += 1
+        conn.bytes_in += size
+        self.inc("ws_messages_total", kind=kind)
+        self.inc("ws_bytes_received_total", size)
+
+    def record_results(self, conn: ConnectionStats, results: List[dict]) -> tuple:
+        """
+        Cuenta tramas y resultados de detección/corrección a partir de las
+        respuestas. Devuelve el resumen por trama (ver summarize_results).
+        """
+        outcomes = summarize_results(results)
+        self.record_outcomes(conn, outcomes)
+        return outcomes
+
+    def record_outcomes(self, conn: ConnectionStats, outcomes: tuple):
+        conn.frames += len(outcomes)
+        for algorithm, status, corrected, uncorrectable, detected in outcomes:
+            self.inc("ws_frames_total", algorithm=algorithm, status=status)
+            if corrected:
+                self.inc("ws_frames_corrected_total", algorithm=algorithm)
+            if uncorrectable:
+                self.inc("ws_frames_uncorrectable_total", algorithm=algorithm)
+            if detected:
+                self.inc("ws_frames_detected_total", algorithm=algorithm)
+
+    # -------- exposición ----------
+    def render(self) -> str:
+        """Texto en formato de exposición de Prometheus."""
+        now = time.monotonic()
+        lines = []
+
+        def header(name: str, kind: str):
+            if name in self.help:
+                lines.append(f"# HELP {name} {self.help[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for name, series in sorted(self.counters.items()):
+            header(name, "counter")
+            for labels, value in sorted(series.items()):
+                lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+        for name, series in sorted(self.histograms.items()):
+            header(name, "histogram")
+            for labels, hist in sorted(series.items()):
+                cumulative = 0
+                for bound, count in zip(hist.buckets, hist.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {hist.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {hist.sum:.9g}")
+                lines.append(f"{name}_count{_format_labels(labels)} {hist.count}")
+
+        gauges = dict(self.gauges)
+        gauges["ws_connections"] = lambda: len(self.connections)
+        gauges["ws_uptime_seconds"] = lambda: now - self.started
+        for name, fn in sorted(gauges.items()):
+            header(name, "gauge")
+            lines.append(f"{name} {fn():g}")
+
+        for index, name in enumerate(("ws_connection_frames_per_second", "ws_connection_bytes_per_second")):
+            header(name, "gauge")
+            for conn in self.connections.values():
+                lines.append(f"{name}{_format_labels(_labels(peer=conn.peer))} {conn.rates(now)[index]:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        """Resumen compacto para un log estructurado periódico."""
+        now = time.monotonic()
+        counters = {
+            name: {",".join(f"{k}={v}" for k, v in labels) or "total": value
+                   for labels, value in series.items()}
+            for name, series in self.counters.items()
+        }
+        latency = {
+            f"{name}{{{','.join(f'{k}={v}' for k, v in labels)}}}": {
+                "count": hist.count,
+                "mean": hist.sum / hist.count if hist.count else 0.0,
+                "p50": hist.quantile(0.5),
+                "p99": hist.quantile(0.99),
+                "p999": hist.quantile(0.999),
+            }
+            for name, series in self.histograms.items()
+            for labels, hist in series.items()
+        }
+        return {
+            "uptime_s": round(now - self.started, 3),
+            "connections": len(self.connections),
+            "gauges": {name: fn() for name, fn in self.gauges.items()},
+            "counters": counters,
+            "latency": latency,
+        }
@@ -0,0 +1,284 @@
+/*
+ * Núcleos en C para el receptor (extensión opcional, API C de CPython).
+ *
+ *   hamming_syndrome(buf)             -> (síndrome, paridad)
+ *   hamming_extract(code, nbits, pos) -> bytes con los bits de datos
+ *   fletcher16_sums(data, s1, s2)     -> (sum1, sum2)
+ *   crc16_ccitt(data, crc)            -> crc
+ *
+ * Cada función replica exactamente a su equivalente en Python
+ * (hamming/hamming.py, fletcher16/fletcher16.py y crc/crc.py), que se usa cuando la
+ * extensión no está compilada. Todas liberan el GIL durante el bucle.
+ *
+ * Compilar con: python native/build.py (desde receptor_py/)
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+/* XOR de los índices (0..7, MSB primero) de los bits en 1 y paridad por byte */
+static uint8_t BYTE_SYNDROME[256];
+static uint8_t BYTE_PARITY[256];
+
+/* Tablas slicing-by-8 de CRC-16-CCITT (poly 0x1021, MSB primero) */
+static uint16_t CRC16_TABLES[8][256];
+
+/* Bytes acumulables antes de reducir módulo 255 sin desbordar 64 bits */
+#define FLETCHER16_BLOCK (1 << 20)
+
+static void build_tables(void)
+{
+    for (int b = 0; b < 256; b++) {
+        uint8_t s = 0, p = 0;
+        for (int j = 0; j < 8; j++) {
+            if (b & (0x80 >> j)) {
+                s ^= (uint8_t)j;
+                p ^= 1;
+            }
+        }
+        BYTE_SYNDROME[b] = s;
+        BYTE_PARITY[b] = p;
+
+        uint16_t crc = (uint16_t)(b << 8);
+        for (int j = 0; j < 8; j++)
+            crc = (uint16_t)((crc << 1) ^ ((crc & 0x8000) ? 0x1021 : 0));
+        CRC16_TABLES[0][b] = crc;
+    }
+    for (int k = 1; k < 8; k++)
+        for (int b = 0; b < 256; b++) {
+            uint16_t prev = CRC16_TABLES[k - 1][b];
+            CRC16_TABLES[k][b] = (uint16_t)((prev << 8) ^ CRC16_TABLES[0][prev >> 8]);
+        }
+}
+
+/*
+ * Igual que syndrome_and_parity(): `buf` ya trae el bit 0 ficticio al
+ * inicio, así que el índice de cada bit coincide con su posición Hamming.
+ */
+static PyObject *
+hamming_syndrome(PyObject *self, PyObject *args)
+{
+    Py_buffer buf;
+    if (!PyArg_ParseTuple(args, "y*", &buf))
+        return NULL;
+
+    const uint8_t *p = (const uint8_t *)buf.buf;
+    Py_ssize_t n = buf.len;
+    uint64_t syndrome = 0;
+    unsigned int parity = 0;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t k = 0; k < n; k++) {
+        uint8_t b = p[k];
+        /* Sin saltos: con datos aleatorios los if fallan la predicción */
+        uint64_t odd = BYTE_PARITY[b];
+        syndrome ^= BYTE_SYNDROME[b] ^ (((uint64_t)k << 3) & (0 - odd));
+        parity ^= (unsigned int)odd;
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&buf);
+    return Py_BuildValue("KI", (unsigned long long)syndrome, parity);
+}
+
+/* Bits que se copian por iteración: 64 menos el desplazamiento máximo */
+#define CHUNK_BITS 56
+
+/* 8 bytes big-endian desde `b`; fuera del buffer, ceros */
+static inline uint64_t
+load_be64(const uint8_t *src, Py_ssize_t len, Py_ssize_t b)
+{
+    uint64_t w = 0;
+#if defined(__GNUC__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+    if (b + 8 <= len) {
+        memcpy(&w, src + b, 8);
+        return __builtin_bswap64(w);
+    }
+#endif
+    for (int j = 0; j < 8; j++)
+        w = (w << 8) | (b + j < len ? src[b + j] : 0);
+    return w;
+}
+
+/* Bits [i, i+56) de `src` (MSB primero) en los 56 bits altos del resultado */
+static inline uint64_t
+get56(const uint8_t *src, Py_ssize_t len, Py_ssize_t i)
+{
+    return (load_be64(src, len, i >> 3) << (i & 7)) & ~(uint64_t)0xFF;
+}
+
+/* ORea los bits altos de `v` en `dst` a partir del bit `w` */
+static inline void
+put56(uint8_t *dst, Py_ssize_t len, Py_ssize_t w, uint64_t v)
+{
+    Py_ssize_t b = w >> 3;
+    v >>= (w & 7);
+#if defined(__GNUC__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+    if (b + 8 <= len) {
+        uint64_t cur;
+        memcpy(&cur, dst + b, 8);
+        cur |= __builtin_bswap64(v);
+        memcpy(dst + b, &cur, 8);
+        return;
+    }
+#endif
+    for (int j = 0; j < 8 && b + j < len; j++)
+        dst[b + j] |= (uint8_t)(v >> (56 - 8 * j));
+}
+
+/*
+ * Invierte la posición `flip` (1-indexada; 0 = ninguna) de la palabra de
+ * `nbits` bits empaquetada MSB primero y copia los bits que no están en
+ * potencias de 2, empaquetados igual (relleno con ceros al final).
+ */
+static PyObject *
+hamming_extract(PyObject *self, PyObject *args)
+{
+    Py_buffer buf;
+    Py_ssize_t nbits, flip;
+    if (!PyArg_ParseTuple(args, "y*nn", &buf, &nbits, &flip))
+        return NULL;
+    if (nbits < 0 || (nbits + 7) / 8 > buf.len) {
+        PyBuffer_Release(&buf);
+        PyErr_SetString(PyExc_ValueError, "El buffer no contiene nbits bits");
+        return NULL;
+    }
+    /* Un síndrome fuera de la palabra escribiría fuera de la salida */
+    if (flip < 0 || flip > nbits) {
+        PyBuffer_Release(&buf);
+        /* El formato de PyErr_Format debe ser ASCII; el texto va como argumento UTF-8 */
+        PyErr_Format(PyExc_ValueError, "%s %zd fuera de rango (0..%zd)", "Posición", flip, nbits);
+        return NULL;
+    }
+
+    Py_ssize_t parity_count = 0;
+    for (Py_ssize_t p = 1; p <= nbits; p <<= 1)
+        parity_count++;
+    Py_ssize_t k = nbits - parity_count;
+
+    Py_ssize_t out_len = (k + 7) / 8;
+    PyObject *out = PyBytes_FromStringAndSize(NULL, out_len);
+    if (out == NULL) {
+        PyBuffer_Release(&buf);
+        return NULL;
+    }
+    uint8_t *dst = (uint8_t *)PyBytes_AS_STRING(out);
+    const uint8_t *src = (const uint8_t *)buf.buf;
+    Py_ssize_t src_len = buf.len;
+
+    Py_BEGIN_ALLOW_THREADS
+    memset(dst, 0, (size_t)out_len);
+    Py_ssize_t written = 0;
+    /* Tramos de datos entre paridades: posiciones p+1 .. 2p-1 (0-indexado [p, 2p-1)) */
+    for (Py_ssize_t p = 1; p < nbits; p <<= 1) {
+        Py_ssize_t i = p;
+        Py_ssize_t end = 2 * p - 1 < nbits ? 2 * p - 1 : nbits;
+        while (end - i >= CHUNK_BITS) {
+            put56(dst, out_len, written, get56(src, src_len, i));
+            i += CHUNK_BITS;
+            written += CHUNK_BITS;
+        }
+        if (i < end) {
+            Py_ssize_t rest = end - i;
+            uint64_t v = get56(src, src_len, i) & ~(~(uint64_t)0 >> rest);
+            put56(dst, out_len, written, v);
+            written += rest;
+        }
+    }
+    /* La corrección solo afecta a los datos si `flip` no es una paridad */
+    if (flip > 2 && (flip & (flip - 1))) {
+        Py_ssize_t parities_before = 0;
+        for (Py_ssize_t p = 1; p < flip; p <<= 1)
+            parities_before++;
+        Py_ssize_t d = flip - 1 - parities_before;
+        dst[d >> 3] ^= (uint8_t)(0x80 >> (d & 7));
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&buf);
+    return out;
+}
+
+/* Igual que fletcher16_sums(): (sum1, sum2) reducidos módulo 255 */
+static PyObject *
+fletcher16_sums(PyObject *self, PyObject *args)
+{
+    Py_buffer buf;
+    unsigned int sum1_in = 0, sum2_in = 0;
+    if (!PyArg_ParseTuple(args, "y*|II", &buf, &sum1_in, &sum2_in))
+        return NULL;
+
+    const uint8_t *p = (const uint8_t *)buf.buf;
+    Py_ssize_t n = buf.len;
+    uint64_t sum1 = sum1_in % 255, sum2 = sum2_in % 255;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (Py_ssize_t start = 0; start < n; start += FLETCHER16_BLOCK) {
+        Py_ssize_t end = start + FLETCHER16_BLOCK < n ? start + FLETCHER16_BLOCK : n;
+        for (Py_ssize_t i = start; i < end; i++) {
+            sum1 += p[i];
+            sum2 += sum1;
+        }
+        sum1 %= 255;
+        sum2 %= 255;
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&buf);
+    return Py_BuildValue("II", (unsigned int)sum1, (unsigned int)sum2);
+}
+
+/* Igual que crc16_python(): 8 bytes por iteración con 8 tablas */
+static PyObject *
+crc16_ccitt(PyObject *self, PyObject *args)
+{
+    Py_buffer buf;
+    unsigned int crc_in = 0xFFFF;
+    if (!PyArg_ParseTuple(args, "y*|I", &buf, &crc_in))
+        return NULL;
+
+    const uint8_t *p = (const uint8_t *)buf.buf;
+    Py_ssize_t n = buf.len;
+    uint16_t crc = (uint16_t)crc_in;
+
+    Py_BEGIN_ALLOW_THREADS
+    Py_ssize_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        crc = CRC16_TABLES[7][p[i] ^ (crc >> 8)] ^ CRC16_TABLES[6][p[i + 1] ^ (crc & 0xFF)]
+            ^ CRC16_TABLES[5][p[i + 2]] ^ CRC16_TABLES[4][p[i + 3]]
+            ^ CRC16_TABLES[3][p[i + 4]] ^ CRC16_TABLES[2][p[i + 5]]
+            ^ CRC16_TABLES[1][p[i + 6]] ^ CRC16_TABLES[0][p[i + 7]];
+    }
+    for (; i < n; i++)
+        crc = (uint16_t)((crc << 8) ^ CRC16_TABLES[0][(crc >> 8) ^ p[i]]);
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&buf);
+    return PyLong_FromUnsignedLong(crc);
+}
+
+static PyMethodDef kernel_methods[] = {
+    {"hamming_syndrome", hamming_syndrome, METH_VARARGS,
+     "hamming_syndrome(buf) -> (sindrome, paridad)"},
+    {"hamming_extract", hamming_extract, METH_VARARGS,
+     "hamming_extract(code, nbits, flip) -> bytes de datos"},
+    {"fletcher16_sums", fletcher16_sums, METH_VARARGS,
+     "fletcher16_sums(data, sum1=0, sum2=0) -> (sum1, sum2)"},
+    {"crc16_ccitt", crc16_ccitt, METH_VARARGS,
+     "crc16_ccitt(data, crc=0xFFFF) -> crc"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef kernels_module = {
+    PyModuleDef_HEAD_INIT, "_kernels",
+    "Nucleos en C de Hamming, Fletcher-16 y CRC-16 para el receptor.",
+    -1, kernel_methods
+};
+
+PyMODINIT_FUNC
+PyInit__kernels(void)
+{
+    build_tables();
+    return PyModule_Create(&kernels_module);
+}
@@ -0,0 +1,37 @@
+# Compila native/_kernels.c como extensión de CPython junto a este archivo.
+# Solo usa la biblioteca estándar (sysconfig) y el compilador de C con el
+# que se construyó Python; no hace falta setuptools.
+#
+# Uso (desde receptor_py/):
+#   python native/build.py
+#
+# Si la extensión no está compilada, hamming.py, fletcher16.py y crc.py usan sus
+# rutas en Python (mismos resultados; ver benchmarks/native_parity.py).
+
+import shlex
+import subprocess
+import sysconfig
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+SOURCE = HERE / "_kernels.c"
+
+
+def build() -> Path:
+    ldshared = sysconfig.get_config_var("LDSHARED")
+    suffix = sysconfig.get_config_var("EXT_SUFFIX")
+    if not ldshared or not suffix:
+        raise SystemExit("Esta instalación de Python no expone LDSHARED/EXT_SUFFIX (¿Windows?)")
+    target = HERE / f"_kernels{suffix}"
+    command = shlex.split(ldshared) + [
+        "-O3", "-fPIC",
+        f"-I{sysconfig.get_paths()['include']}",
+        str(SOURCE), "-o", str(target),
+    ]
+    print(" ".join(command))
+    subprocess.run(command, check=True)
+    return target
+
+
+if __name__ == "__main__":
+    print(f"Extensión compilada: {build()}")
@@ -0,0 +1,17 @@
+# Carga opcional de los núcleos en C (native/_kernels.c).
+# RECEPTOR_PURE_PYTHON=1 fuerza las rutas en Python aunque estén compilados.
+
+import os
+from types import ModuleType
+from typing import Optional
+
+
+def load_kernels() -> Optional[ModuleType]:
+    """Módulo _kernels si está compilado y habilitado; None para usar Python."""
+    if os.getenv("RECEPTOR_PURE_PYTHON", "0") == "1":
+        return None
+    try:
+        from native import _kernels
+    except ImportError:  # extensión no compilada: rutas en Python
+        return None
+    return _kernels
@@ -0,0 +1,368 @@
+# Simulador Monte-Carlo del canal con errores, en memoria.
+#
+# Reemplaza el flujo emisor (test_generator.ts) -> CSV -> tests.py para
+# estadísticas grandes: por cada combinación de códec x tamaño de datos x
+# canal genera los datos y el ruido con el RNG de NumPy (vectorizado por
+# bloque de tramas), codifica con los códecs del registro (codec/registry.py),
+# decodifica cada bloque con un solo Codec.decode_batch y acumula solo
+# contadores. Los bloques se reparten en procesos y cada combinación se
+# reporta (y se agrega al CSV de salida) en cuanto se completa.
+#
+# Canales (CHANNELS):
+#   bsc:<p>     canal binario simétrico, cada bit se invierte con prob. p
+#   burst:<b>   una ráfaga de b bits por trama (b entero >= 1; extremos
+#               invertidos, el interior al azar), en una posición uniforme
+#   gilbert:<p_gb>,<p_bg>,<e_b>[,<e_g>]
+#               Gilbert-Elliott: cadena de Markov de dos estados (bueno /
+#               malo) por bit; p_gb y p_bg son las probabilidades de pasar
+#               de bueno a malo y de malo a bueno, e_b y e_g (0 por defecto)
+#               la probabilidad de error en cada estado. Ráfagas de largo
+#               medio 1/p_bg
+#
+# Además de las tasas de detección/corrección se reporta el goodput (bits
+# de datos entregados intactos / bits enviados por el canal) y la latencia
+# estructural del códec (Codec.latency: bits que hay que recibir antes de
+# entregar el primer dato; el entrelazado la lleva a todo el bloque).
+#
+# Uso (desde receptor_py/):
+#   python simulator/simulator.py --trials 1000000 --workers 0
+#   python simulator/simulator.py --codecs hamming crc32 --sizes 256 \
+#       --channels bsc:0.001 bsc:0.01 burst:8 --output results/simulacion.csv
+#   python simulator/simulator.py --codecs hamming hamming_blocked hamming_interleaved \
+#       --sizes 256 --channels gilbert:0.01,0.2,0.5
+
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitframe.bitframe import BitFrame, as_bitframe
+from codec.registry import CODECS
+
+DEFAULT_SIZES = [32, 64, 128, 256, 512]
+DEFAULT_CHANNELS = ["bsc:0.0", "bsc:0.01", "bsc:0.02", "bsc:0.05", "bsc:0.1"]
+DEFAULT_TRIALS = 100_000
+# Tramas por bloque: una tarea del pool y una matriz de ruido
+DEFAULT_CHUNK = 4096
+
+
+# -------- canales ----------
+def bsc_mask(rng: np.random.Generator, frames: int, bits: int, p: float) -> np.ndarray:
+    """Matriz (tramas x bits) de errores independientes con probabilidad p."""
+    if not 0 <= p <= 1:
+        raise ValueError(f"BSC: la probabilidad debe estar entre 0 y 1: {p:g}")
+    if p == 0:
+        return np.zeros((frames, bits), dtype=bool)
+    return rng.random((frames, bits)) < p
+
+
+def burst_mask(rng: np.random.Generator, frames: int, bits: int, length: float) -> np.ndarray:
+    """Una ráfaga de `length` bits por trama: extremos invertidos, interior al azar."""
+    if not (length >= 1 and float(length).is_integer()):
+        raise ValueError(f"Ráfaga: el largo debe ser un entero >= 1: {length:g}")
+    length = min(int(length), bits)
+    mask = np.zeros((frames, bits), dtype=bool)
+    if length <= 0:  # trama vacía
+        return mask
+    starts = rng.integers(0, bits - length + 1, size=frames)
+    inner = rng.random((frames, length)) < 0.5
+    inner[:, 0] = inner[:, -1] = True
+    columns = starts[:, None] + np.arange(length)
+    np.put_along_axis(mask, columns, inner, axis=1)
+    return mask
+
+
+def gilbert_mask(rng: np.random.Generator, frames: int, bits: int, p_gb: float, p_bg: float,
+                 e_b: float, e_g: float = 0.0) -> np.ndarray:
+    """
+    Errores de Gilbert-Elliott. Cada trama arranca en el estado estacionario
+    (malo con probabilidad p_gb / (p_gb + p_bg)); la cadena avanza bit a bit
+    para todas las tramas del bloque a la vez.
+    """
+    if not (0 < p_gb + p_bg and all(0 <= x <= 1 for x in (p_gb, p_bg, e_b, e_g))):
+        raise ValueError("Gilbert-Elliott: probabilidades entre 0 y 1, p_gb + p_bg > 0: "
+                         f"{p_gb:g},{p_bg:g},{e_b:g},{e_g:g}")
+    bad = rng.random(frames) < p_gb / (p_gb + p_bg)
+    errors = rng.random((frames, bits))
+    moves = rng.random((frames, bits))
+    mask = np.empty((frames, bits), dtype=bool)
+    for j in range(bits):
+        mask[:, j] = errors[:, j] < np.where(bad, e_b, e_g)
+        bad = np.where(bad, moves[:, j] >= p_bg, moves[:, j] < p_gb)
+    return mask
+
+
+# nombre -> (función (rng, tramas, bits, *parámetros) -> matriz de errores,
+#            cantidad mínima y máxima de parámetros)
+CHANNELS: Dict[str, Tuple[Callable[..., np.ndarray], int, int]] = {
+    "bsc": (bsc_mask, 1, 1),
+    "burst": (burst_mask, 1, 1),
+    "gilbert": (gilbert_mask, 3, 4),
+}
+
+
+class Channel(NamedTuple):
+    kind: str
+    params: Tuple[float, ...]
+
+    @classmethod
+    def parse(cls, spec: str) -> "Channel":
+        """'bsc:0.01' -> Channel('bsc', (0.01,)); 'gilbert:0.01,0.2,0.5' -> 3 parámetros."""
+        kind, _, text = spec.partition(":")
+        if kind not in CHANNELS:
+            raise ValueError(f"Canal no soportado: {kind} (use {', '.join(CHANNELS)})")
+        _, least, most = CHANNELS[kind]
+        try:
+            params = tuple(float(param) for param in text.split(","))
+        except ValueError:
+            raise ValueError(f"Parámetro inválido para el canal {kind}: {text!r}") from None
+        if not least <= len(params) <= most:
+            raise ValueError(f"El canal {kind} recibe de {least} a {most} parámetros: {text!r}")
+        channel = cls(kind, params)
+        channel.mask(np.random.default_rng(0), 0, 0)  # valida los parámetros antes de repartir
+        return channel
+
+    def mask(self, rng: np.random.Generator, frames: int, bits: int) -> np.ndarray:
+        return CHANNELS[self.kind][0](rng, frames, bits, *self.params)
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{','.join(f'{param:g}' for param in self.params)}"
+
+
+# -------- contadores ----------
+@dataclass
+class CellStats:
+    """Contadores acumulados de una combinación códec x tamaño x canal."""
+    frames: int = 0
+    # Bits enviados por el canal (datos + redundancia)
+    channel_bits: int = 0
+    # Tramas con al menos un bit invertido y total de bits invertidos
+    damaged: int = 0
+    flipped_bits: int = 0
+    # El decodificador rechazó la trama o la marcó como no corregible
+    rejected: int = 0
+    # Trama dañada aceptada con los datos originales (corregida)
+    corrected: int = 0
+    # Trama aceptada con datos distintos a los originales (error no detectado)
+    silent: int = 0
+    # Trama intacta rechazada (no debería ocurrir)
+    false_alarms: int = 0
+    # Tramas entregadas con los datos originales (dañadas o no)
+    delivered: int = 0
+    delivered_bits: int = 0
+    # Tiempo de decodificación acumulado
+    decode_ns: int = 0
+
+    def merge(self, other: "CellStats"):
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    def rates(self) -> Dict[str, float]:
+        damaged = self.damaged or 1
+        return {
+            "detection_rate": self.rejected / damaged,
+            "correction_rate": self.corrected / damaged,
+            "undetected_rate": self.silent / damaged,
+            "residual_frame_error_rate": self.silent / (self.frames or 1),
+            "goodput": self.delivered_bits / (self.channel_bits or 1),
+            "decode_us": self.decode_ns / 1000 / (self.frames or 1),
+        }
+
+
+class Cell(NamedTuple):
+    codec: str
+    size: int
+    channel: Channel
+
+
+# -------- simulación ----------
+def _rows_to_ints(bits: np.ndarray) -> List[int]:
+    """Cada fila de una matriz de bits (MSB primero) como entero."""
+    width = bits.shape[1]
+    pad = (-width) % 8
+    packed = np.packbits(bits, axis=1)
+    return [int.from_bytes(row, "big") >> pad for row in map(bytes, packed)]
+
+
+def simulate_chunk(task: Tuple[int, Cell, int, int, int]) -> Tuple[int, CellStats]:
+    """
+    Simula `frames` tramas de una combinación. Función de módulo para poder
+    enviarla a un ProcessPoolExecutor; la semilla depende solo de (seed,
+    combinación, bloque), así el resultado no depende del número de procesos.
+    """
+    index, cell, chunk, frames, seed = task
+    rng = np.random.default_rng([seed, index, chunk])
+    codec = CODECS[cell.codec]
+    k = cell.size
+
+    payloads = _rows_to_ints(rng.integers(0, 2, size=(frames, k), dtype=np.uint8))
+    codes = [codec.encode(BitFrame(value, k)) for value in payloads]
+    n = len(codes[0]) if codes else 0
+    errors = cell.channel.mask(rng, frames, n)
+    flips = errors.sum(axis=1)
+    received = [BitFrame(code.value ^ mask, n) for code, mask in zip(codes, _rows_to_ints(errors))]
+
+    start = time.perf_counter_ns()
+    batch = codec.decode_batch(received)
+    stats = CellStats(frames=frames, channel_bits=frames * n, flipped_bits=int(flips.sum()),
+                      decode_ns=time.perf_counter_ns() - start)
+    for value, error, data, uncorrectable, flipped in zip(payloads, batch.errors, batch.data,
+                                                         batch.uncorrectable, flips):
+        rejected = error is not None or uncorrectable
+        intact = data is not None and len(data) == k and as_bitframe(data).value == value
+        if intact and not rejected:
+            stats.delivered += 1
+        if flipped:
+            stats.damaged += 1
+            if rejected:
+                stats.rejected += 1
+            elif intact:
+                stats.corrected += 1
+            else:
+                stats.silent += 1
+        elif rejected:
+            stats.false_alarms += 1
+        elif not intact:
+            stats.silent += 1
+    stats.delivered_bits = stats.delivered * k
+    return index, stats
+
+
+def iter_tasks(cells: List[Cell], trials: int, chunk: int, seed: int) -> Iterator[Tuple[int, Cell, int, int, int]]:
+    for index, cell in enumerate(cells):
+        for start in range(0, trials, chunk):
+            yield index, cell, start // chunk, min(chunk, trials - start), seed
+
+
+def run_grid(cells: List[Cell], trials: int, chunk: int = DEFAULT_CHUNK, workers: int = 1,
+             seed: int = 0) -> Iterator[Tuple[Cell, CellStats]]:
+    """
+    Simula `trials` tramas por combinación y entrega (combinación, contadores)
+    en orden a medida que cada una se completa. Con workers > 1 los bloques
+    corren en procesos, con como mucho 2 bloques en vuelo por proceso.
+    """
+    totals = [CellStats() for _ in cells]
+    remaining = [-(-trials // chunk) for _ in cells]
+    tasks = iter_tasks(cells, trials, chunk, seed)
+
+    def collect(result):
+        index, stats = result
+        totals[index].merge(stats)
+        remaining[index] -= 1
+        return index if remaining[index] == 0 else None
+
+    if workers <= 1:
+        for task in tasks:
+            done = collect(simulate_chunk(task))
+            if done is not None:
+                yield cells[done], totals[done]
+        return
+
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(simulate_chunk, task))
+            while len(pending) >= max_pending or (pending and pending[0].done()):
+                done = collect(pending.popleft().result())
+                if done is not None:
+                    yield cells[done], totals[done]
+        while pending:
+            done = collect(pending.popleft().result())
+            if done is not None:
+                yield cells[done], totals[done]
+
+
+# -------- CLI ----------
+CSV_COLUMNS = (["algorithm", "dataSize", "channel", "overhead", "latency_bits"]
+               + [f.name for f in fields(CellStats)]
+               + ["detection_rate", "correction_rate", "undetected_rate", "residual_frame_error_rate",
+                  "goodput", "decode_us"])
+
+
+def result_row(cell: Cell, stats: CellStats) -> dict:
+    codec = CODECS[cell.codec]
+    row = {"algorithm": cell.codec, "dataSize": cell.size, "channel": str(cell.channel),
+           "overhead": round(codec.overhead(cell.size) / cell.size, 6),
+           "latency_bits": codec.latency(cell.size)}
+    row.update((f.name, getattr(stats, f.name)) for f in fields(stats))
+    row.update((name, round(value, 8)) for name, value in stats.rates().items())
+    return row
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Simulación Monte-Carlo de detección/corrección por canal")
+    parser.add_argument("--codecs", nargs="+", default=list(CODECS), choices=list(CODECS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="Bits de datos por trama")
+    parser.add_argument("--channels", nargs="+", default=DEFAULT_CHANNELS,
+                        help=f"Canales tipo:parámetros ({', '.join(CHANNELS)}), "
+                             "p. ej. bsc:0.01 burst:8 gilbert:0.01,0.2,0.5")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="Tramas por combinación")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_CHUNK, help="Tramas por bloque/tarea")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Procesos en paralelo (1 = en serie, 0 = todos los núcleos)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="CSV con una fila por combinación (se escribe a medida que terminan)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    try:
+        channels = [Channel.parse(spec) for spec in args.channels]
+    except ValueError as e:
+        raise SystemExit(str(e))
+    if args.trials <= 0 or args.chunk <= 0 or any(size <= 0 for size in args.sizes):
+        raise SystemExit("--trials, --chunk y --sizes deben ser positivos")
+    workers = args.workers or os.cpu_count() or 1
+    cells = [Cell(codec, size, channel)
+             for codec in args.codecs for size in args.sizes for channel in channels]
+
+    print(f"🎲 {len(cells)} combinaciones x {args.trials:,} tramas, {workers} proceso(s)")
+    print(f"{'algoritmo':>19} {'bits':>5} {'canal':>20} {'dañadas':>9} {'detección':>10} "
+          f"{'corrección':>11} {'no detect.':>11} {'goodput':>8} {'latencia':>9}")
+
+    output = None
+    writer = None
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        output = open(args.output, "w", newline="")
+        writer = csv.DictWriter(output, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+
+    start = time.perf_counter()
+    try:
+        for cell, stats in run_grid(cells, args.trials, args.chunk, workers, args.seed):
+            rates = stats.rates()
+            print(f"{cell.codec:>19} {cell.size:>5} {str(cell.channel):>20} {stats.damaged:>9} "
+                  f"{rates['detection_rate']:>10.4%} {rates['correction_rate']:>11.4%} "
+                  f"{rates['undetected_rate']:>11.4%} {rates['goodput']:>8.4f} "
+                  f"{CODECS[cell.codec].latency(cell.size):>9}", flush=True)
+            if writer:
+                writer.writerow(result_row(cell, stats))
+                output.flush()
+    except KeyboardInterrupt:
+        print("\n❌ Simulación interrumpida por el usuario")
+    finally:
+        if output:
+            output.close()
+
+    wall = time.perf_counter() - start
+    total = len(cells) * args.trials
+    print(f"\n⚡ {total:,} tramas en {wall:.2f} s ({total / wall:,.0f} tramas/s)")
+    if args.output:
+        print(f"💾 Resultados en: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
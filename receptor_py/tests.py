@@ -1,31 +1,86 @@
+import numpy as np
 import pandas as pd
+import argparse
 import os
 import sys
 import time
-from typing import Tuple, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple, Optional
 
 # Agregar la ruta del receptor para importar los módulos
 
 try:
-    from hamming.hamming import hamming
-    from fletcher16.fletcher16 import fletcher16_receive
+    from codec.registry import CODECS, Codec
 except ImportError as e:
     print(f" Error importando módulos del receptor: {e}")
     print("   Asegúrate de que los módulos estén en ../receptor_py/")
     sys.exit(1)
 
+# Columnas que se leen como texto: pandas interpretaría los bits como
+# enteros (perdiendo los ceros a la izquierda) y podría inferir tipos
+# distintos en cada bloque del CSV
+TEXT_COLUMNS = {'originalText': str, 'originalBits': str, 'encodedBits': str,
+                'noisyBits': str, 'errorPositions': str}
+
+# Columnas del emisor que se copian al CSV de resultados
+EMISOR_COLUMNS = ['testId', 'algorithm', 'dataSize', 'errorProbability', 'originalText',
+                  'originalBits', 'encodedBits', 'noisyBits', 'errorsIntroduced',
+                  'errorPositions', 'overhead']
+
+# Filas por bloque al leer/escribir: la memoria usada no depende del tamaño del CSV
+DEFAULT_CHUNK_SIZE = 1000
+
+class RunningSummary:
+    """
+    Estadísticas acumuladas por algoritmo y por probabilidad de error.
+    Se actualiza bloque a bloque, así el resumen final no necesita tener
+    todos los resultados en memoria.
+    """
+    
+    FIELDS = ('tests', 'correctDetection', 'corrected', 'processingTime', 'overhead')
+    
+    def __init__(self):
+        self.by_algorithm: Dict[str, Dict[str, float]] = {}
+        # (algoritmo, probabilidad) -> [pruebas, detecciones correctas]
+        self.by_probability: Dict[Tuple[str, float], List[float]] = {}
+    
+    def update(self, results: pd.DataFrame):
+        # sort=False conserva el orden de aparición de los algoritmos
+        for algorithm, group in results.groupby('algorithm', sort=False):
+            stats = self.by_algorithm.setdefault(algorithm, dict.fromkeys(self.FIELDS, 0))
+            stats['tests'] += len(group)
+            stats['correctDetection'] += int(group['correctDetection'].sum())
+            stats['corrected'] += int(group['corrected'].sum())
+            stats['processingTime'] += float(group['processingTime'].sum())
+            stats['overhead'] += float(group['overhead'].sum())
+        
+        for key, group in results.groupby(['algorithm', 'errorProbability'], sort=False):
+            prob = self.by_probability.setdefault(key, [0, 0])
+            prob[0] += len(group)
+            prob[1] += int(group['correctDetection'].sum())
+    
+    @property
+    def total(self) -> int:
+        return sum(stats['tests'] for stats in self.by_algorithm.values())
+    
+    def mean(self, algorithm: str, field: str) -> float:
+        stats = self.by_algorithm[algorithm]
+        return stats[field] / stats['tests']
+
 class ReceptorProcessor:
-    def __init__(self, input_csv: str, output_csv: str):
+    def __init__(self, input_csv: str, output_csv: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 workers: int = 1):
         self.input_csv = input_csv
         self.output_csv = output_csv
-        self.results = []
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.summary = RunningSummary()
         
-    def load_emisor_data(self) -> pd.DataFrame:
-        """Carga los datos generados por el emisor"""
+    def iter_emisor_chunks(self) -> Iterator[pd.DataFrame]:
+        """Lee los datos generados por el emisor en bloques de `chunk_size` filas"""
         try:
-            df = pd.read_csv(self.input_csv)
-            print(f" Datos del emisor cargados: {len(df)} registros")
-            return df
+            reader = pd.read_csv(self.input_csv, dtype=TEXT_COLUMNS, chunksize=self.chunk_size)
         except FileNotFoundError:
             print(f"❌ No se encontró el archivo: {self.input_csv}")
             print("   Primero ejecuta: tsx test_generator.ts")
@@ -33,208 +88,195 @@ class ReceptorProcessor:
         except Exception as e:
             print(f"❌ Error cargando CSV: {e}")
             sys.exit(1)
+        with reader:
+            yield from reader
     
-    def process_hamming(self, noisy_bits: str) -> Tuple[bool, bool, str, str]:
+    def decode_column(self, codec: Codec, noisy_bits: pd.Series) -> Dict[str, list]:
         """
-        Procesa con algoritmo Hamming
-        Returns: (detected, corrected, status, message)
+        Decodifica todas las tramas del bloque con el decode_batch del códec.
+        Returns: columnas detected, corrected, status, message
         """
-        try:
-            # Intentar decodificar con Hamming
-            decoded_bits = hamming(noisy_bits)
-            
-            # Si llega aquí, Hamming pudo corregir o no había errores
-            return False, True, "ok", "Hamming: Decodificación exitosa"
-            
-        except Exception as e:
-            # Hamming detectó un error que no puede corregir
-            error_msg = str(e)
-            return True, False, "error", f"Hamming: {error_msg}"
+        errors = codec.decode_batch(noisy_bits.tolist()).errors
+        # Trama aceptada: si el códec corrige, pudo corregir o no había errores
+        accepted = (False, codec.corrects, "ok", f"{codec.label}: {codec.ok_message}")
+        columns = {'detected': [], 'corrected': [], 'status': [], 'message': []}
+        for error in errors:
+            row = (True, False, "error", f"{codec.label}: {error}") if error else accepted
+            for column, value in zip(columns, row):
+                columns[column].append(value)
+        return columns
     
-    def process_fletcher16(self, noisy_bits: str) -> Tuple[bool, bool, str, str]:
+    def process_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Procesa con algoritmo Fletcher-16
-        Returns: (detected, corrected, status, message)
+        Procesa un bloque de pruebas: un decode_batch por algoritmo y el
+        resto son operaciones sobre columnas. Las tramas inválidas salen
+        como filas con status=error; solo falla el bloque entero.
         """
-        try:
-            # Intentar verificar con Fletcher-16
-            decoded_bits = fletcher16_receive(noisy_bits)
-            
-            # Si llega aquí, Fletcher-16 no detectó errores
-            return False, False, "ok", "Fletcher-16: Verificación exitosa"
-            
-        except Exception as e:
-            # Fletcher-16 detectó un error
-            error_msg = str(e)
-            return True, False, "error", f"Fletcher-16: {error_msg}"
-    
-    def process_single_test(self, row: pd.Series) -> dict:
-        """Procesa una sola prueba con el receptor correspondiente"""
-        
-        test_id = row['testId']
-        algorithm = row['algorithm']
-        noisy_bits = row['noisyBits']
-        errors_introduced = row['errorsIntroduced']
+        results = df[EMISOR_COLUMNS].copy()
+        algorithms = df['algorithm'].to_numpy()
+        noisy_bits = df['noisyBits'].fillna('')
+        size = len(df)
+        detected = np.zeros(size, dtype=bool)
+        corrected = np.zeros(size, dtype=bool)
+        status = np.full(size, "error", dtype=object)
+        message = np.array([f"Algoritmo desconocido: {a}" for a in algorithms], dtype=object)
+        processing_time = np.zeros(size)
         
-        start_time = time.time()
+        for algorithm, codec in CODECS.items():
+            rows = np.nonzero(algorithms == algorithm)[0]
+            if not len(rows):
+                continue
+            start_time = time.perf_counter()
+            columns = self.decode_column(codec, noisy_bits.iloc[rows])
+            # Tiempo del lote repartido entre sus tramas, en milisegundos
+            processing_time[rows] = (time.perf_counter() - start_time) * 1000 / len(rows)
+            detected[rows] = columns['detected']
+            corrected[rows] = columns['corrected']
+            status[rows] = columns['status']
+            message[rows] = columns['message']
         
-        # Procesar según el algoritmo
-        if algorithm == 'hamming':
-            detected, corrected, status, message = self.process_hamming(noisy_bits)
-        elif algorithm == 'fletcher16':
-            detected, corrected, status, message = self.process_fletcher16(noisy_bits)
-        else:
-            detected, corrected, status, message = False, False, "error", f"Algoritmo desconocido: {algorithm}"
-        
-        processing_time = (time.time() - start_time) * 1000  # En milisegundos
-        
-        # Determinar si la detección fue correcta
-        if errors_introduced > 0:
-            # Había errores: debería haber sido detectado
-            correct_detection = detected
-        else:
-            # No había errores: no debería haber sido detectado
-            correct_detection = not detected
-        
-        # Determinar si la corrección fue correcta (solo para Hamming)
-        if algorithm == 'hamming' and errors_introduced > 0:
-            # Si había errores y Hamming dice que corrigió, verificamos
-            correct_correction = corrected
-        else:
-            correct_correction = False  # Fletcher no corrige
+        # Con errores introducidos debería detectarse; sin errores, no
+        had_errors = df['errorsIntroduced'].to_numpy() > 0
+        results['detected'] = detected
+        results['corrected'] = corrected
+        results['correctDetection'] = np.where(had_errors, detected, ~detected)
+        # Solo cuentan los códecs que corrigen (Hamming)
+        correcting = [name for name, codec in CODECS.items() if codec.corrects]
+        results['correctCorrection'] = np.isin(algorithms, correcting) & had_errors & corrected
+        results['processingTime'] = processing_time.round(3)
+        results['status'] = status
+        results['message'] = message
+        results['timestamp'] = int(time.time())
+        return results
+    
+    def iter_processed_chunks(self) -> Iterator[Tuple[pd.DataFrame, int, int, float]]:
+        """
+        Procesa los bloques en serie o repartidos en `workers` procesos.
+        Entrega (resultados, pruebas no procesadas, pid, segundos) en el
+        orden del CSV de entrada, así la salida es idéntica a la corrida en
+        serie.
+        """
+        if self.workers <= 1:
+            for chunk in self.iter_emisor_chunks():
+                yield _process_chunk_worker(chunk)
+            return
         
-        return {
-            'testId': test_id,
-            'algorithm': algorithm,
-            'dataSize': row['dataSize'],
-            'errorProbability': row['errorProbability'],
-            'originalText': row['originalText'],
-            'originalBits': row['originalBits'],
-            'encodedBits': row['encodedBits'],
-            'noisyBits': noisy_bits,
-            'errorsIntroduced': errors_introduced,
-            'errorPositions': row['errorPositions'],
-            'overhead': row['overhead'],
-            # Resultados del receptor
-            'detected': detected,
-            'corrected': corrected,
-            'correctDetection': correct_detection,
-            'correctCorrection': correct_correction,
-            'processingTime': round(processing_time, 3),
-            'status': status,
-            'message': message,
-            'timestamp': int(time.time())
-        }
+        # Como mucho 2 bloques en vuelo por worker: memoria acotada
+        max_pending = self.workers * 2
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for chunk in self.iter_emisor_chunks():
+                pending.append(pool.submit(_process_chunk_worker, chunk))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
     
     def process_all_tests(self):
-        """Procesa todas las pruebas del CSV del emisor"""
+        """Procesa todas las pruebas del CSV del emisor en streaming"""
         
         print("🔄 Iniciando procesamiento con algoritmos del receptor")
         print("=" * 60)
+        print(f"📦 Bloques de {self.chunk_size} pruebas, {self.workers} proceso(s)")
+        print()
         
-        # Cargar datos del emisor
-        df = self.load_emisor_data()
-        
-        total_tests = len(df)
+        self._prepare_output()
         processed = 0
         errors = 0
+        # pid -> [pruebas, segundos de cómputo]
+        per_worker: Dict[int, List[float]] = {}
+        start = time.perf_counter()
         
-        print(f"📈 Total de pruebas a procesar: {total_tests}")
-        print()
+        for results, chunk_errors, pid, elapsed in self.iter_processed_chunks():
+            self.append_results(results, first=processed == 0)
+            self.summary.update(results)
+            processed += len(results)
+            errors += chunk_errors
+            worker = per_worker.setdefault(pid, [0, 0.0])
+            worker[0] += len(results)
+            worker[1] += elapsed
+            print(f"   ✅ Procesadas: {processed}")
         
-        # Procesar cada prueba
-        for index, row in df.iterrows():
-            try:
-                result = self.process_single_test(row)
-                self.results.append(result)
-                processed += 1
-                
-                # Mostrar progreso cada 100 pruebas
-                if processed % 100 == 0:
-                    print(f"   ✅ Procesadas: {processed}/{total_tests} ({(processed/total_tests)*100:.1f}%)")
-                
-            except Exception as e:
-                errors += 1
-                print(f"   ❌ Error en prueba {row['testId']}: {e}")
+        wall = time.perf_counter() - start
         
         print(f"\n📊 Procesamiento completado:")
         print(f"   ✅ Exitosas: {processed}")
         print(f"   ❌ Errores: {errors}")
+        self.report_throughput(processed, wall, per_worker)
         
-        # Guardar resultados
-        self.save_results()
-    
-    def save_results(self):
-        """Guarda los resultados en CSV"""
-        
-        if not self.results:
+        if not processed:
             print("❌ No hay resultados para guardar")
             return
         
-        # Crear directorio si no existe
-        output_dir = os.path.dirname(self.output_csv)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
-        
-        # Convertir a DataFrame y guardar
-        results_df = pd.DataFrame(self.results)
-        results_df.to_csv(self.output_csv, index=False)
-        
         print(f"\n💾 Resultados guardados en: {self.output_csv}")
-        print(f"📊 Total de registros: {len(self.results)}")
+        print(f"📊 Total de registros: {processed}")
         
         # Generar resumen
-        self.generate_summary(results_df)
+        self.generate_summary()
+    
+    def report_throughput(self, processed: int, wall: float, per_worker: Dict[int, List[float]]):
+        """Muestra el throughput total (incluye lectura/escritura) y el de cada worker"""
+        if wall > 0:
+            print(f"   ⚡ Throughput total: {processed / wall:,.0f} pruebas/s ({wall:.2f} s)")
+        for pid, (tests, busy) in sorted(per_worker.items()):
+            rate = tests / busy if busy > 0 else float('inf')
+            print(f"      worker {pid}: {tests} pruebas, {rate:,.0f} pruebas/s")
+    
+    def _prepare_output(self):
+        """Crea el directorio de salida y descarta resultados de corridas anteriores"""
+        output_dir = os.path.dirname(self.output_csv)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+        if os.path.exists(self.output_csv):
+            os.remove(self.output_csv)
     
-    def generate_summary(self, df: pd.DataFrame):
-        """Genera resumen estadístico de los resultados"""
+    def append_results(self, results: pd.DataFrame, first: bool):
+        """Agrega un bloque de resultados al CSV (con encabezado solo en el primero)"""
+        if results.empty:
+            return
+        results.to_csv(self.output_csv, mode='w' if first else 'a', header=first, index=False)
+    
+    def generate_summary(self):
+        """Genera resumen estadístico a partir del resumen acumulado"""
+        
+        summary = self.summary
         
         print("\n📈 RESUMEN DE RESULTADOS DEL RECEPTOR:")
         print("=" * 50)
         
-        for algorithm in df['algorithm'].unique():
-            algo_data = df[df['algorithm'] == algorithm]
+        for algorithm, stats in summary.by_algorithm.items():
             
             # Estadísticas de detección
-            total_tests = len(algo_data)
-            correct_detections = algo_data['correctDetection'].sum()
+            total_tests = stats['tests']
+            correct_detections = stats['correctDetection']
             detection_rate = (correct_detections / total_tests) * 100
             
-            # Estadísticas de corrección (solo para Hamming)
-            if algorithm == 'hamming':
-                corrections = algo_data['corrected'].sum()
-                correction_rate = (corrections / total_tests) * 100
+            # Estadísticas de corrección (solo para los códecs que corrigen)
+            codec = CODECS.get(algorithm)
+            if codec is not None and codec.corrects:
+                correction_rate = summary.mean(algorithm, 'corrected') * 100
             else:
                 correction_rate = 0
             
-            # Tiempo promedio
-            avg_time = algo_data['processingTime'].mean()
-            
-            # Errores por probabilidad
-            error_stats = algo_data.groupby('errorProbability').agg({
-                'correctDetection': 'mean',
-                'errorsIntroduced': 'sum'
-            }).round(3)
-            
             print(f"\n🔍 {algorithm.upper()}:")
             print(f"   Total de pruebas: {total_tests}")
             print(f"   Detección correcta: {detection_rate:.1f}% ({correct_detections}/{total_tests})")
             print(f"   Tasa de corrección: {correction_rate:.1f}%")
-            print(f"   Tiempo promedio: {avg_time:.2f} ms")
-            print(f"   Overhead promedio: {algo_data['overhead'].mean()*100:.2f}%")
+            print(f"   Tiempo promedio: {summary.mean(algorithm, 'processingTime'):.2f} ms")
+            print(f"   Overhead promedio: {summary.mean(algorithm, 'overhead')*100:.2f}%")
             
             print(f"\n   📊 Por probabilidad de error:")
-            for error_prob, stats in error_stats.iterrows():
-                print(f"      {error_prob*100:4.1f}%: {stats['correctDetection']*100:5.1f}% detección correcta")
+            for (algo, error_prob), (tests, detections) in sorted(summary.by_probability.items()):
+                if algo == algorithm:
+                    print(f"      {error_prob*100:4.1f}%: {detections / tests * 100:5.1f}% detección correcta")
         
         # Comparación general
         print(f"\n🏆 COMPARACIÓN GENERAL:")
-        comparison = df.groupby('algorithm').agg({
-            'correctDetection': 'mean',
-            'corrected': 'mean',
-            'processingTime': 'mean',
-            'overhead': 'mean'
-        }).round(4)
+        comparison = pd.DataFrame({
+            field: {algorithm: summary.mean(algorithm, field) for algorithm in summary.by_algorithm}
+            for field in ('correctDetection', 'corrected', 'processingTime', 'overhead')
+        }).sort_index().round(4)
+        comparison.index.name = 'algorithm'
         
         print(comparison)
         
@@ -247,16 +289,45 @@ class ReceptorProcessor:
         print(f"⚡ Más rápido: {fastest}")
         print(f"📦 Menor overhead: {lowest_overhead}")
 
+def _process_chunk_worker(chunk: pd.DataFrame) -> Tuple[pd.DataFrame, int, int, float]:
+    """
+    Procesa un bloque en el proceso actual (función de módulo para poder
+    enviarla a un ProcessPoolExecutor).
+    Returns: (resultados, pruebas no procesadas, pid, segundos)
+    """
+    start = time.perf_counter()
+    errors = 0
+    try:
+        results = ReceptorProcessor(None, None).process_chunk(chunk)
+    except Exception as e:
+        first, last = chunk['testId'].iloc[0], chunk['testId'].iloc[-1]
+        print(f"   ❌ Error en pruebas {first}-{last}: {e}")
+        results, errors = chunk.iloc[0:0][EMISOR_COLUMNS], len(chunk)
+    return results, errors, os.getpid(), time.perf_counter() - start
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Procesa emisor_data.csv con los algoritmos del receptor")
+    parser.add_argument("--input", default="tests/emisor_data.csv", help="CSV generado por el emisor")
+    parser.add_argument("--output", default="results/receptor_results.csv", help="CSV de resultados")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Procesos en paralelo (1 = en serie, 0 = todos los núcleos)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Pruebas por bloque de lectura/proceso")
+    return parser.parse_args(argv)
+
 def main():
     """Función principal"""
     
+    args = parse_args()
+    
     # Rutas de archivos
-    input_file = "tests/emisor_data.csv"
-    output_file = "results/receptor_results.csv"
+    input_file = args.input
+    output_file = args.output
+    workers = args.workers or os.cpu_count() or 1
     
     try:
         # Crear procesador y ejecutar
-        processor = ReceptorProcessor(input_file, output_file)
+        processor = ReceptorProcessor(input_file, output_file, args.chunk_size, workers)
         processor.process_all_tests()
         
         print("\n🎉 ¡Procesamiento del receptor completado exitosamente!")
@@ -274,4 +345,4 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,109 @@
+# Formato binario de tramas para mensajes WebSocket binarios.
+#
+# Cada registro es una cabecera de 8 bytes (big-endian) seguida de los bits
+# empaquetados MSB primero, rellenando con ceros el último byte:
+#
+#   offset  tamaño  campo
+#   0       1       magic (0xD1)
+#   1       1       versión (1)
+#   2       1       id de algoritmo (ALGORITHM_IDS)
+#   3       1       flags (FLAG_HAS_ID: sigue un id uint32)
+#   4       4       largo de la trama en bits
+#   [8      4       id de la trama, solo con FLAG_HAS_ID]
+#   ...     ceil(bits/8)  payload
+#
+# Un mensaje puede traer varios registros seguidos (lote). El JSON con
+# '0'/'1' sigue disponible como alternativa en los mensajes de texto.
+
+import struct
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from bitframe.bitframe import BitFrame, BytesLike, as_bitframe
+
+MAGIC = 0xD1
+VERSION = 1
+FLAG_HAS_ID = 0x01
+
+# Ids fijos del protocolo (emisor_ts/src/utils/wire.ts usa los mismos);
+# cada códec de codec/registry.py toma el suyo de aquí
+ALGORITHM_IDS = {
+    "hamming": 1,
+    "fletcher16": 2,
+    "crc32": 3,
+    "crc16": 4,
+    "hamming_blocked": 5,
+    "hamming_interleaved": 6,
+}
+ALGORITHM_NAMES = {v: k for k, v in ALGORITHM_IDS.items()}
+
+_HEADER = struct.Struct(">BBBBI")
+_ID = struct.Struct(">I")
+
+
+class WireFrame(NamedTuple):
+    algorithm: str
+    bits: BitFrame
+    frame_id: Optional[int] = None
+
+
+def pack_frame(algorithm: str, bits: Union[str, BitFrame], frame_id: Optional[int] = None) -> bytes:
+    """Empaqueta una trama en un registro binario."""
+    if algorithm not in ALGORITHM_IDS:
+        raise ValueError(f"Algoritmo no soportado: {algorithm}")
+    frame = as_bitframe(bits)
+    flags = FLAG_HAS_ID if frame_id is not None else 0
+    header = _HEADER.pack(MAGIC, VERSION, ALGORITHM_IDS[algorithm], flags, len(frame))
+    if frame_id is not None:
+        header += _ID.pack(frame_id)
+    return header + frame.to_bytes()
+
+
+def pack_frames(frames: Iterable[WireFrame]) -> bytes:
+    """Empaqueta varias tramas en un solo mensaje (lote)."""
+    return b"".join(pack_frame(f.algorithm, f.bits, f.frame_id) for f in frames)
+
+
+def unpack_frames(data: BytesLike) -> List[WireFrame]:
+    """
+    Lee todos los registros de un mensaje binario. Los bits pasan directo
+    de bytes a BitFrame, sin construir cadenas intermedias.
+
+    Raises:
+        ValueError: Si la cabecera o los largos no son válidos
+    """
+    return list(iter_frames(data))
+
+
+def iter_frames(data: BytesLike) -> Iterator[WireFrame]:
+    """
+    Igual que unpack_frames pero entrega los registros de a uno, para
+    recorrer volcados grandes (p. ej. un mmap) sin armar la lista completa.
+
+    Raises:
+        ValueError: Al llegar a un registro inválido
+    """
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        if len(view) - offset < _HEADER.size:
+            raise ValueError("Cabecera binaria incompleta")
+        magic, version, algo_id, flags, nbits = _HEADER.unpack_from(view, offset)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Cabecera binaria inválida (magic={magic:#x}, versión={version})")
+        offset += _HEADER.size
+
+        frame_id = None
+        if flags & FLAG_HAS_ID:
+            if len(view) - offset < _ID.size:
+                raise ValueError("Id de trama incompleto")
+            (frame_id,) = _ID.unpack_from(view, offset)
+            offset += _ID.size
+
+        nbytes = (nbits + 7) >> 3
+        if len(view) - offset < nbytes:
+            raise ValueError(f"Payload incompleto: se esperaban {nbytes} bytes")
+        bits = BitFrame.from_bytes(view[offset:offset + nbytes], nbits)
+        offset += nbytes
+
+        algorithm = ALGORITHM_NAMES.get(algo_id, f"desconocido({algo_id})")
+        yield WireFrame(algorithm, bits, frame_id)
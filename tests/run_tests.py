@@ -1,52 +1,25 @@
-import asyncio
 import subprocess
-import time
 import os
 import sys
 
-async def main():
+RECEPTOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "receptor_py")
+
+def main():
     print(" INICIANDO PRUEBAS AUTOMATIZADAS")
     print("=" * 40)
-    
-    # Verificar estructura
-    if not os.path.exists("config/test_config.yaml"):
-        print("❌ Error: Falta archivo de configuración")
-        return
-    
-    # Instalar dependencias
-    print(" Instalando dependencias...")
-    
-    # Crear directorios
-    os.makedirs("results/raw_data", exist_ok=True)
-    os.makedirs("results/graphs", exist_ok=True)
-    os.makedirs("results/reports", exist_ok=True)
-    
-    # Iniciar receptor
-    print(" Iniciando receptor...")
-    receptor_process = subprocess.Popen([
-        sys.executable, "../receptor_py/app.py"
-    ])
-    
-    # Esperar que inicie
-    print(" Esperando receptor...")
-    time.sleep(5)
-    
-    try:
-        # Ejecutar pruebas
-        print(" Ejecutando pruebas...")
-        subprocess.run([sys.executable, "automation/test_runner.py"])
-        
-        # Generar análisis
-        print(" Generando análisis...")
-        subprocess.run([sys.executable, "automation/statistics_analyzer.py"])
-        
-        print("\n✅ PRUEBAS COMPLETADAS")
-        print(" Resultados en tests/results/")
-        
-    finally:
-        # Terminar receptor
-        print(" Cerrando receptor...")
-        receptor_process.terminate()
+
+    # Procesar el CSV del emisor (detección/corrección por trama)
+    print(" Procesando emisor_data.csv...")
+    subprocess.run([sys.executable, "tests.py"], cwd=RECEPTOR_DIR, check=True)
+
+    # Prueba de carga: levanta el receptor, espera a que acepte conexiones
+    # y reenvía las tramas del CSV con varias conexiones concurrentes.
+    # Argumentos extra se pasan al generador (p. ej. --connections 32 --rate 5000)
+    print(" Ejecutando prueba de carga contra el receptor...")
+    subprocess.run([sys.executable, "benchmarks/ws_load.py", "--spawn", *sys.argv[1:]],
+                   cwd=RECEPTOR_DIR, check=True)
+
+    print("\n✅ PRUEBAS COMPLETADAS")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()